@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import gzip
+import zlib
+
+from flask import Response, request
+
+from api.utils.etag import etag_codificado
+from api.utils.metrics import Metrics
+
+try:
+    import brotli
+except ImportError:   # sem brotli: só gzip
+    brotli = None
+
+
+class _Compressor:
+    """Interface única para comprimir em partes (streaming) com gzip ou brotli."""
+
+    def __init__(self, codificacao: str, nivel_gzip: int, qualidade_br: int):
+        self.__brotli = codificacao == "br"
+        if self.__brotli:
+            self.__compressor = brotli.Compressor(quality=qualidade_br)
+        else:
+            self.__compressor = zlib.compressobj(nivel_gzip, zlib.DEFLATED, 31)   # 31 = cabeçalho gzip
+
+    def parte(self, dados: bytes) -> bytes:
+        # flush a cada parte: o cliente recebe cada pedaço assim que é gerado
+        if self.__brotli:
+            return self.__compressor.process(dados) + self.__compressor.flush()
+        return self.__compressor.compress(dados) + self.__compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def fim(self) -> bytes:
+        if self.__brotli:
+            return self.__compressor.finish()
+        return self.__compressor.flush()
+
+
+class CompressaoMiddleware:
+    """
+    Compressão de respostas (gzip/brotli) negociada por Accept-Encoding.
+
+    - after_request: comprime respostas de tipos textuais acima de
+      `tamanho_minimo` bytes; respostas em streaming (generators) são
+      comprimidas parte a parte, sem juntar o corpo em memória
+    - precomprimir() gera as versões gzip/brotli no nível máximo, para
+      conteúdo comprimido uma vez e servido muitas (AssetPipeline)
+    - Respostas comprimidas recebem "Vary: Accept-Encoding" e ETag com o sufixo
+      da codificação
+
+    Uso:
+    >>> compressao = CompressaoMiddleware(tamanho_minimo=1024)
+    >>> compressao.registrar(app)
+    """
+
+    TIPOS_COMPRIMIVEIS = (
+        "application/json", "application/javascript", "text/javascript",
+        "text/html", "text/css", "text/plain", "image/svg+xml",
+    )
+
+    def __init__(self, tamanho_minimo: int = 1024, nivel_gzip: int = 6, qualidade_br: int = 4):
+        self.__tamanho_minimo = tamanho_minimo
+        self.__nivel_gzip = nivel_gzip
+        self.__qualidade_br = qualidade_br
+        self.__bytes = Metrics.counter("http_compression_bytes_total", "Bytes antes e depois da compressão", ("codificacao", "fase"))
+
+    def registrar(self, app):
+        """Liga a compressão no app. Registre antes dos demais after_request para rodar por último."""
+        app.after_request(self.__comprimir_resposta)
+
+    def precomprimir(self, dados: bytes) -> dict:
+        """Versões {"gzip": ..., "br": ...} de `dados` no nível máximo ({} se abaixo do tamanho mínimo)."""
+        if len(dados) < self.__tamanho_minimo:
+            return {}
+        versoes = {"gzip": CompressaoMiddleware.__comprimir(dados, "gzip", 9, 11)}
+        if brotli is not None:
+            versoes["br"] = CompressaoMiddleware.__comprimir(dados, "br", 9, 11)
+        return versoes
+
+    # ---------------- Negociação ----------------
+
+    def escolher_codificacao(self) -> str | None:
+        """Codificação preferida pelo cliente entre as disponíveis (br > gzip), ou None."""
+        aceitas = request.accept_encodings
+        if brotli is not None and aceitas.quality("br") > 0:
+            return "br"
+        if aceitas.quality("gzip") > 0:
+            return "gzip"
+        return None
+
+    def __comprimivel(self, mimetype: str | None) -> bool:
+        return bool(mimetype) and mimetype in CompressaoMiddleware.TIPOS_COMPRIMIVEIS
+
+    # ---------------- Respostas dinâmicas ----------------
+
+    def __comprimir_resposta(self, response: Response) -> Response:
+        if response.status_code < 200 or response.status_code in (204, 206, 304) \
+                or "Content-Encoding" in response.headers \
+                or response.direct_passthrough \
+                or not self.__comprimivel(response.mimetype):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        codificacao = self.escolher_codificacao()
+        if codificacao is None:
+            return response
+
+        if response.is_streamed:
+            response.response = self.__comprimir_fluxo(response.response, codificacao)
+            response.headers.pop("Content-Length", None)
+        else:
+            dados = response.get_data()
+            if len(dados) < self.__tamanho_minimo:
+                return response
+            comprimido = self.__comprimir(dados, codificacao, self.__nivel_gzip, self.__qualidade_br)
+            self.__bytes.inc(len(dados), codificacao=codificacao, fase="original")
+            self.__bytes.inc(len(comprimido), codificacao=codificacao, fase="comprimido")
+            response.set_data(comprimido)
+
+        response.headers["Content-Encoding"] = codificacao
+        etag, fraco = response.get_etag()
+        if etag:
+            response.set_etag(etag_codificado(etag, codificacao), weak=fraco)
+        return response
+
+    def __comprimir_fluxo(self, iteravel, codificacao: str):
+        compressor = _Compressor(codificacao, self.__nivel_gzip, self.__qualidade_br)
+        try:
+            for parte in iteravel:
+                if isinstance(parte, str):
+                    parte = parte.encode("utf-8")
+                dados = compressor.parte(parte)
+                if dados:
+                    yield dados
+            yield compressor.fim()
+        finally:
+            if hasattr(iteravel, "close"):
+                iteravel.close()
+
+    @staticmethod
+    def __comprimir(dados: bytes, codificacao: str, nivel_gzip: int, qualidade_br: int) -> bytes:
+        if codificacao == "br":
+            return brotli.compress(dados, quality=qualidade_br)
+        return gzip.compress(dados, compresslevel=nivel_gzip, mtime=0)
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 from functools import wraps
-from flask import request
+from flask import g, request
 from api.utils.errorResponse import ErrorResponse
+from api.utils.esquema import Campo, Esquema
 
 class HospedeMiddleware:
     """
@@ -13,32 +14,28 @@ class HospedeMiddleware:
     - Lançar erros padronizados usando ErrorResponse quando a validação falhar.
     """
 
+    ESQUEMA = Esquema("Hospede", {
+        "nomeHospede": Campo.texto(minimo=3),
+        "email": Campo.email(),
+        "telefone": Campo.telefone(),
+        "cpf": Campo.cpf(),
+        "requisicao": Campo.livre().opcional(),
+    }, titulo="Erro na validação de dados do Hospede")
+
     def validate_body(self, f):
         """
         Decorator para validar o corpo da requisição (JSON) para operações de Hospede.
 
-        Verifica apenas a existência:
+        Valida pelo ESQUEMA (compilado uma vez):
         - O objeto 'Hospede' existe
-        - O campo obrigatório 'nomeHospede' está presente
+        - nomeHospede, email, telefone e cpf válidos; requisicao opcional
+
+        O corpo validado fica em g.corpo (corpo_validado()).
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
             print("🔷 HospedeMiddleware.validate_body()")
-            body = request.get_json()
-
-            if not body or 'Hospede' not in body:
-                raise ErrorResponse(
-                    400, "Erro na validação de dados",
-                    {"message": "O campo 'Hospede' é obrigatório!"}
-                )
-
-            Hospede = body['Hospede']
-            if 'nomeHospede' not in Hospede:
-                raise ErrorResponse(
-                    400, "Erro na validação de dados",
-                    {"message": "O campo 'nomeHospede' é obrigatório!"}
-                )
-
+            g.corpo = HospedeMiddleware.ESQUEMA.validar(request.get_json())
             return f(*args, **kwargs)
         return decorated_function
 
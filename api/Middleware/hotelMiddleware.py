@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 from functools import wraps
-from flask import request
+from flask import g, request
 from api.utils.errorResponse import ErrorResponse
+from api.utils.esquema import Campo, Esquema
 
 class HotelMiddleware:
     """
@@ -13,32 +14,25 @@ class HotelMiddleware:
     - Lançar erros padronizados usando ErrorResponse quando a validação falhar.
     """
 
+    ESQUEMA = Esquema("Hotel", {
+        "nome": Campo.texto(minimo=3),
+        "capacidade": Campo.inteiro(positivo=True),
+    }, titulo="Erro na validação de dados do Hotel")
+
     def validate_body(self, f):
         """
         Decorator para validar o corpo da requisição (JSON) para operações de Hotel.
 
-        Verifica apenas a existência:
+        Valida pelo ESQUEMA (compilado uma vez):
         - O objeto 'Hotel' existe
-        - O campo obrigatório 'nomeHotel' está presente
+        - nome com pelo menos 3 caracteres e capacidade inteira positiva
+
+        O corpo validado fica em g.corpo (corpo_validado()).
         """
         @wraps(f)
         def decorated_function(*args, **kwargs):
             print("🔷 HotelMiddleware.validate_body()")
-            body = request.get_json()
-
-            if not body or 'Hotel' not in body:
-                raise ErrorResponse(
-                    400, "Erro na validação de dados",
-                    {"message": "O campo 'Hotel' é obrigatório!"}
-                )
-
-            Hotel = body['Hotel']
-            if 'nome' not in Hotel:
-                raise ErrorResponse(
-                    400, "Erro na validação de dados",
-                    {"message": "O campo 'nome' é obrigatório!"}
-                )
-
+            g.corpo = HotelMiddleware.ESQUEMA.validar(request.get_json())
             return f(*args, **kwargs)
         return decorated_function
 
@@ -2,29 +2,118 @@
 from flask import request, jsonify, g
 from functools import wraps
 from api.http.meu_token_jwt import MeuTokenJWT
+from api.http.tokenCache import TokenCache
+from api.http.listaRevogacao import ListaRevogacao
+from api.utils.tracing import Tracer
 
 class JwtMiddleware:
     """Middleware Flask para validação de tokens JWT"""
 
+    # 🔹 Um bit por role (claim "role" do token); require_role compila os
+    #    papéis aceitos numa máscara quando a rota é registrada
+    ROLES = {
+        "admin": 1 << 0,
+        "gerente": 1 << 1,
+        "funcionario": 1 << 2,
+    }
+
+    @staticmethod
+    def mascara_roles(*roles: str) -> int:
+        """Converte nomes de roles numa máscara de bits (ValueError para role desconhecida)."""
+        mascara = 0
+        for role in roles:
+            if role not in JwtMiddleware.ROLES:
+                raise ValueError(f"Role desconhecida: {role}")
+            mascara |= JwtMiddleware.ROLES[role]
+        return mascara
+
+    def __init__(self, token_cache: TokenCache = None, lista_revogacao: ListaRevogacao = None):
+        # 🔹 Cache de tokens já verificados (payload guardado até o 'exp')
+        self.__token_cache = token_cache or TokenCache()
+
+        # 🔹 jti revogados (logout / refresh); revogar também limpa o cache
+        self.__lista_revogacao = lista_revogacao or ListaRevogacao()
+        self.__lista_revogacao.adicionar_ouvinte(self.__token_cache.revogar_jti)
+
+    @property
+    def token_cache(self) -> TokenCache:
+        return self.__token_cache
+
+    @property
+    def lista_revogacao(self) -> ListaRevogacao:
+        return self.__lista_revogacao
+
     def validate_token(self, f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             print("🔷 JwtMiddleware.validate_token()")
             
             authorization = request.headers.get("Authorization", None)
-            jwt_instance = MeuTokenJWT()
+            token = authorization.replace("Bearer ", "").strip() if authorization else None
 
-            if jwt_instance.validar_token(authorization):
-                # ✅ Armazena payload no contexto Flask
-                g.jwt_payload = jwt_instance.payload
-                return f(*args, **kwargs)
-            else:
-                return jsonify({
-                    "success": False,
-                    "error": {
-                        "message": jwt_instance.error_message or "Token inválido",
-                        "code": "INVALID_TOKEN"
-                    }
-                }), 401
+            with Tracer.span("JwtMiddleware.validate_token"):
+                # ✅ Token repetido: payload vem do cache, sem decodificar de novo
+                payload = self.__token_cache.get(token) if token else None
+
+                if payload is None:
+                    jwt_instance = MeuTokenJWT()
+                    if not jwt_instance.validar_token(authorization):
+                        return jsonify({
+                            "success": False,
+                            "error": {
+                                "message": jwt_instance.error_message or "Token inválido",
+                                "code": "INVALID_TOKEN"
+                            }
+                        }), 401
+
+                    payload = jwt_instance.payload
+                    self.__token_cache.put(token, payload)
+
+                # ✅ Consulta O(1) na lista de revogação
+                if self.__lista_revogacao.esta_revogado(payload.get("jti")):
+                    return jsonify({
+                        "success": False,
+                        "error": {"message": "Token revogado", "code": "INVALID_TOKEN"}
+                    }), 401
+
+            # ✅ Armazena payload no contexto Flask
+            g.jwt_payload = payload
+            return f(*args, **kwargs)
 
         return decorated_function
+
+    def require_role(self, *roles: str):
+        """
+        Restringe a rota às roles informadas, usando o payload já verificado.
+        Deve vir abaixo de @validate_token. Sem consulta ao banco: a checagem
+        é um AND entre a máscara da rota e o bit da role do token.
+
+        Exemplo:
+        >>> @jwt_middleware.validate_token
+        ... @jwt_middleware.require_role("admin", "gerente")
+        ... def destroy(): ...
+        """
+        mascara = JwtMiddleware.mascara_roles(*roles)   # calculada uma vez, no registro da rota
+
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                payload = g.get("jwt_payload")
+                if payload is None:
+                    return jsonify({
+                        "success": False,
+                        "error": {"message": "Token não fornecido", "code": "INVALID_TOKEN"}
+                    }), 401
+
+                if not JwtMiddleware.ROLES.get(payload.get("role"), 0) & mascara:
+                    print(f"❌ JwtMiddleware.require_role(): role '{payload.get('role')}' sem permissão")
+                    return jsonify({
+                        "success": False,
+                        "error": {"message": "Acesso negado para o seu perfil", "code": "FORBIDDEN"}
+                    }), 403
+
+                return f(*args, **kwargs)
+
+            return decorated_function
+
+        return decorator
@@ -1,8 +1,29 @@
 # -*- coding: utf-8 -*-
 from functools import wraps
-from flask import request
-from datetime import datetime, date
+from flask import g, request
+from datetime import date
+from api.modelo.reserva import Reserva
 from api.utils.errorResponse import ErrorResponse
+from api.utils.esquema import Campo, Esquema
+from api.utils.tracing import Tracer
+
+
+def _periodo_valido(reserva: dict) -> str | None:
+    if reserva["fim"] <= reserva["inicio"]:
+        return "Data de fim deve ser posterior à data de início."
+    return None
+
+
+def _periodo_maximo(reserva: dict) -> str | None:
+    if (reserva["fim"] - reserva["inicio"]).days > Reserva.MAX_NOITES:
+        return f"Período de reserva não pode exceder {Reserva.MAX_NOITES} noites."
+    return None
+
+
+def _inicio_nao_passado(reserva: dict) -> str | None:
+    if reserva["inicio"] < date.today():
+        return "Data de início não pode ser anterior a hoje."
+    return None
 
 
 class ReservaMiddleware:
@@ -13,68 +34,26 @@ class ReservaMiddleware:
     - Corpo da requisição (existência de 'Reserva' e campos obrigatórios)
     - Formato das datas (YYYY-MM-DD)
     - Ordem cronológica (inicio < fim)
+    - Período de no máximo Reserva.MAX_NOITES noites
     - Data de início não anterior a hoje
     - idHospede / idHotel devem ser inteiros positivos
+
+    O corpo validado (ids int, datas date) fica em g.corpo (corpo_validado()).
     """
 
+    ESQUEMA = Esquema("Reserva", {
+        "idHospede": Campo.inteiro(positivo=True),
+        "idHotel": Campo.inteiro(positivo=True),
+        "inicio": Campo.data("Data de início"),
+        "fim": Campo.data("Data de fim"),
+    }, regras=(_periodo_valido, _periodo_maximo, _inicio_nao_passado))
+
     def validate_body(self, f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
             print("🔷 ReservaMiddleware.validate_body()")
-            body = request.get_json()
-            errors = []
-
-            if not body or 'Reserva' not in body:
-                raise ErrorResponse(400, "Erro na validação de dados", {"message": "O campo 'Reserva' é obrigatório!"})
-
-            reserva = body['Reserva']
-
-            # campos obrigatórios
-            required = ['idHospede', 'idHotel', 'inicio', 'fim']
-            for campo in required:
-                if campo not in reserva:
-                    errors.append(f"O campo '{campo}' é obrigatório.")
-
-            # validar ids
-            if 'idHospede' in reserva:
-                try:
-                    ii = int(reserva.get('idHospede'))
-                    if ii <= 0:
-                        errors.append("idHospede deve ser um inteiro positivo.")
-                except (ValueError, TypeError):
-                    errors.append("idHospede deve ser um inteiro.")
-
-            if 'idHotel' in reserva:
-                try:
-                    ic = int(reserva.get('idHotel'))
-                    if ic <= 0:
-                        errors.append("idHotel deve ser um inteiro positivo.")
-                except (ValueError, TypeError):
-                    errors.append("idHotel deve ser um inteiro.")
-
-            # validar datas
-            di = None
-            df = None
-            if 'inicio' in reserva:
-                try:
-                    di = datetime.strptime(str(reserva.get('inicio')), "%Y-%m-%d").date()
-                except Exception:
-                    errors.append("Data de início inválida ou formato incorreto (esperado YYYY-MM-DD).")
-            if 'fim' in reserva:
-                try:
-                    df = datetime.strptime(str(reserva.get('fim')), "%Y-%m-%d").date()
-                except Exception:
-                    errors.append("Data de fim inválida ou formato incorreto (esperado YYYY-MM-DD).")
-
-            if di and df:
-                if df <= di:
-                    errors.append("Data de fim deve ser posterior à data de início.")
-                if di < date.today():
-                    errors.append("Data de início não pode ser anterior a hoje.")
-
-            if errors:
-                raise ErrorResponse(400, "Erro na validação de dados da Reserva", {"errors": errors})
-
+            with Tracer.span("ReservaMiddleware.validate_body"):
+                g.corpo = ReservaMiddleware.ESQUEMA.validar(request.get_json())
             return f(*args, **kwargs)
         return decorated_function
 
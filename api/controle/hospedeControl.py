@@ -1,5 +1,7 @@
 from flask import request, jsonify
 from api.service.hospedeService import HospedeService
+from api.utils.etag import nao_modificado, com_etag
+from api.utils.esquema import corpo_validado
 """
 Classe responsável por controlar os endpoints da API REST para a entidade Hospede.
 
@@ -20,7 +22,7 @@ class HospedeControl:
         """Cria um novo Hospede"""
         print("🔵 HospedeControle.store()")
        
-        Hospede_body_request = request.json.get("Hospede")  #Pega os dados do Hospede no corpo da requisição
+        Hospede_body_request = corpo_validado()  # corpo do Hospede já validado e tipado pelo middleware
         novo_id = self.__Hospede_service.createHospede(Hospede_body_request)
 
         obj_resposta = {
@@ -47,27 +49,39 @@ class HospedeControl:
     def index(self):
         """Lista todos os Hospedes cadastrados"""
         print("🔵 HospedeControle.index()")
+
+        # GET condicional: 304 sem consultar o banco se a tabela não mudou
+        etag = self.__Hospede_service.versaoLista()
+        resposta = nao_modificado(etag)
+        if resposta:
+            return resposta
        
         array_Hospedes = self.__Hospede_service.findAll()
         
-        return jsonify({
+        return com_etag(jsonify({
             "success": True,
             "message": "Busca realizada com sucesso",
             "data": {"Hospedes": array_Hospedes}
-        }), 200
+        }), etag), 200
         
 
     def show(self):
           # Pega o idHospede diretamente da URI
         idHospede = request.view_args.get("idHospede")
 
+        etag = self.__Hospede_service.versaoItem(idHospede)
+        resposta = nao_modificado(etag)
+        if resposta:
+            return resposta
+
         Hospede = self.__Hospede_service.findById(idHospede)
         obj_resposta = {
             "success": True,
             "message": "Executado com sucesso",
             "data": {"Hospedes": Hospede}
         }
-        return jsonify(obj_resposta), 200
+        # sem ETag para id inexistente: a versão não muda quando o id é criado
+        return com_etag(jsonify(obj_resposta), etag if Hospede else None), 200
       
 
     def update(self):
@@ -78,7 +92,7 @@ class HospedeControl:
         idHospede = request.view_args.get("idHospede")
 
         # Pega os dados do Hospede no corpo da requisição
-        json_Hospede = request.json.get("Hospede")
+        json_Hospede = corpo_validado()
         print(json_Hospede)
 
         resposta = self.__Hospede_service.updateHospede(idHospede, json_Hospede)
@@ -1,5 +1,7 @@
 from flask import request, jsonify
 from api.service.hotelService import HotelService
+from api.utils.etag import nao_modificado, com_etag
+from api.utils.esquema import corpo_validado
 """
 Classe responsável por controlar os endpoints da API REST para a entidade Hotel.
 
@@ -20,7 +22,7 @@ class HotelControl:
         """Cria um novo Hotel"""
         print("🔵 HotelControle.store()")
        
-        Hotel_body_request = request.json.get("Hotel")  #Pega os dados do Hotel no corpo da requisição
+        Hotel_body_request = corpo_validado()  # corpo do Hotel já validado e tipado pelo middleware
         novo_id = self.__Hotel_service.createHotel(Hotel_body_request)
 
         obj_resposta = {
@@ -44,27 +46,39 @@ class HotelControl:
     def index(self):
         """Lista todos os Hoteis cadastrados"""
         print("🔵 HotelControle.index()")
+
+        # GET condicional: 304 sem consultar o banco se a tabela não mudou
+        etag = self.__Hotel_service.versaoLista()
+        resposta = nao_modificado(etag)
+        if resposta:
+            return resposta
        
         array_Hoteis = self.__Hotel_service.findAll()
         
-        return jsonify({
+        return com_etag(jsonify({
             "success": True,
             "message": "Busca realizada com sucesso",
             "data": {"Hoteis": array_Hoteis}
-        }), 200
+        }), etag), 200
         
 
     def show(self):
           # Pega o idHotel diretamente da URI
         idHotel = request.view_args.get("idHotel")
 
+        etag = self.__Hotel_service.versaoItem(idHotel)
+        resposta = nao_modificado(etag)
+        if resposta:
+            return resposta
+
         Hotel = self.__Hotel_service.findById(idHotel)
         obj_resposta = {
             "success": True,
             "message": "Executado com sucesso",
             "data": {"Hoteis": Hotel}
         }
-        return jsonify(obj_resposta), 200
+        # sem ETag para id inexistente: a versão não muda quando o id é criado
+        return com_etag(jsonify(obj_resposta), etag if Hotel else None), 200
       
 
     def update(self):
@@ -75,7 +89,7 @@ class HotelControl:
         idHotel = request.view_args.get("idHotel")
 
         # Pega os dados do Hotel no corpo da requisição
-        json_Hotel = request.json.get("Hotel")
+        json_Hotel = corpo_validado()
         print(json_Hotel)
 
         resposta = self.__Hotel_service.updateHotel(idHotel, json_Hotel)
@@ -0,0 +1,50 @@
+from flask import request, jsonify
+from api.service.relatorioService import RelatorioService
+from api.utils.errorResponse import ErrorResponse
+from api.utils.tracing import Tracer
+"""
+Classe responsável por controlar os endpoints de relatórios gerenciais.
+
+Recebe o RelatorioService por injeção de dependência; os relatórios são
+lidos do agregado reserva_diaria, nunca da tabela reserva.
+"""
+class RelatorioControl:
+    def __init__(self, relatorio_service: RelatorioService):
+        """
+        Construtor da classe RelatorioControl
+        :param relatorio_service: Instância do RelatorioService (injeção de dependência)
+        """
+        print("⬆️  RelatorioControl.constructor()")
+        self.__relatorio_service = relatorio_service
+
+    @Tracer.rastrear("RelatorioControl.mensal")
+    def mensal(self):
+        """Ocupação, estadia média e reservas por hotel e mês (?desde=YYYY-MM&ate=YYYY-MM&idHotel=N)"""
+        print("🔵 RelatorioControl.mensal()")
+
+        idHotel = request.args.get("idHotel")
+        if idHotel is not None:
+            if not idHotel.isdigit() or int(idHotel) <= 0:
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": "'idHotel' deve ser um inteiro positivo."})
+            idHotel = int(idHotel)
+
+        relatorio = self.__relatorio_service.mensal(request.args.get("desde"), request.args.get("ate"), idHotel)
+
+        return jsonify({
+            "success": True,
+            "message": "Relatório gerado com sucesso",
+            "data": {"relatorio": relatorio}
+        }), 200
+
+    @Tracer.rastrear("RelatorioControl.reconstruir")
+    def reconstruir(self):
+        """Recalcula o agregado reserva_diaria a partir da tabela reserva"""
+        print("🔵 RelatorioControl.reconstruir()")
+
+        linhas = self.__relatorio_service.reconstruir()
+
+        return jsonify({
+            "success": True,
+            "message": "Agregado reconstruído com sucesso",
+            "data": {"linhas": linhas}
+        }), 200
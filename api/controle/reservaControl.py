@@ -1,5 +1,8 @@
 from flask import request, jsonify
 from api.service.reservaService import ReservaService
+from api.utils.tracing import Tracer
+from api.utils.etag import nao_modificado, com_etag
+from api.utils.esquema import corpo_validado
 """
 Classe responsável por controlar os endpoints da API REST para a entidade Reserva.
 
@@ -16,11 +19,12 @@ class ReservaControl:
         print("⬆️  ReservaControl.constructor()")
         self.__Reserva_service = Reserva_service
 
+    @Tracer.rastrear("ReservaControl.store")
     def store(self):
         """Cria um novo Reserva"""
         print("🔵 ReservaControle.store()")
        
-        Reserva_body_request = request.json.get("Reserva")  #Pega os dados do Reserva no corpo da requisição
+        Reserva_body_request = corpo_validado()  # corpo do Reserva já validado e tipado pelo middleware
         novo_id = self.__Reserva_service.createReserva(Reserva_body_request)
 
         obj_resposta = {
@@ -43,23 +47,36 @@ class ReservaControl:
             return jsonify(obj_resposta), 200
         
 
+    @Tracer.rastrear("ReservaControl.index")
     def index(self):
         """Lista todos os Reservas cadastrados"""
         print("🔵 ReservaControle.index()")
+
+        # GET condicional: 304 sem consultar o banco se a tabela não mudou
+        etag = self.__Reserva_service.versaoLista()
+        resposta = nao_modificado(etag)
+        if resposta:
+            return resposta
        
         array_Reservas = self.__Reserva_service.findAll()
         
-        return jsonify({
+        return com_etag(jsonify({
             "success": True,
             "message": "Busca realizada com sucesso",
             "data": {"reservas": array_Reservas}  # ✅ CORREÇÃO: Minúsculo para padronizar
-        }), 200
+        }), etag), 200
         
 
+    @Tracer.rastrear("ReservaControl.show")
     def show(self):
           # Pega o idReserva diretamente da URI
         idReserva = request.view_args.get("idReserva")
 
+        etag = self.__Reserva_service.versaoItem(idReserva)
+        resposta = nao_modificado(etag)
+        if resposta:
+            return resposta
+
         Reserva = self.__Reserva_service.findById(idReserva)
         
         # ✅ CORREÇÃO: Validar se reserva existe antes de retornar
@@ -75,9 +92,10 @@ class ReservaControl:
             "message": "Executado com sucesso",
             "data": {"reserva": Reserva}  # ✅ CORREÇÃO: Singular para um único item
         }
-        return jsonify(obj_resposta), 200
+        return com_etag(jsonify(obj_resposta), etag), 200
       
 
+    @Tracer.rastrear("ReservaControl.update")
     def update(self):
         """Atualiza os dados de um Reserva existente"""
         print("🔵 ReservaControle.update()")
@@ -86,7 +104,7 @@ class ReservaControl:
         idReserva = request.view_args.get("idReserva")
 
         # Pega os dados do Reserva no corpo da requisição
-        json_Reserva = request.json.get("Reserva")
+        json_Reserva = corpo_validado()
         print(f"📦 CONTROLLER UPDATE - ID: {idReserva}, Dados: {json_Reserva}")
 
         resposta = self.__Reserva_service.updateReserva(idReserva, json_Reserva)
@@ -114,6 +132,7 @@ class ReservaControl:
         }), 200
    
 
+    @Tracer.rastrear("ReservaControl.destroy")
     def destroy(self):
         """Remove um Reserva pelo ID"""
         print("🔵 ReservaControle.destroy()")
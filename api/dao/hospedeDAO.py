@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from itertools import starmap
+
 from api.modelo.hospede import Hospede
 from api.database.database import DatabaseConfig
 
@@ -21,7 +23,7 @@ class HospedeDAO:
 
     def create(self, objHospede: Hospede) -> int:
         SQL = "INSERT INTO hospede (nome,email,telefone,requisicao,cpf) VALUES (%s,%s,%s,%s,%s);"
-        params = (objHospede.nomeHospede,objHospede.email,objHospede.telefone,objHospede.requisicao,objHospede.cpf)
+        params = (objHospede.nome,objHospede.email,objHospede.telefone,objHospede.requisicao,objHospede.cpf)
 
         conn = self.__database.get_connection()
         try:
@@ -62,7 +64,7 @@ class HospedeDAO:
 
     def update(self, objHospede: Hospede) -> bool:
         SQL = "UPDATE hospede SET nome = %s, email = %s, telefone = %s, requisicao = %s, cpf = %s WHERE idHospede = %s;"
-        params = (objHospede.nomeHospede,objHospede.email, objHospede.telefone, objHospede.requisicao, objHospede.cpf, objHospede.idHospede)
+        params = (objHospede.nome,objHospede.email, objHospede.telefone, objHospede.requisicao, objHospede.cpf, objHospede.idHospede)
 
         conn = self.__database.get_connection()
         try:
@@ -79,15 +81,15 @@ class HospedeDAO:
         finally:
             conn.close()
 
-    def findAll(self) -> list[dict]:
-        SQL = "SELECT * FROM hospede;"
+    def findAll(self) -> list[Hospede]:
+        SQL = f"SELECT {Hospede.COLUNAS} FROM hospede;"
 
         conn = self.__database.get_connection()
         try:
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             try:
                 cursor.execute(SQL)
-                resultados = cursor.fetchall()
+                resultados = list(starmap(Hospede, cursor.fetchall()))
                 
                 print(f"✅ HospedeDAO.findAll() -> {len(resultados)} registros encontrados")
                 return resultados
@@ -96,25 +98,25 @@ class HospedeDAO:
         finally:
             conn.close()
 
-    def findById(self, idHospede: int) -> dict | None:
+    def findById(self, idHospede: int) -> Hospede | None:
         resultados = self.findByField("idHospede", idHospede)
         print("✅ HospedeDAO.findById()")
         return resultados[0] if resultados else None
 
-    def findByField(self, field: str, value) -> list[dict]:
+    def findByField(self, field: str, value) -> list[Hospede]:
         allowed_fields = ["idHospede", "nome", "email", "telefone", "requisicao", "cpf"]
         if field not in allowed_fields:
             raise ValueError(f"Campo inválido para busca: {field}")
 
-        SQL = f"SELECT * FROM hospede WHERE {field} = %s;"
+        SQL = f"SELECT {Hospede.COLUNAS} FROM hospede WHERE {field} = %s;"
         params = (value,)
 
         conn = self.__database.get_connection()
         try:
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             try:
                 cursor.execute(SQL, params)
-                resultados = cursor.fetchall()
+                resultados = list(starmap(Hospede, cursor.fetchall()))
                 
                 print("✅ HospedeDAO.findByField()")
                 return resultados
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import itertools
+import threading
+import time
+import unicodedata
+
+from api.dao.hotelDAO import HotelDAO
+from api.modelo.hotel import Hotel
+from api.utils.metrics import Metrics
+from api.utils.serviceCache import ServiceCache
+
+"""
+Catálogo de hotéis em memória, com a mesma interface do HotelDAO.
+
+Objetivo:
+- A tabela hotel é pequena e quase não muda, mas é lida em toda criação e
+  atualização de reserva (validação de idHotel) e no cadastro de hotel
+  (nome duplicado). O catálogo guarda a tabela inteira e responde findById,
+  findByField e findAll sem ir ao banco.
+- Pode ser injetado no lugar do HotelDAO (HotelService, ReservaService).
+
+Atualização:
+- Escritas feitas pelo próprio catálogo (create/update/delete) marcam o
+  snapshot como desatualizado na hora.
+- Escritas de outros processos chegam pela versão da lista "hotel" do
+  ServiceCache (verificada no máximo a cada INTERVALO_VERIFICACAO segundos).
+- Sem cache compartilhado, o snapshot é recarregado a cada IDADE_MAXIMA segundos.
+"""
+class HotelCatalogo:
+    INTERVALO_VERIFICACAO = 1.0
+    IDADE_MAXIMA = 300.0
+
+    def __init__(self, hotel_dao: HotelDAO, cache: ServiceCache = None):
+        print("⬆️ HotelCatalogo.__init__()")
+        self.__HotelDAO = hotel_dao
+        self.__cache = cache or ServiceCache.desativado()
+        self.__lock = threading.Lock()
+        # snapshot imutável trocado de uma vez: (por_id, por_nome, lista)
+        self.__snapshot = None
+        self.__geracoes = itertools.count(1)
+        self.__geracao = 0              # muda a cada invalidar()
+        self.__geracao_snapshot = -1    # geração vista quando o snapshot foi montado
+        self.__versao = None
+        self.__carregado_em = 0.0
+        self.__verificado_em = 0.0
+        self.__recargas = Metrics.counter("hotel_catalog_reloads_total", "Recargas do catálogo de hotéis em memória")
+
+    def carregar(self):
+        """Lê a tabela hotel inteira e troca o snapshot (chamado no boot e quando desatualizado)."""
+        with self.__lock:
+            self.__montar()
+
+    def __montar(self):
+        # geração e versão lidas antes da consulta: uma escrita concorrente
+        # deixa o snapshot marcado como desatualizado em vez de perdida
+        geracao = self.__geracao
+        versao = self.__cache.versao_lista("hotel")
+        hoteis = self.__HotelDAO.findAll()
+
+        por_id = {}
+        por_nome = {}
+        for hotel in hoteis:
+            por_id[hotel.idHotel] = hotel
+            por_nome.setdefault(HotelCatalogo.__normalizar(hotel.nome), []).append(hotel)
+
+        self.__snapshot = (por_id, por_nome, hoteis)
+        self.__geracao_snapshot = geracao
+        self.__versao = versao
+        self.__carregado_em = self.__verificado_em = time.monotonic()
+        self.__recargas.inc()
+        print(f"✅ HotelCatalogo.carregar() -> {len(hoteis)} hotéis em memória")
+
+    def invalidar(self):
+        """Força recarga na próxima leitura (chamado após escritas na tabela hotel)."""
+        self.__geracao = next(self.__geracoes)
+
+    # ---------------- Leituras (sem banco) ----------------
+
+    def findAll(self) -> list[Hotel]:
+        return self.__atual()[2]
+
+    def findById(self, idHotel: int) -> Hotel | None:
+        try:
+            return self.__atual()[0].get(int(idHotel))
+        except (TypeError, ValueError):
+            return None
+
+    def findByField(self, field: str, value) -> list[Hotel]:
+        por_id, por_nome, hoteis = self.__atual()
+        if field == "idHotel":
+            hotel = self.findById(value)
+            return [hotel] if hotel else []
+        if field == "nome":
+            return list(por_nome.get(HotelCatalogo.__normalizar(value), []))
+        if field == "capacidade":
+            return [hotel for hotel in hoteis if hotel.capacidade == value]
+        raise ValueError(f"Campo inválido para busca: {field}")
+
+    # ---------------- Escritas (delegadas ao DAO) ----------------
+
+    def create(self, objHotel: Hotel) -> int:
+        try:
+            return self.__HotelDAO.create(objHotel)
+        finally:
+            self.invalidar()
+
+    def update(self, objHotel: Hotel) -> bool:
+        try:
+            return self.__HotelDAO.update(objHotel)
+        finally:
+            self.invalidar()
+
+    def delete(self, objHotel: Hotel) -> bool:
+        try:
+            return self.__HotelDAO.delete(objHotel)
+        finally:
+            self.invalidar()
+
+    # ---------------- Internos ----------------
+
+    def __atual(self) -> tuple:
+        if self.__desatualizado():
+            with self.__lock:
+                # outra thread pode ter recarregado enquanto esta esperava o lock
+                if self.__desatualizado(verificar_versao=False):
+                    self.__montar()
+        return self.__snapshot
+
+    def __desatualizado(self, verificar_versao: bool = True) -> bool:
+        if self.__snapshot is None or self.__geracao_snapshot != self.__geracao:
+            return True
+
+        agora = time.monotonic()
+        if agora - self.__carregado_em > HotelCatalogo.IDADE_MAXIMA:
+            return True
+        if not verificar_versao or agora - self.__verificado_em < HotelCatalogo.INTERVALO_VERIFICACAO:
+            return False
+
+        self.__verificado_em = agora
+        if self.__cache.versao_lista("hotel") != self.__versao:
+            self.invalidar()   # escrita de outro processo
+            return True
+        return False
+
+    @staticmethod
+    def __normalizar(nome) -> str:
+        # aproxima a collation *_ai_ci do MySQL (sem acento, sem maiúsculas)
+        texto = unicodedata.normalize("NFKD", str(nome or ""))
+        return "".join(c for c in texto if not unicodedata.combining(c)).casefold()
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from itertools import starmap
+
 from api.modelo.hotel import Hotel
 from api.database.database import DatabaseConfig
 
@@ -79,15 +81,15 @@ class HotelDAO:
         finally:
             conn.close()
 
-    def findAll(self) -> list[dict]:
-        SQL = "SELECT * FROM hotel;"
+    def findAll(self) -> list[Hotel]:
+        SQL = f"SELECT {Hotel.COLUNAS} FROM hotel;"
 
         conn = self.__database.get_connection()
         try:
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             try:
                 cursor.execute(SQL)
-                resultados = cursor.fetchall()
+                resultados = list(starmap(Hotel, cursor.fetchall()))
                 
                 print(f"✅ HotelDAO.findAll() -> {len(resultados)} registros encontrados")
                 return resultados
@@ -96,25 +98,25 @@ class HotelDAO:
         finally:
             conn.close()
 
-    def findById(self, idHotel: int) -> dict | None:
+    def findById(self, idHotel: int) -> Hotel | None:
         resultados = self.findByField("idHotel", idHotel)
         print("✅ HotelDAO.findById()")
         return resultados[0] if resultados else None
 
-    def findByField(self, field: str, value) -> list[dict]:
+    def findByField(self, field: str, value) -> list[Hotel]:
         allowed_fields = ["idHotel", "nome", "capacidade"]
         if field not in allowed_fields:
             raise ValueError(f"Campo inválido para busca: {field}")
 
-        SQL = f"SELECT * FROM hotel WHERE {field} = %s;"
+        SQL = f"SELECT {Hotel.COLUNAS} FROM hotel WHERE {field} = %s;"
         params = (value,)
 
         conn = self.__database.get_connection()
         try:
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             try:
                 cursor.execute(SQL, params)
-                resultados = cursor.fetchall()
+                resultados = list(starmap(Hotel, cursor.fetchall()))
                 
                 print("✅ HotelDAO.findByField()")
                 return resultados
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+from itertools import starmap
+
 from api.modelo.reserva import Reserva
 from api.database.database import DatabaseConfig
+from api.utils.colunar import Colunas, DATA, INTEIRO, ler_colunas
 
 """
 Representa o DAO (Data Access Object) de Reserva.
@@ -10,6 +13,9 @@ Objetivo:
 - Permitir injeção de dependência do MysqlDatabase (que fornece conexões do pool).
 """
 class ReservaDAO:
+    # tipos das colunas de Reserva.COLUNAS, na mesma ordem (findAllColunar)
+    TIPOS_COLUNARES = (("idReserva", INTEIRO), ("idHospede", INTEIRO), ("idHotel", INTEIRO), ("inicio", DATA), ("fim", DATA))
+
     def __init__(self, database_dependency: DatabaseConfig):
         """
         Construtor do DAO, recebe o Database (pool de conexões) por injeção de dependência.
@@ -79,15 +85,15 @@ class ReservaDAO:
         finally:
             conn.close()
 
-    def findAll(self) -> list[dict]:
-        SQL = "SELECT * FROM reserva;"
+    def findAll(self) -> list[Reserva]:
+        SQL = f"SELECT {Reserva.COLUNAS} FROM reserva;"
 
         conn = self.__database.get_connection()
         try:
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             try:
                 cursor.execute(SQL)
-                resultados = cursor.fetchall()
+                resultados = list(starmap(Reserva, cursor.fetchall()))
                 
                 print(f"✅ ReservaDAO.findAll() -> {len(resultados)} registros encontrados")
                 return resultados
@@ -96,25 +102,46 @@ class ReservaDAO:
         finally:
             conn.close()
 
-    def findById(self, idReserva: int) -> dict | None:
+    def findAllColunar(self) -> Colunas:
+        """
+        Todas as reservas em formato colunar (um array por coluna), para
+        relatórios e agregações: sem um objeto por linha.
+        """
+        SQL = f"SELECT {Reserva.COLUNAS} FROM reserva;"
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SQL)
+                colunas = ler_colunas(cursor, ReservaDAO.TIPOS_COLUNARES)
+
+                print(f"✅ ReservaDAO.findAllColunar() -> {len(colunas)} registros encontrados")
+                return colunas
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def findById(self, idReserva: int) -> Reserva | None:
         resultados = self.findByField("idReserva", idReserva)
         print("✅ ReservaDAO.findById()")
         return resultados[0] if resultados else None
 
-    def findByField(self, field: str, value) -> list[dict]:
+    def findByField(self, field: str, value) -> list[Reserva]:
         allowed_fields = ["idReserva", "idHospede", "idHotel", "inicio", "fim"]
         if field not in allowed_fields:
             raise ValueError(f"Campo inválido para busca: {field}")
 
-        SQL = f"SELECT * FROM reserva WHERE {field} = %s;"
+        SQL = f"SELECT {Reserva.COLUNAS} FROM reserva WHERE {field} = %s;"
         params = (value,)
 
         conn = self.__database.get_connection()
         try:
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             try:
                 cursor.execute(SQL, params)
-                resultados = cursor.fetchall()
+                resultados = list(starmap(Reserva, cursor.fetchall()))
                 
                 print("✅ ReservaDAO.findByField()")
                 return resultados
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+
+from api.database.database import DatabaseConfig
+
+"""
+Representa o DAO (Data Access Object) da tabela reserva_diaria.
+
+Objetivo:
+- Guardar, por hotel e dia, os agregados usados pelos relatórios:
+  - ocupadas: reservas ocupando o hotel na noite do dia (inicio <= dia < fim)
+  - entradas: reservas com check-in no dia
+  - noites_entradas: total de noites das reservas com check-in no dia
+- As linhas são mantidas pelo RelatorioService (incrementos a cada escrita em
+  reserva e reconstrução periódica); os relatórios leem só esta tabela, com
+  custo proporcional ao período consultado e não ao histórico de reservas.
+"""
+class ReservaDiariaDAO:
+    COLUNAS = "idHotel, dia, ocupadas, entradas, noites_entradas"
+    LOTE = 1000
+
+    def __init__(self, database_dependency: DatabaseConfig):
+        print("⬆️ ReservaDiariaDAO.__init__()")
+        self.__database = database_dependency
+
+    def somar(self, linhas: list[tuple]) -> int:
+        """
+        Soma os deltas (idHotel, dia, ocupadas, entradas, noites_entradas) às
+        linhas existentes, criando as que faltam (upsert).
+        """
+        if not linhas:
+            return 0
+
+        SQL = (
+            f"INSERT INTO reserva_diaria ({ReservaDiariaDAO.COLUNAS}) VALUES (%s, %s, %s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE ocupadas = ocupadas + VALUES(ocupadas), "
+            "entradas = entradas + VALUES(entradas), "
+            "noites_entradas = noites_entradas + VALUES(noites_entradas);"
+        )
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.executemany(SQL, linhas)
+                conn.commit()
+                print(f"✅ ReservaDiariaDAO.somar() -> {len(linhas)} dias")
+                return len(linhas)
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def substituirTudo(self, linhas: list[tuple]) -> int:
+        """Troca o conteúdo da tabela pelas `linhas` numa única transação (reconstrução)."""
+        SQL_DELETE = "DELETE FROM reserva_diaria;"
+        SQL_INSERT = f"INSERT INTO reserva_diaria ({ReservaDiariaDAO.COLUNAS}) VALUES (%s, %s, %s, %s, %s);"
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SQL_DELETE)
+                for i in range(0, len(linhas), ReservaDiariaDAO.LOTE):
+                    cursor.executemany(SQL_INSERT, linhas[i:i + ReservaDiariaDAO.LOTE])
+                conn.commit()
+                print(f"✅ ReservaDiariaDAO.substituirTudo() -> {len(linhas)} linhas")
+                return len(linhas)
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def findPeriodo(self, desde: date, ate: date, idHotel: int = None) -> list[tuple]:
+        """Linhas (idHotel, dia, ocupadas, entradas, noites_entradas) com desde <= dia <= ate."""
+        SQL = f"SELECT {ReservaDiariaDAO.COLUNAS} FROM reserva_diaria WHERE dia BETWEEN %s AND %s"
+        params = (desde, ate)
+        if idHotel is not None:
+            SQL += " AND idHotel = %s"
+            params += (idHotel,)
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SQL + ";", params)
+                resultados = cursor.fetchall()
+                print(f"✅ ReservaDiariaDAO.findPeriodo() -> {len(resultados)} registros encontrados")
+                return resultados
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
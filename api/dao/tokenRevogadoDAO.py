@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+from api.database.database import DatabaseConfig
+
+"""
+Representa o DAO (Data Access Object) da tabela token_revogado.
+
+Objetivo:
+- Persistir os 'jti' revogados (logout / rotação de refresh token) para que
+  a lista de revogação sobreviva a reinícios.
+- A consulta esta_revogado() é só em memória, por processo: um logout feito em
+  outro processo só vale aqui depois de um reinício. Entre processos, a tabela
+  garante apenas o uso único do refresh token (createSeNovo).
+"""
+class TokenRevogadoDAO:
+    def __init__(self, database_dependency: DatabaseConfig):
+        print("⬆️ TokenRevogadoDAO.__init__()")
+        self.__database = database_dependency
+
+    def create(self, jti: str, expira_em: int) -> bool:
+        """Grava o jti revogado até o instante (epoch) em que o token expiraria."""
+        SQL = "INSERT INTO token_revogado (jti, expira_em) VALUES (%s, %s);"
+        params = (jti, datetime.fromtimestamp(expira_em))
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SQL, params)
+                conn.commit()
+                print("✅ TokenRevogadoDAO.create()")
+                return cursor.rowcount > 0
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def createSeNovo(self, jti: str, expira_em: int) -> bool:
+        """Grava o jti revogado; False se ele já estava gravado (chave primária)."""
+        SQL = "INSERT IGNORE INTO token_revogado (jti, expira_em) VALUES (%s, %s);"
+        params = (jti, datetime.fromtimestamp(expira_em))
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SQL, params)
+                conn.commit()
+                print("✅ TokenRevogadoDAO.createSeNovo()")
+                return cursor.rowcount > 0
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def findAtivos(self) -> list[dict]:
+        """Retorna os jti cuja expiração ainda não passou."""
+        SQL = "SELECT jti, expira_em FROM token_revogado WHERE expira_em > %s;"
+        params = (datetime.now(),)
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute(SQL, params)
+                resultados = cursor.fetchall()
+                print(f"✅ TokenRevogadoDAO.findAtivos() -> {len(resultados)} registros encontrados")
+                return resultados
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def deleteExpirados(self) -> int:
+        SQL = "DELETE FROM token_revogado WHERE expira_em <= %s;"
+        params = (datetime.now(),)
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SQL, params)
+                conn.commit()
+                print("✅ TokenRevogadoDAO.deleteExpirados()")
+                return cursor.rowcount
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
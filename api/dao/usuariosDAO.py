@@ -1,25 +1,123 @@
 # -*- coding: utf-8 -*-
+import dataclasses
+
 from api.modelo.usuarios import Usuario
 from api.database.database import DatabaseConfig
+from api.utils.cache import LRUCache
+from api.utils.metrics import Metrics
 
 class UsuarioDAO:
-    def __init__(self, database_dependency: DatabaseConfig):
+    """
+    DAO de usuários com cache de findByEmail.
+
+    - Usuários encontrados ficam em cache por TTL_ENCONTRADO segundos
+    - Emails inexistentes também (cache negativo, TTL_AUSENTE segundos), para
+      que tentativas de login com emails desconhecidos não cheguem ao MySQL
+    - create() e updateSenha() invalidam a entrada do email afetado
+    """
+
+    TTL_ENCONTRADO = 60
+    TTL_AUSENTE = 10
+    _AUSENTE = object()   # marcador de email inexistente no cache
+
+    def __init__(self, database_dependency: DatabaseConfig, cache: LRUCache = None):
         print("⬆️ UsuarioDAO.__init__()")
         self.__database = database_dependency
+        self.__cache = cache if cache is not None else LRUCache(maxsize=10_000)
+        self.__email_por_id = {}   # idUsuario -> chave do cache (invalidação por id)
+        self.__consultas = Metrics.counter("usuario_cache_lookups_total", "Consultas ao cache de UsuarioDAO.findByEmail", ("resultado",))
+
+    @staticmethod
+    def __chave(email: str) -> str:
+        # a collation padrão do MySQL compara emails sem diferenciar maiúsculas
+        return email.strip().lower()
+
+    def invalidar(self, email: str = None, idUsuario: int = None):
+        """Remove do cache o usuário pelo email e/ou id (chamar após qualquer alteração)."""
+        if idUsuario is not None:
+            chave = self.__email_por_id.pop(idUsuario, None)
+            if chave is not None:
+                self.__cache.delete(chave)
+        if email:
+            self.__cache.delete(UsuarioDAO.__chave(email))
+
+    def findByEmail(self, email: str) -> Usuario | None:
+        """Busca usuário por email (com cache, inclusive de emails inexistentes)"""
+        chave = UsuarioDAO.__chave(email)
+        em_cache = self.__cache.get(chave)
+        if em_cache is UsuarioDAO._AUSENTE:
+            self.__consultas.inc(resultado="hit_ausente")
+            return None
+        if em_cache is not None:
+            self.__consultas.inc(resultado="hit")
+            return dataclasses.replace(em_cache)
+        self.__consultas.inc(resultado="miss")
+
+        # consulta com a mesma chave do cache: um email com espaços não pode
+        # gravar _AUSENTE sob a chave do usuário real
+        resultado = self.__buscar_por_email(chave)
+        if resultado is None:
+            self.__cache.set(chave, UsuarioDAO._AUSENTE, ttl=UsuarioDAO.TTL_AUSENTE)
+            return None
+
+        self.__cache.set(chave, dataclasses.replace(resultado), ttl=UsuarioDAO.TTL_ENCONTRADO)
+        self.__email_por_id[resultado.idUsuario] = chave
+        return resultado
 
-    def findByEmail(self, email: str) -> dict | None:
-        """Busca usuário por email"""
-        SQL = "SELECT * FROM usuarios WHERE email = %s AND ativo = TRUE;"
+    def __buscar_por_email(self, email: str) -> Usuario | None:
+        SQL = f"SELECT {Usuario.COLUNAS} FROM usuarios WHERE email = %s AND ativo = TRUE;"
         params = (email,)
 
         conn = self.__database.get_connection()
         try:
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             try:
                 cursor.execute(SQL, params)
-                resultado = cursor.fetchone()
-                print(f"✅ UsuarioDAO.findByEmail() -> {'Encontrado' if resultado else 'Não encontrado'}")
-                return resultado
+                linha = cursor.fetchone()
+                print(f"✅ UsuarioDAO.findByEmail() -> {'Encontrado' if linha else 'Não encontrado'}")
+                return Usuario(*linha) if linha else None
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def findById(self, idUsuario: int) -> Usuario | None:
+        """Busca usuário ativo por id (sem cache: usado na renovação de tokens)"""
+        SQL = f"SELECT {Usuario.COLUNAS} FROM usuarios WHERE idUsuario = %s AND ativo = TRUE;"
+        params = (idUsuario,)
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SQL, params)
+                linha = cursor.fetchone()
+                print(f"✅ UsuarioDAO.findById() -> {'Encontrado' if linha else 'Não encontrado'}")
+                return Usuario(*linha) if linha else None
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    def updateSenha(self, idUsuario: int, senha_nova: str, senha_atual: str) -> bool:
+        """
+        Substitui o hash da senha apenas se o valor salvo ainda for `senha_atual`
+        (evita sobrescrever uma troca de senha concorrente).
+        """
+        SQL = "UPDATE usuarios SET senha = %s WHERE idUsuario = %s AND senha = %s;"
+        params = (senha_nova, idUsuario, senha_atual)
+
+        conn = self.__database.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(SQL, params)
+                conn.commit()
+                affected = cursor.rowcount
+                self.invalidar(idUsuario=idUsuario)
+
+                print("✅ UsuarioDAO.updateSenha()")
+                return affected > 0
             finally:
                 cursor.close()
         finally:
@@ -40,6 +138,9 @@ class UsuarioDAO:
 
                 if not insert_id:
                     raise Exception("Falha ao inserir usuário")
+
+                # remove o cache negativo do email recém-cadastrado
+                self.invalidar(email=usuario.email)
                 
                 print("✅ UsuarioDAO.create()")
                 return insert_id
@@ -1,6 +1,16 @@
 import mysql.connector                # biblioteca mysql-connector-python
 from mysql.connector import pooling   # pooling serve para gerenciamento de conexões
 import sys                            # sys para manipulação de saída de erro
+import time                           # time para medir a espera por conexões do pool
+
+from api.database.instrumentacao import ConexaoInstrumentada
+from api.utils.metrics import Metrics
+
+POOL_ESPERA = Metrics.histogram(
+        "db_pool_wait_seconds",
+        "Tempo de espera para obter uma conexão do pool",
+        ("pool",)
+)
 
 class DatabaseConfig:
         __pool = None
@@ -51,4 +61,13 @@ class DatabaseConfig:
             
         def get_connection(self):
             pool = self.connect()
-            return pool.get_connection()
\ No newline at end of file
+
+            # mede a espera pelo pool e devolve a conexão instrumentada (tempo por comando SQL)
+            inicio = time.perf_counter()
+            conn = pool.get_connection()
+            POOL_ESPERA.observe(time.perf_counter() - inicio, pool=self.pool_name)
+            return ConexaoInstrumentada(conn, self)
+
+        def get_raw_connection(self):
+            # conexão sem instrumentação (usada internamente, ex.: EXPLAIN do slow-query log)
+            return self.connect().get_connection()
\ No newline at end of file
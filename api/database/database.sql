@@ -94,6 +94,41 @@ DEFAULT CHARACTER SET = utf8mb4
 COLLATE = utf8mb4_unicode_ci;
 
 
+-- -----------------------------------------------------
+-- Table casa_branca.token_revogado
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS casa_branca.token_revogado (
+  jti CHAR(32) NOT NULL,
+  expira_em DATETIME NOT NULL,
+  PRIMARY KEY (jti),
+  INDEX expira_em (expira_em ASC))
+ENGINE = InnoDB
+DEFAULT CHARACTER SET = utf8mb4
+COLLATE = utf8mb4_unicode_ci;
+
+
+-- -----------------------------------------------------
+-- Table casa_branca.reserva_diaria
+-- Agregado diário de reserva (relatórios), mantido pelo RelatorioService
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS casa_branca.reserva_diaria (
+  idHotel INT NOT NULL,
+  dia DATE NOT NULL,
+  ocupadas INT NOT NULL DEFAULT 0,
+  entradas INT NOT NULL DEFAULT 0,
+  noites_entradas INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (idHotel, dia),
+  INDEX dia (dia ASC),
+  CONSTRAINT reserva_diaria_ibfk_1
+    FOREIGN KEY (idHotel)
+    REFERENCES casa_branca.hotel (idHotel)
+    ON DELETE CASCADE)
+ENGINE = InnoDB
+DEFAULT CHARACTER SET = utf8mb4
+COLLATE = utf8mb4_unicode_ci;
+
+
+
 SET SQL_MODE=@OLD_SQL_MODE;
 SET FOREIGN_KEY_CHECKS=@OLD_FOREIGN_KEY_CHECKS;
 SET UNIQUE_CHECKS=@OLD_UNIQUE_CHECKS;
@@ -0,0 +1,157 @@
+import re
+import time
+
+from api.utils.metrics import Metrics
+from api.utils.slowQueryLog import SlowQueryLog
+from api.utils.tracing import Tracer
+
+"""
+Instrumentação das conexões do pool.
+
+Objetivo:
+- Medir o tempo de cada comando SQL executado pelos DAOs sem alterar o código deles.
+- A conexão devolvida por DatabaseConfig.get_connection() é embrulhada em
+  ConexaoInstrumentada, cujo cursor() devolve um CursorInstrumentado.
+- Comandos acima do limiar do SlowQueryLog são registrados no slow-query log.
+- Cada comando vira um span filho do span atual (quando há um trace ativo).
+"""
+
+SQL_DURACAO = Metrics.histogram(
+    "db_query_duration_seconds",
+    "Duração dos comandos SQL (execute + fetch) por operação e tabela",
+    ("operacao", "tabela")
+)
+SQL_TOTAL = Metrics.counter(
+    "db_queries_total",
+    "Total de comandos SQL executados por operação e tabela",
+    ("operacao", "tabela")
+)
+SQL_ERROS = Metrics.counter(
+    "db_query_errors_total",
+    "Total de comandos SQL que lançaram exceção",
+    ("operacao", "tabela")
+)
+
+_REGEX_TABELA = re.compile(r"\b(?:FROM|INTO|UPDATE)\s+`?(\w+)`?", re.IGNORECASE)
+
+
+def classificar_sql(sql: str) -> tuple[str, str]:
+    """
+    Extrai (operacao, tabela) de um comando SQL para uso como labels.
+
+    Exemplo:
+    >>> classificar_sql("SELECT * FROM hotel WHERE idHotel = %s;")
+    ('SELECT', 'hotel')
+    """
+    texto = sql.lstrip()
+    operacao = texto.split(None, 1)[0].upper() if texto else ""
+    encontrado = _REGEX_TABELA.search(texto)
+    tabela = encontrado.group(1).lower() if encontrado else ""
+    return operacao, tabela
+
+
+class CursorInstrumentado:
+    """
+    Envolve um cursor do mysql-connector medindo execute() e fetch*().
+
+    Para SELECTs, o tempo de leitura das linhas é somado ao do execute e o
+    comando só é finalizado no fetch, quando o número de linhas é conhecido.
+    """
+
+    def __init__(self, cursor, database=None):
+        self.__cursor = cursor
+        self.__database = database
+        self.__pendente = None   # (sql, params, operacao, tabela, duracao)
+
+    def execute(self, sql, params=None, *args, **kwargs):
+        self.__finalizar_pendente()
+        operacao, tabela = classificar_sql(sql)
+
+        inicio = time.perf_counter()
+        try:
+            resultado = self.__cursor.execute(sql, params, *args, **kwargs)
+        except Exception:
+            SQL_ERROS.inc(operacao=operacao, tabela=tabela)
+            raise
+        duracao = time.perf_counter() - inicio
+
+        if self.__cursor.with_rows:
+            self.__pendente = (sql, params, operacao, tabela, duracao)
+        else:
+            self._registrar(sql, params, operacao, tabela, duracao, self.__cursor.rowcount)
+        return resultado
+
+    def executemany(self, sql, seq_params, *args, **kwargs):
+        self.__finalizar_pendente()
+        operacao, tabela = classificar_sql(sql)
+        seq_params = list(seq_params)
+
+        inicio = time.perf_counter()
+        try:
+            resultado = self.__cursor.executemany(sql, seq_params, *args, **kwargs)
+        except Exception:
+            SQL_ERROS.inc(operacao=operacao, tabela=tabela)
+            raise
+        duracao = time.perf_counter() - inicio
+
+        # o lote conta como um comando; o slow-query log recebe os parâmetros da primeira linha
+        self._registrar(sql, seq_params[0] if seq_params else None, operacao, tabela, duracao, self.__cursor.rowcount)
+        return resultado
+
+    def fetchall(self):
+        return self.__medir_fetch(self.__cursor.fetchall, lambda linhas: len(linhas))
+
+    def fetchone(self):
+        return self.__medir_fetch(self.__cursor.fetchone, lambda linha: 1 if linha else 0)
+
+    def fetchmany(self, *args, **kwargs):
+        return self.__medir_fetch(lambda: self.__cursor.fetchmany(*args, **kwargs), lambda linhas: len(linhas))
+
+    def close(self):
+        self.__finalizar_pendente()
+        return self.__cursor.close()
+
+    def __medir_fetch(self, fetch, contar):
+        inicio = time.perf_counter()
+        linhas = fetch()
+        duracao_fetch = time.perf_counter() - inicio
+
+        if self.__pendente:
+            sql, params, operacao, tabela, duracao = self.__pendente
+            self.__pendente = None
+            self._registrar(sql, params, operacao, tabela, duracao + duracao_fetch, contar(linhas))
+        return linhas
+
+    def __finalizar_pendente(self):
+        if self.__pendente:
+            sql, params, operacao, tabela, duracao = self.__pendente
+            self.__pendente = None
+            self._registrar(sql, params, operacao, tabela, duracao, self.__cursor.rowcount)
+
+    def _registrar(self, sql, params, operacao, tabela, duracao, linhas):
+        SQL_DURACAO.observe(duracao, operacao=operacao, tabela=tabela)
+        SQL_TOTAL.inc(operacao=operacao, tabela=tabela)
+        SlowQueryLog.verificar(sql, params, operacao, tabela, duracao, linhas, self.__database)
+        Tracer.registrar_span(
+            f"SQL {operacao} {tabela}", duracao,
+            **{"db.system": "mysql", "db.statement": " ".join(sql.split()), "db.rows": linhas}
+        )
+
+    def __getattr__(self, nome):
+        # lastrowid, rowcount, with_rows, etc. vêm do cursor real
+        return getattr(self.__cursor, nome)
+
+
+class ConexaoInstrumentada:
+    """Envolve uma conexão do pool para devolver cursores instrumentados."""
+
+    def __init__(self, conexao, database=None):
+        self.__conexao = conexao
+        self.__database = database   # usado pelo slow-query log para capturar EXPLAIN
+
+    def cursor(self, *args, **kwargs):
+        return CursorInstrumentado(self.__conexao.cursor(*args, **kwargs), self.__database)
+
+    def __getattr__(self, nome):
+        # commit(), rollback(), close(), etc. vêm da conexão real
+        return getattr(self.__conexao, nome)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import secrets
+import threading
+import time
+
+from jwt.algorithms import get_default_algorithms
+
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+except ImportError:   # PyJWT sem o extra [crypto]
+    serialization = None
+
+
+class ChaveiroJwt:
+    """
+    Conjunto de chaves assimétricas (RS256 ou EdDSA) para assinar e verificar JWTs.
+
+    - Cada chave tem um 'kid' que vai no cabeçalho do token
+    - A chave de assinatura é trocada a cada `intervalo_rotacao` segundos; as
+      anteriores continuam disponíveis para verificação por `retencao` segundos
+    - Chaves públicas ficam pré-carregadas (objetos prontos) por kid, então a
+      verificação não faz parsing de PEM/JWK por requisição
+    - jwks() devolve o documento publicado em /.well-known/jwks.json, para que
+      outros serviços verifiquem tokens sem chamar esta API
+
+    Com `diretorio`, as chaves privadas são gravadas em PEM (<kid>.pem) e
+    compartilhadas entre processos; um kid desconhecido força recarregar o diretório.
+    """
+
+    ALGORITMOS = ("RS256", "EdDSA")
+    RECARGA_MINIMA = 5.0   # segundos entre recargas do diretório por kid desconhecido
+
+    def __init__(self, algoritmo: str = "RS256", intervalo_rotacao: int = 24 * 3600,
+                 retencao: int = 8 * 24 * 3600, diretorio: str = None):
+        if serialization is None:
+            raise RuntimeError("Assinatura assimétrica requer o pacote 'cryptography' (pip install pyjwt[crypto])")
+        if algoritmo not in ChaveiroJwt.ALGORITMOS:
+            raise ValueError(f"algoritmo deve ser um dos seguintes: {', '.join(ChaveiroJwt.ALGORITMOS)}")
+
+        self.__algoritmo = algoritmo
+        self.__intervalo_rotacao = intervalo_rotacao
+        self.__retencao = retencao
+        self.__diretorio = diretorio
+        self.__lock = threading.Lock()
+        self.__chaves = {}          # kid -> {"privada", "publica", "criada_em"}
+        self.__kid_atual = None
+        self.__jwks = None          # documento JWKS em cache (refeito quando as chaves mudam)
+        self.__ultima_recarga = 0.0
+
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+            self.__carregar_diretorio()
+        self.__rotacionar_se_necessario()
+
+    @property
+    def algoritmo(self) -> str:
+        return self.__algoritmo
+
+    def chave_assinatura(self) -> tuple[str, object]:
+        """Retorna (kid, chave privada) atual, rotacionando se o intervalo venceu."""
+        self.__rotacionar_se_necessario()
+        with self.__lock:
+            return self.__kid_atual, self.__chaves[self.__kid_atual]["privada"]
+
+    def chave_verificacao(self, kid: str):
+        """Retorna a chave pública já carregada para o kid (ou None se desconhecido)."""
+        chave = self.__chaves.get(kid)
+        if chave is None and self.__diretorio and time.time() - self.__ultima_recarga > ChaveiroJwt.RECARGA_MINIMA:
+            self.__carregar_diretorio()
+            chave = self.__chaves.get(kid)
+        return chave["publica"] if chave else None
+
+    def jwks(self) -> dict:
+        """Documento JWKS com as chaves públicas ainda válidas para verificação."""
+        self.__rotacionar_se_necessario()
+        with self.__lock:
+            if self.__jwks is None:
+                algoritmo = get_default_algorithms()[self.__algoritmo]
+                chaves = []
+                for kid, chave in self.__chaves.items():
+                    jwk = json.loads(algoritmo.to_jwk(chave["publica"]))
+                    jwk.update({"kid": kid, "alg": self.__algoritmo, "use": "sig"})
+                    chaves.append(jwk)
+                self.__jwks = {"keys": chaves}
+            return self.__jwks
+
+    def __rotacionar_se_necessario(self):
+        agora = time.time()
+        with self.__lock:
+            atual = self.__chaves.get(self.__kid_atual)
+            if atual is not None and agora - atual["criada_em"] < self.__intervalo_rotacao:
+                return
+
+            # descarta chaves cujo período de verificação acabou
+            limite = agora - self.__intervalo_rotacao - self.__retencao
+            self.__chaves = {kid: c for kid, c in self.__chaves.items() if c["criada_em"] > limite}
+
+            kid = secrets.token_hex(8)
+            privada = self.__gerar_privada()
+            self.__chaves[kid] = {"privada": privada, "publica": privada.public_key(), "criada_em": agora}
+            self.__kid_atual = kid
+            self.__jwks = None
+            print(f"🔑 ChaveiroJwt: nova chave {self.__algoritmo} kid={kid}")
+
+            if self.__diretorio:
+                self.__salvar(kid, privada)
+
+    def __gerar_privada(self):
+        if self.__algoritmo == "EdDSA":
+            return ed25519.Ed25519PrivateKey.generate()
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def __salvar(self, kid: str, privada):
+        pem = privada.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        )
+        caminho = os.path.join(self.__diretorio, f"{kid}.pem")
+        descritor = os.open(caminho, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descritor, "wb") as f:
+            f.write(pem)
+
+    def __carregar_diretorio(self):
+        self.__ultima_recarga = time.time()
+        limite = time.time() - self.__intervalo_rotacao - self.__retencao
+
+        with self.__lock:
+            for nome in os.listdir(self.__diretorio):
+                kid, extensao = os.path.splitext(nome)
+                if extensao != ".pem" or kid in self.__chaves:
+                    continue
+                caminho = os.path.join(self.__diretorio, nome)
+                criada_em = os.path.getmtime(caminho)
+                if criada_em <= limite:
+                    os.remove(caminho)
+                    continue
+                with open(caminho, "rb") as f:
+                    privada = serialization.load_pem_private_key(f.read(), password=None)
+                self.__chaves[kid] = {"privada": privada, "publica": privada.public_key(), "criada_em": criada_em}
+                self.__jwks = None
+
+            # a chave mais recente do diretório passa a assinar
+            if self.__chaves:
+                self.__kid_atual = max(self.__chaves, key=lambda k: self.__chaves[k]["criada_em"])
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+
+class ListaRevogacao:
+    """
+    Conjunto em memória dos 'jti' revogados (logout e rotação de refresh token).
+
+    - esta_revogado() é uma consulta O(1) a um dicionário jti -> exp
+    - consumir() verifica e revoga de uma vez (uso único do refresh token)
+    - Entradas somem sozinhas quando o token original expiraria
+    - A lista é por processo: revogações de outros processos não são relidas do
+      banco, então um logout vale nos demais só após reiniciá-los
+    - Persistência opcional (TokenRevogadoDAO): revogações são gravadas na tabela
+      token_revogado só para sobreviver a reinícios (recarregadas na inicialização);
+      as expiradas são apagadas por iniciar_limpeza_periodica()
+    - Ouvintes (ex.: TokenCache.revogar_jti) são avisados a cada revogação
+    """
+
+    LIMPEZA_A_CADA = 1024   # revogações entre limpezas de entradas expiradas
+
+    def __init__(self, dao=None):
+        self.__revogados = {}   # jti -> exp (epoch)
+        self.__lock = threading.Lock()
+        self.__dao = None
+        self.__ouvintes = []
+        self.__desde_limpeza = 0
+        self.__parar = threading.Event()
+        self.__thread = None
+        if dao is not None:
+            self.usar_persistencia(dao)
+
+    def usar_persistencia(self, dao):
+        """Ativa a persistência e carrega as revogações ainda válidas do banco."""
+        self.__dao = dao
+        try:
+            ativos = dao.findAtivos()
+        except Exception as e:
+            print(f"⚠️  ListaRevogacao: não foi possível carregar revogações persistidas ({e})")
+            return
+
+        with self.__lock:
+            for linha in ativos:
+                self.__revogados[linha["jti"]] = linha["expira_em"].timestamp()
+        print(f"⬆️  ListaRevogacao: {len(ativos)} tokens revogados carregados")
+
+    def adicionar_ouvinte(self, callback):
+        self.__ouvintes.append(callback)
+
+    def revogar(self, jti: str, exp: int):
+        """Revoga o token identificado por `jti` até o instante `exp` (epoch)."""
+        if not jti or exp <= time.time():
+            return
+
+        with self.__lock:
+            self.__revogados[jti] = exp
+            self.__desde_limpeza += 1
+            if self.__desde_limpeza >= ListaRevogacao.LIMPEZA_A_CADA:
+                self.__limpar_expirados()
+
+        for callback in self.__ouvintes:
+            callback(jti)
+
+        if self.__dao is not None:
+            try:
+                self.__dao.create(jti, exp)
+            except Exception as e:
+                print(f"⚠️  ListaRevogacao: falha ao persistir revogação de {jti} ({e})")
+
+    def consumir(self, jti: str, exp: int) -> bool:
+        """
+        Revoga `jti` e devolve True só para quem revogou primeiro: duas requisições
+        com o mesmo refresh token não podem as duas passar. Entre processos, quem
+        decide é a chave primária de token_revogado (INSERT ignorado = já usado).
+        """
+        if not jti or exp <= time.time():
+            return False
+
+        with self.__lock:
+            anterior = self.__revogados.get(jti)
+            if anterior is not None and anterior > time.time():
+                return False
+            self.__revogados[jti] = exp
+            self.__desde_limpeza += 1
+            if self.__desde_limpeza >= ListaRevogacao.LIMPEZA_A_CADA:
+                self.__limpar_expirados()
+
+        for callback in self.__ouvintes:
+            callback(jti)
+
+        if self.__dao is not None:
+            try:
+                if not self.__dao.createSeNovo(jti, exp):
+                    print(f"❌ ListaRevogacao: {jti} já havia sido usado em outro processo")
+                    return False
+            except Exception as e:
+                # sem banco, vale a garantia do processo (lock acima)
+                print(f"⚠️  ListaRevogacao: falha ao persistir revogação de {jti} ({e})")
+        return True
+
+    def esta_revogado(self, jti: str | None) -> bool:
+        if not jti:
+            return False
+        exp = self.__revogados.get(jti)
+        return exp is not None and exp > time.time()
+
+    def iniciar_limpeza_periodica(self, intervalo: float):
+        """Apaga as revogações expiradas (memória e token_revogado) agora e a cada `intervalo` segundos."""
+        if self.__thread is not None:
+            return
+        self.__parar.clear()
+        self.__thread = threading.Thread(target=self.__limpar_em_fundo, args=(intervalo,), name="token-revogado-limpeza", daemon=True)
+        self.__thread.start()
+
+    def parar(self):
+        self.__parar.set()
+        self.__thread = None
+
+    def __limpar_em_fundo(self, intervalo: float):
+        while not self.__parar.is_set():
+            with self.__lock:
+                self.__limpar_expirados()
+            if self.__dao is not None:
+                try:
+                    apagados = self.__dao.deleteExpirados()
+                    print(f"✅ ListaRevogacao: {apagados} revogações expiradas apagadas")
+                except Exception as e:
+                    print(f"⚠️  ListaRevogacao: falha ao apagar revogações expiradas ({e})")
+            if self.__parar.wait(intervalo):
+                break
+
+    def __limpar_expirados(self):
+        agora = time.time()
+        self.__revogados = {jti: exp for jti, exp in self.__revogados.items() if exp > agora}
+        self.__desde_limpeza = 0
@@ -4,7 +4,27 @@ import time
 import secrets
 
 class MeuTokenJWT:
-    """Classe para gerar e validar tokens JWT"""
+    """
+    Classe para gerar e validar tokens JWT
+
+    Por padrão assina com HS256 (segredo compartilhado). Com um ChaveiroJwt
+    configurado (MeuTokenJWT.configurar_chaveiro), assina com RS256/EdDSA e
+    'kid' no cabeçalho; tokens sem 'kid' (HS256) são recusados, a menos que
+    a migração informe até quando aceitá-los (aceitar_legado_ate).
+    """
+
+    _chaveiro = None      # ChaveiroJwt compartilhado por todas as instâncias
+    _legado_ate = None    # epoch até o qual tokens HS256 sem 'kid' ainda valem (None = nunca)
+
+    @staticmethod
+    def configurar_chaveiro(chaveiro, aceitar_legado_ate: float = None):
+        """
+        :param aceitar_legado_ate: epoch fixo (não relativo ao boot) até o qual tokens
+            HS256 sem 'kid' emitidos antes da troca continuam aceitos; tokens legados
+            com 'exp' depois dessa data são recusados. Padrão: desligado.
+        """
+        MeuTokenJWT._chaveiro = chaveiro
+        MeuTokenJWT._legado_ate = aceitar_legado_ate
     
     def __init__(self):
         # ⚠️ IMPORTANTE: Mova para variável de ambiente em produção!
@@ -14,6 +34,7 @@ class MeuTokenJWT:
         self._aud = "http://localhost"
         self._sub = "acesso_sistema"
         self._duracao_token = 3600  # 1 hora (recomendado ao invés de 60 dias!)
+        self._duracao_refresh = 7 * 24 * 3600  # 7 dias (renova o access token sem novo login)
         self._payload = None
         self._error_message = None
 
@@ -27,47 +48,79 @@ class MeuTokenJWT:
 
     def gerar_token(self, claims: dict) -> str:
         """
-        Gera um token JWT com os claims fornecidos
+        Gera um token JWT (access token) com os claims fornecidos
+        
+        :param claims: dict - Dados do usuário (user_id, email, role, etc)
+        :return: str - Token JWT
+        """
+        return self.__gerar(claims, "access", self._duracao_token)
+
+    def gerar_refresh_token(self, claims: dict) -> str:
+        """
+        Gera um refresh token (typ = "refresh"), aceito apenas em /auth/refresh
         
         :param claims: dict - Dados do usuário (user_id, email, role, etc)
         :return: str - Token JWT
         """
+        return self.__gerar(claims, "refresh", self._duracao_refresh)
+
+    def __gerar(self, claims: dict, tipo: str, duracao: int) -> str:
+        agora = int(time.time())
         payload = {
             "iss": self._iss,
             "aud": self._aud,
             "sub": self._sub,
-            "iat": int(time.time()),
-            "exp": int(time.time()) + self._duracao_token,
-            "nbf": int(time.time()),
+            "iat": agora,
+            "exp": agora + duracao,
+            "nbf": agora,
             "jti": secrets.token_hex(16),
+            "typ": tipo,
             **claims  # Adiciona os claims personalizados
         }
+        chaveiro = MeuTokenJWT._chaveiro
+        if chaveiro is not None:
+            kid, chave_privada = chaveiro.chave_assinatura()
+            return jwt.encode(payload, chave_privada, algorithm=chaveiro.algoritmo, headers={"kid": kid})
+
         token = jwt.encode(payload, self._key, algorithm=self._alg)
         return token
 
-    def validar_token(self, token: str) -> bool:
+    def validar_token(self, token: str, tipo: str = "access") -> bool:
         """
         Valida um token JWT
         
         :param token: str - Token JWT (pode incluir "Bearer ")
+        :param tipo: str - "access" (padrão) ou "refresh"; tokens antigos sem 'typ' contam como access
         :return: bool - True se válido, False caso contrário
         """
         if not token:
             print("❌ Token não fornecido")
             self._error_message = "Token não fornecido"
             return False
+        if not isinstance(token, str):
+            print("❌ Token com tipo inválido")
+            self._error_message = "Token inválido"
+            return False
 
         # Remove "Bearer " se presente
         token = token.replace("Bearer ", "").strip()
 
         try:
+            chave, algoritmo, legado = self.__chave_verificacao(token)
             decoded = jwt.decode(
                 token, 
-                self._key, 
-                algorithms=[self._alg], 
+                chave, 
+                algorithms=[algoritmo], 
                 audience=self._aud, 
                 issuer=self._iss
             )
+            if legado and decoded.get("exp", float("inf")) > MeuTokenJWT._legado_ate:
+                # o segredo HS256 é público: nenhum token legado pode valer além do prazo
+                raise jwt.InvalidTokenError("token HS256 legado com validade além do prazo de migração")
+            if decoded.get("typ", "access") != tipo:
+                print(f"❌ Tipo de token inválido (esperado {tipo})")
+                self._error_message = "Token inválido - tipo incorreto"
+                return False
             self._payload = decoded
             self._error_message = None
             print("✅ Token válido")
@@ -88,4 +141,25 @@ class MeuTokenJWT:
             print(f"❌ Erro ao validar token: {str(e)}")
             self._error_message = "Erro ao validar token"
         
-        return False
\ No newline at end of file
+        return False
+
+    def __chave_verificacao(self, token: str):
+        """
+        Escolhe (chave, algoritmo, legado) pelo 'kid' do cabeçalho. Sem chaveiro,
+        HS256 é o modo normal; com chaveiro, token sem 'kid' só passa dentro do
+        prazo de migração.
+        """
+        chaveiro = MeuTokenJWT._chaveiro
+        kid = jwt.get_unverified_header(token).get("kid")
+        if chaveiro is None:
+            return self._key, self._alg, False
+
+        if kid is None:
+            if MeuTokenJWT._legado_ate is None or time.time() >= MeuTokenJWT._legado_ate:
+                raise jwt.InvalidTokenError("token sem 'kid' (HS256 legado) não é mais aceito")
+            return self._key, self._alg, True
+
+        chave_publica = chaveiro.chave_verificacao(kid)
+        if chave_publica is None:
+            raise jwt.InvalidTokenError(f"kid desconhecido: {kid}")
+        return chave_publica, chaveiro.algoritmo, False
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import time
+
+import bcrypt
+
+
+class PoliticaSenha:
+    """
+    Define como as senhas devem estar armazenadas (algoritmo e custo).
+
+    - O custo do bcrypt é calibrado na inicialização para que uma verificação
+      leve aproximadamente `alvo_ms` nesta máquina.
+    - precisa_rehash() indica quando um hash salvo (ou texto plano legado)
+      deve ser regravado no formato configurado após um login bem-sucedido.
+      Só sobe o custo: a calibração varia entre processos e reinícios (ex.: 11
+      num worker, 12 em outro) e hashes com custo maior que o alvo ficam como estão.
+    """
+
+    ALGORITMOS = ("bcrypt",)
+
+    def __init__(self, algoritmo: str = "bcrypt", custo: int = 12):
+        if algoritmo not in PoliticaSenha.ALGORITMOS:
+            raise ValueError(f"algoritmo deve ser um dos seguintes: {', '.join(PoliticaSenha.ALGORITMOS)}")
+        if not 4 <= custo <= 31:
+            raise ValueError("custo do bcrypt deve estar entre 4 e 31.")
+        self.__algoritmo = algoritmo
+        self.__custo = custo
+
+    @property
+    def algoritmo(self) -> str:
+        return self.__algoritmo
+
+    @property
+    def custo(self) -> int:
+        return self.__custo
+
+    @staticmethod
+    def calibrar(alvo_ms: float = 250, custo_minimo: int = 10, custo_maximo: int = 14) -> "PoliticaSenha":
+        """
+        Mede o bcrypt no custo mínimo e escolhe o maior custo cuja estimativa
+        fique dentro do alvo (cada +1 no custo dobra o tempo).
+
+        Exemplo:
+        >>> politica = PoliticaSenha.calibrar(alvo_ms=250)
+        >>> politica.custo   # ex.: 12 em um servidor comum
+        """
+        salt = bcrypt.gensalt(custo_minimo)
+        inicio = time.perf_counter()
+        bcrypt.hashpw(b"calibracao-do-custo", salt)
+        medido_ms = (time.perf_counter() - inicio) * 1000
+
+        custo = custo_minimo
+        while custo < custo_maximo and medido_ms * 2 <= alvo_ms:
+            custo += 1
+            medido_ms *= 2
+
+        print(f"🔐 PoliticaSenha: bcrypt custo {custo} (~{medido_ms:.0f} ms por verificação)")
+        return PoliticaSenha("bcrypt", custo)
+
+    def gerar_hash(self, senha: str) -> str:
+        return bcrypt.hashpw(senha.encode("utf-8"), bcrypt.gensalt(self.__custo)).decode("utf-8")
+
+    def precisa_rehash(self, senha_hash: str) -> bool:
+        """
+        True se o valor salvo não for bcrypt ou tiver custo abaixo do configurado.
+
+        O custo só sobe, nunca desce. O custo calibrado muda entre processos e
+        reinícios pelo ruído da medição, e com `!=` dois workers (11 e 12)
+        regravariam o mesmo hash a cada login. Um hash acima do alvo só custa mais
+        tempo no login desse usuário, limitado por custo_maximo em calibrar().
+        Para baixar o custo de propósito, os hashes precisam ser regerados (ex.:
+        troca de senha), não migrados no login.
+
+        Exemplo:
+        >>> PoliticaSenha("bcrypt", 12).precisa_rehash("admin123")     # texto plano
+        True
+        >>> PoliticaSenha("bcrypt", 12).precisa_rehash("$2b$10$...")   # custo antigo
+        True
+        >>> PoliticaSenha("bcrypt", 11).precisa_rehash("$2b$12$...")   # custo maior: mantém
+        False
+        """
+        if not senha_hash or not senha_hash.startswith("$2"):
+            return True
+
+        # formato: $2b$<custo>$<salt+hash>
+        partes = senha_hash.split("$")
+        try:
+            return int(partes[2]) < self.__custo
+        except (IndexError, ValueError):
+            return True
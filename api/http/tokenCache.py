@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import threading
+import time
+
+from api.utils.cache import LRUCache
+from api.utils.metrics import Metrics
+
+
+class TokenCache:
+    """
+    Cache de tokens JWT já verificados.
+
+    - Chave: SHA-256 do token (o token em si não fica na memória do cache)
+    - Valor: payload decodificado, válido até o 'exp' do próprio token
+    - revogar_jti(): remove do cache todo token com aquele 'jti', para que
+      a próxima chamada passe de novo pela verificação completa
+
+    Com o cache, chamadas repetidas com o mesmo bearer token custam um hash
+    e uma consulta a dicionário em vez de HMAC + validação de claims.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.__cache = LRUCache(maxsize=maxsize)
+        self.__por_jti = {}   # jti -> digest
+        self.__lock = threading.Lock()
+        self.__consultas = Metrics.counter("jwt_cache_lookups_total", "Consultas ao cache de tokens verificados", ("resultado",))
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> dict | None:
+        payload = self.__cache.get(TokenCache.digest(token))
+        self.__consultas.inc(resultado="hit" if payload is not None else "miss")
+        return payload
+
+    def put(self, token: str, payload: dict):
+        exp = payload.get("exp")
+        if exp is None:
+            return
+
+        restante = exp - time.time()
+        if restante <= 0:
+            return
+
+        chave = TokenCache.digest(token)
+        self.__cache.set(chave, payload, expira_em=time.monotonic() + restante)
+
+        jti = payload.get("jti")
+        if jti:
+            with self.__lock:
+                self.__por_jti[jti] = chave
+                # descarta índices de tokens que já saíram do cache
+                if len(self.__por_jti) > 2 * max(len(self.__cache), 1024):
+                    self.__por_jti = {j: c for j, c in self.__por_jti.items() if self.__cache.get(c) is not None}
+
+    def revogar_jti(self, jti: str):
+        """Hook de revogação: invalida o payload em cache do token com este 'jti'."""
+        with self.__lock:
+            chave = self.__por_jti.pop(jti, None)
+        if chave is not None:
+            self.__cache.delete(chave)
+
+    def clear(self):
+        with self.__lock:
+            self.__por_jti.clear()
+        self.__cache.clear()
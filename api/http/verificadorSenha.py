@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturoTimeout
+
+import bcrypt
+
+from api.utils.metrics import Metrics
+
+
+class VerificadorSaturado(Exception):
+    """Lançada quando o pool de verificação de senhas está cheio (resposta 503 imediata)."""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Verificador de senhas saturado")
+        self.retry_after = retry_after
+
+
+class VerificadorSenha:
+    """
+    Executa bcrypt.checkpw em um pool dedicado e limitado de threads.
+
+    Objetivos:
+    - Tirar o custo de CPU do bcrypt (custo 12 ≈ centenas de ms) das threads
+      que atendem o restante da API.
+    - Aplicar backpressure: no máximo `max_workers` verificações rodando e
+      `max_fila` aguardando; além disso a chamada falha na hora (503).
+
+    O bcrypt libera o GIL durante o hash, então threads bastam para usar
+    vários núcleos sem o custo de serializar dados para processos.
+    """
+
+    def __init__(self, max_workers: int = None, max_fila: int = 16, timeout: float = 5.0):
+        self.__max_workers = max_workers or max(1, min(4, (os.cpu_count() or 2) // 2))
+        self.__timeout = timeout
+        self.__executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="bcrypt")
+        # vagas = em execução + na fila
+        self.__vagas = threading.BoundedSemaphore(self.__max_workers + max_fila)
+        self.__ocupadas = Metrics.gauge("auth_bcrypt_inflight", "Verificações bcrypt em execução ou na fila")
+        self.__rejeitadas = Metrics.counter("auth_bcrypt_rejected_total", "Verificações bcrypt rejeitadas por saturação")
+        self.__duracao = Metrics.histogram("auth_bcrypt_seconds", "Duração do bcrypt.checkpw no pool")
+
+    def verificar(self, senha: str, senha_hash: str) -> bool:
+        """
+        Compara a senha com o hash bcrypt no pool dedicado.
+
+        :raises VerificadorSaturado: se não houver vaga ou a espera exceder o timeout
+        """
+        return self.executar(self.__checkpw, senha.encode("utf-8"), senha_hash.encode("utf-8"))
+
+    def executar(self, funcao, *args):
+        """Roda `funcao(*args)` no pool respeitando o limite de vagas."""
+        if not self.__vagas.acquire(blocking=False):
+            self.__rejeitadas.inc()
+            raise VerificadorSaturado()
+
+        self.__ocupadas.inc()
+        try:
+            futuro = self.__executor.submit(funcao, *args)
+        except Exception:
+            self.__liberar()
+            raise
+        futuro.add_done_callback(lambda _: self.__liberar())
+
+        try:
+            return futuro.result(timeout=self.__timeout)
+        except FuturoTimeout:
+            self.__rejeitadas.inc()
+            raise VerificadorSaturado()
+
+    def agendar(self, funcao, *args) -> bool:
+        """
+        Agenda `funcao(*args)` no pool sem esperar o resultado (ex.: rehash após o login).
+
+        :return: False se não houver vaga (a tarefa é descartada)
+        """
+        if not self.__vagas.acquire(blocking=False):
+            return False
+
+        self.__ocupadas.inc()
+        try:
+            futuro = self.__executor.submit(funcao, *args)
+        except Exception:
+            self.__liberar()
+            raise
+        futuro.add_done_callback(self.__concluir_agendada)
+        return True
+
+    def __concluir_agendada(self, futuro):
+        self.__liberar()
+        erro = futuro.exception()
+        if erro is not None:
+            print(f"❌ Tarefa agendada no VerificadorSenha falhou: {erro}")
+
+    def __checkpw(self, senha: bytes, senha_hash: bytes) -> bool:
+        inicio = time.perf_counter()
+        try:
+            return bcrypt.checkpw(senha, senha_hash)
+        finally:
+            self.__duracao.observe(time.perf_counter() - inicio)
+
+    def __liberar(self):
+        self.__ocupadas.dec()
+        self.__vagas.release()
+
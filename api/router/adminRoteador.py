@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import math
+
+from flask import Blueprint, Response, jsonify, request
+from api.Middleware.jwt_middleware import JwtMiddleware
+from api.utils.profiler import SamplingProfiler
+
+class AdminRoteador:
+    """
+    Classe responsável pelas rotas administrativas (diagnóstico do servidor).
+
+    Rotas:
+    - GET /profile -> liga o profiler por amostragem por N segundos e devolve o flamegraph
+    """
+
+    def __init__(self, jwt_middleware: JwtMiddleware):
+        print("⬆️  AdminRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__blueprint = Blueprint('admin', __name__)
+
+    def create_routes(self):
+
+        # GET /profile?segundos=10&formato=collapsed|speedscope&intervalo_ms=5
+        @self.__blueprint.route('/profile', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        @self.__jwt_middleware.require_role("admin")
+        def profile():
+            print("🔵 AdminRoteador.profile()")
+
+            try:
+                segundos = float(request.args.get("segundos", 10))
+                intervalo_ms = float(request.args.get("intervalo_ms", SamplingProfiler.INTERVALO_PADRAO * 1000))
+            except ValueError:
+                return jsonify({
+                    "success": False,
+                    "error": {"message": "'segundos' e 'intervalo_ms' devem ser numéricos"}
+                }), 400
+
+            # float() aceita "nan" e "inf", que derrubariam o time.sleep() da thread amostradora
+            if not math.isfinite(segundos) or not math.isfinite(intervalo_ms):
+                return jsonify({
+                    "success": False,
+                    "error": {"message": "'segundos' e 'intervalo_ms' devem ser números finitos"}
+                }), 400
+
+            formato = request.args.get("formato", "collapsed")
+            if formato not in ("collapsed", "speedscope"):
+                return jsonify({
+                    "success": False,
+                    "error": {"message": "formato deve ser 'collapsed' ou 'speedscope'"}
+                }), 400
+
+            profiler = SamplingProfiler(intervalo=max(intervalo_ms, 1) / 1000)
+            if not profiler.executar(segundos):
+                return jsonify({
+                    "success": False,
+                    "error": {"message": "Já existe uma sessão de profiling em andamento"}
+                }), 409
+
+            print(f"✅ Profiling concluído: {profiler.total_amostras} amostras")
+
+            if formato == "speedscope":
+                return jsonify(profiler.speedscope()), 200
+            return Response(profiler.collapsed(), mimetype="text/plain; charset=utf-8")
+
+        return self.__blueprint
@@ -1,15 +1,67 @@
 # -*- coding: utf-8 -*-
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, g
 from api.http.meu_token_jwt import MeuTokenJWT
+from api.Middleware.jwt_middleware import JwtMiddleware
 from api.dao.usuariosDAO import UsuarioDAO
-import bcrypt
+from api.modelo.usuarios import Usuario
+from api.http.verificadorSenha import VerificadorSenha, VerificadorSaturado
+from api.http.politicaSenha import PoliticaSenha
+from api.utils.rateLimiter import RateLimiter
 
 class AuthRoteador:
-    def __init__(self, database):
+    def __init__(self, database, verificador_senha: VerificadorSenha = None, politica_senha: PoliticaSenha = None,
+                 jwt_middleware: JwtMiddleware = None, rate_limiter: RateLimiter = None):
         print("⬆️  AuthRoteador.__init__()")
         self.__database = database
         self.__usuario_dao = UsuarioDAO(database)
+        # bcrypt roda em pool dedicado e limitado (injeção de dependência)
+        self.__verificador_senha = verificador_senha or VerificadorSenha()
+        # algoritmo/custo desejados; hashes antigos e texto plano são migrados no login
+        self.__politica_senha = politica_senha or PoliticaSenha()
+        # validação do access token e lista de revogação compartilhadas com as demais rotas
+        self.__jwt_middleware = jwt_middleware or JwtMiddleware()
+        # throttling do login por IP e por email (regras "login_ip" e "login_email")
+        self.__rate_limiter = rate_limiter or AuthRoteador.rate_limiter_padrao()
         self.__blueprint = Blueprint('auth', __name__)
+
+    @staticmethod
+    def rate_limiter_padrao(backend=None) -> RateLimiter:
+        """Regras de login: rajada de 20 por IP e 5 por conta, recarregando por minuto."""
+        return RateLimiter(backend) \
+            .regra("login_ip", capacidade=20, por_minuto=20) \
+            .regra("login_email", capacidade=5, por_minuto=5)
+
+    def __limitar(self, regra: str, chave: str):
+        """Retorna a resposta 429 se o limite da regra estourou, senão None."""
+        retry_after = self.__rate_limiter.verificar(regra, chave)
+        if not retry_after:
+            return None
+
+        print(f"⚠️  Rate limit '{regra}' atingido para {chave}")
+        response = jsonify({
+            "success": False,
+            "error": {"message": "Muitas tentativas de login, tente novamente mais tarde", "code": "RATE_LIMITED"}
+        })
+        response.headers["Retry-After"] = str(retry_after)
+        return response, 429
+
+    @staticmethod
+    def __corpo_refresh_invalido(body):
+        """Retorna a resposta 400 se o corpo não é um objeto ou 'refresh_token' não é string, senão None."""
+        if isinstance(body, dict) and (body.get('refresh_token') is None or isinstance(body['refresh_token'], str)):
+            return None
+
+        print("❌ Corpo ou refresh_token com tipo inválido")
+        return jsonify({
+            "success": False,
+            "error": {"message": "O corpo deve ser um objeto e 'refresh_token' uma string"}
+        }), 400
+
+    def __migrar_senha(self, usuario: Usuario, senha: str):
+        """Regrava a senha no algoritmo/custo configurado (executa no pool do bcrypt)."""
+        novo_hash = self.__politica_senha.gerar_hash(senha)
+        if self.__usuario_dao.updateSenha(usuario.idUsuario, novo_hash, usuario.senha):
+            print(f"🔐 Senha do usuário {usuario.idUsuario} migrada para bcrypt custo {self.__politica_senha.custo}")
     
     def create_routes(self):
         
@@ -25,12 +77,17 @@ class AuthRoteador:
                 response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
                 response.headers.add('Access-Control-Allow-Methods', 'POST,OPTIONS')
                 return response, 200
+
+            # Throttling por IP antes de qualquer trabalho (parse, banco, bcrypt)
+            limitado = self.__limitar("login_ip", request.remote_addr or "desconhecido")
+            if limitado:
+                return limitado
             
             body = request.get_json()
             
             print(f"📦 Body recebido: {body}")
             
-            if not body or 'usuario' not in body:
+            if not isinstance(body, dict) or not isinstance(body.get('usuario'), dict):
                 print("❌ Campo 'usuario' não encontrado no body")
                 return jsonify({
                     "success": False,
@@ -40,6 +97,14 @@ class AuthRoteador:
             usuario_data = body['usuario']
             email = usuario_data.get('email')
             senha = usuario_data.get('senha')
+
+            # checado antes dos prints, do strip()/lower() e do bcrypt: número, lista etc. viravam 500
+            if (email is not None and not isinstance(email, str)) or (senha is not None and not isinstance(senha, str)):
+                print("❌ Email ou senha com tipo inválido")
+                return jsonify({
+                    "success": False,
+                    "error": {"message": "Email e senha devem ser strings"}
+                }), 400
             
             print(f"📧 Email recebido: {email}")
             print(f"🔑 Senha recebida: {'*' * len(senha) if senha else 'vazia'}")
@@ -50,6 +115,11 @@ class AuthRoteador:
                     "success": False,
                     "error": {"message": "Email e senha são obrigatórios"}
                 }), 400
+
+            # Throttling por conta: limita tentativas distribuídas entre vários IPs
+            limitado = self.__limitar("login_email", email.strip().lower())
+            if limitado:
+                return limitado
             
             # Busca usuário no banco
             usuario = self.__usuario_dao.findByEmail(email)
@@ -63,8 +133,9 @@ class AuthRoteador:
                     "error": {"message": "Email ou senha inválidos"}
                 }), 401
             
-            senha_hash = usuario['senha']
+            senha_hash = usuario.senha
             senha_valida = False
+            senha_verificada = False   # True apenas quando conferida contra o valor salvo
             
             print(f"🔍 Senha fornecida: {senha}")
             print(f"🔍 Senha no banco: {senha_hash}")
@@ -73,12 +144,18 @@ class AuthRoteador:
             if senha_hash.startswith("$2"):  # É um hash bcrypt
                 try:
                     print("🔐 Tentando verificação bcrypt...")
-                    senha_bytes = senha.encode('utf-8')
-                    hash_bytes = senha_hash.encode('utf-8')
-                    
-                    senha_valida = bcrypt.checkpw(senha_bytes, hash_bytes)
+                    senha_valida = self.__verificador_senha.verificar(senha, senha_hash)
+                    senha_verificada = senha_valida
                     print(f"🔐 Resultado bcrypt: {senha_valida}")
                     
+                except VerificadorSaturado as e:
+                    print("⚠️  Pool de verificação bcrypt saturado")
+                    response = jsonify({
+                        "success": False,
+                        "error": {"message": "Serviço de autenticação sobrecarregado, tente novamente", "code": "AUTH_BUSY"}
+                    })
+                    response.headers["Retry-After"] = str(e.retry_after)
+                    return response, 503
                 except Exception as e:
                     print(f"❌ Erro bcrypt: {e}")
                     senha_valida = False
@@ -86,6 +163,7 @@ class AuthRoteador:
             # Método 2: Comparação direta (fallback para desenvolvimento)
             if not senha_valida and senha_hash == senha:
                 senha_valida = True
+                senha_verificada = True
                 print("✅ Senha válida (texto plano)")
             
             # Método 3: Fallback específico para desenvolvimento
@@ -103,31 +181,38 @@ class AuthRoteador:
                     "error": {"message": "Email ou senha inválidos"}
                 }), 401
             
+            # Migra texto plano / custo antigo para o formato configurado (em segundo plano)
+            if senha_verificada and self.__politica_senha.precisa_rehash(senha_hash):
+                if not self.__verificador_senha.agendar(self.__migrar_senha, usuario, senha):
+                    print("⚠️  Pool do bcrypt cheio, migração de senha adiada para o próximo login")
+
             # Gera token JWT
             jwt_instance = MeuTokenJWT()
             token_payload = {
-                "user_id": usuario['idUsuario'],
-                "email": usuario['email'],
-                "role": usuario['role'],
-                "name": usuario['nome']
+                "user_id": usuario.idUsuario,
+                "email": usuario.email,
+                "role": usuario.role,
+                "name": usuario.nome
             }
             
             print(f"🎫 Gerando token com payload: {token_payload}")
             
             token = jwt_instance.gerar_token(token_payload)
+            refresh_token = jwt_instance.gerar_refresh_token(token_payload)
             
-            print(f"✅ Login bem-sucedido para: {usuario['email']}")
+            print(f"✅ Login bem-sucedido para: {usuario.email}")
             
             response_data = {
                 "success": True,
                 "message": "Login realizado com sucesso",
                 "data": {
                     "token": token,
+                    "refresh_token": refresh_token,
                     "user": {
-                        "id": usuario['idUsuario'],
-                        "email": usuario['email'],
-                        "name": usuario['nome'],
-                        "role": usuario['role']
+                        "id": usuario.idUsuario,
+                        "email": usuario.email,
+                        "name": usuario.nome,
+                        "role": usuario.role
                     }
                 }
             }
@@ -135,5 +220,87 @@ class AuthRoteador:
             response = jsonify(response_data)
             response.headers.add('Access-Control-Allow-Origin', '*')
             return response, 200
+
+        @self.__blueprint.route('/refresh', methods=['POST'])
+        def refresh():
+            """
+            Troca um refresh token válido por um novo par (access + refresh).
+            O refresh token usado é revogado (rotação), então só vale uma vez.
+            Email, role e nome vêm do banco: mudanças de papel valem na renovação
+            e usuários removidos/inativados não renovam.
+            """
+            print("🔵 AuthRoteador.refresh()")
+            body = request.get_json(silent=True) or {}
+            invalido = AuthRoteador.__corpo_refresh_invalido(body)
+            if invalido:
+                return invalido
+            refresh_token = body.get('refresh_token')
+
+            jwt_instance = MeuTokenJWT()
+            lista_revogacao = self.__jwt_middleware.lista_revogacao
+            # consumir() verifica e revoga atomicamente: o mesmo refresh token só renova uma vez
+            if not jwt_instance.validar_token(refresh_token, tipo="refresh") \
+                    or not lista_revogacao.consumir(jwt_instance.payload.get('jti'), jwt_instance.payload.get('exp', 0)):
+                return jsonify({
+                    "success": False,
+                    "error": {
+                        "message": jwt_instance.error_message or "Refresh token revogado",
+                        "code": "INVALID_TOKEN"
+                    }
+                }), 401
+
+            user_id = jwt_instance.payload.get('user_id')
+            usuario = self.__usuario_dao.findById(user_id) if isinstance(user_id, int) else None
+            if not usuario:
+                print(f"❌ Usuário {user_id} inexistente ou inativo")
+                return jsonify({
+                    "success": False,
+                    "error": {"message": "Usuário inexistente ou inativo", "code": "INVALID_TOKEN"}
+                }), 401
+
+            token_payload = {
+                "user_id": usuario.idUsuario,
+                "email": usuario.email,
+                "role": usuario.role,
+                "name": usuario.nome
+            }
+            print(f"✅ Tokens renovados para: {token_payload['email']}")
+
+            return jsonify({
+                "success": True,
+                "message": "Token renovado com sucesso",
+                "data": {
+                    "token": jwt_instance.gerar_token(token_payload),
+                    "refresh_token": jwt_instance.gerar_refresh_token(token_payload)
+                }
+            }), 200
+
+        @self.__blueprint.route('/logout', methods=['POST'])
+        @self.__jwt_middleware.validate_token
+        def logout():
+            """
+            Revoga o access token do cabeçalho Authorization e, se enviado
+            no corpo, o refresh token do mesmo usuário.
+            """
+            print("🔵 AuthRoteador.logout()")
+            body = request.get_json(silent=True) or {}
+            invalido = AuthRoteador.__corpo_refresh_invalido(body)
+            if invalido:
+                return invalido
+
+            lista_revogacao = self.__jwt_middleware.lista_revogacao
+            lista_revogacao.revogar(g.jwt_payload.get('jti'), g.jwt_payload.get('exp', 0))
+
+            refresh_token = body.get('refresh_token')
+            if refresh_token:
+                jwt_instance = MeuTokenJWT()
+                if jwt_instance.validar_token(refresh_token, tipo="refresh") \
+                        and jwt_instance.payload.get('user_id') == g.jwt_payload.get('user_id'):
+                    lista_revogacao.revogar(jwt_instance.payload['jti'], jwt_instance.payload['exp'])
+
+            return jsonify({
+                "success": True,
+                "message": "Logout realizado com sucesso"
+            }), 200
         
         return self.__blueprint
\ No newline at end of file
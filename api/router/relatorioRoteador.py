@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from flask import Blueprint
+from api.Middleware.jwt_middleware import JwtMiddleware
+from api.controle.relatorioControl import RelatorioControl
+
+class RelatorioRoteador:
+    """
+    Classe responsável pelas rotas de relatórios gerenciais.
+
+    Rotas:
+    - GET /mensal        -> ocupação, estadia média e reservas por hotel e mês (admin, gerente)
+    - POST /reconstruir  -> recalcula o agregado reserva_diaria (admin)
+    """
+
+    def __init__(self, jwt_middleware: JwtMiddleware, relatorio_control: RelatorioControl):
+        print("⬆️  RelatorioRoteador.__init__()")
+        self.__jwt_middleware = jwt_middleware
+        self.__relatorio_control = relatorio_control
+        self.__blueprint = Blueprint('relatorio', __name__)
+
+    def create_routes(self):
+
+        # GET /mensal?desde=2025-01&ate=2025-06&idHotel=3
+        @self.__blueprint.route('/mensal', methods=['GET'])
+        @self.__jwt_middleware.validate_token
+        @self.__jwt_middleware.require_role("admin", "gerente")
+        def mensal():
+            return self.__relatorio_control.mensal()
+
+        # POST /reconstruir -> fora do ciclo periódico (ex.: após carga direta no banco)
+        @self.__blueprint.route('/reconstruir', methods=['POST'])
+        @self.__jwt_middleware.validate_token
+        @self.__jwt_middleware.require_role("admin")
+        def reconstruir():
+            return self.__relatorio_control.reconstruir()
+
+        return self.__blueprint
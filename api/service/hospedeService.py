@@ -2,6 +2,7 @@
 from api.dao.hospedeDAO import HospedeDAO
 from api.modelo.hospede import Hospede
 from api.utils.errorResponse import ErrorResponse
+from api.utils.serviceCache import ServiceCache
 
 """
 Classe responsável pela camada de serviço para a entidade Hospede.
@@ -12,14 +13,16 @@ Observações sobre injeção de dependência:
   do DAO concreto, facilitando testes unitários e substituição por mocks.
 """
 class HospedeService:
-    def __init__(self, Hospede_dao_dependency: HospedeDAO):
+    def __init__(self, Hospede_dao_dependency: HospedeDAO, cache: ServiceCache = None):
         """
         Construtor da classe HospedeService
 
         :param Hospede_dao_dependency: HospedeDAO - Instância de HospedeDAO
+        :param cache: ServiceCache - cache de leituras compartilhado entre os serviços (opcional)
         """
         print("⬆️  HospedeService.__init__()")
         self.__HospedeDAO = Hospede_dao_dependency  # injeção de dependência
+        self.__cache = cache or ServiceCache.desativado()
 
     def createHospede(self, HospedeBodyRequest: dict) -> int:
         """
@@ -34,45 +37,55 @@ class HospedeService:
         """
         print("🟣 HospedeService.createHospede()")
 
-        hospede = Hospede()
-        hospede.nomeHospede = HospedeBodyRequest.get("nomeHospede")
-        hospede.email = HospedeBodyRequest.get("email")
-        hospede.telefone = HospedeBodyRequest.get("telefone")
-        hospede.requisicao = HospedeBodyRequest.get("requisicao")
-        hospede.cpf = HospedeBodyRequest.get("cpf")
+        # corpo já validado e tipado pelo HospedeMiddleware.ESQUEMA
+        hospede = Hospede(
+            nome=HospedeBodyRequest["nomeHospede"],
+            cpf=HospedeBodyRequest["cpf"],
+            email=HospedeBodyRequest["email"],
+            telefone=HospedeBodyRequest["telefone"],
+            requisicao=HospedeBodyRequest.get("requisicao"),
+        )
 
         # valida regra de negócio: Hospede duplicado
-        resultado = self.__HospedeDAO.findByField("nome", hospede.nomeHospede)
+        resultado = self.__HospedeDAO.findByField("nome", hospede.nome)
         if resultado and len(resultado) > 0:
             raise ErrorResponse(
                 400,
                 "Hospede já existe",
-                {"message": f"O Hospede {hospede.nomeHospede} já existe"}
+                {"message": f"O Hospede {hospede.nome} já existe"}
             )
 
-        return self.__HospedeDAO.create(hospede)
+        novo_id = self.__HospedeDAO.create(hospede)
+        self.__cache.invalidar_lista("hospede")
+        return novo_id
 
-    def findAll(self) -> list[dict]:
+    def findAll(self) -> list[Hospede]:
         """
         Retorna todos os Hospedes
-        :return: list[dict]
+        :return: list[Hospede]
         """
         print("🟣 HospedeService.findAll()")
-        return self.__HospedeDAO.findAll()
+        return self.__cache.lista("hospede", "todos", self.__HospedeDAO.findAll)
 
-    def findById(self, idHospede: int) -> dict | None:
+    def versaoLista(self) -> str | None:
+        """Versão atual da listagem de Hospedes (ETag); None se não houver cache."""
+        return self.__cache.versao_lista("hospede")
+
+    def versaoItem(self, idHospede: int) -> str | None:
+        """Versão atual de um Hospede (ETag); None se não houver cache."""
+        return self.__cache.versao_item("hospede", idHospede)
+
+    def findById(self, idHospede: int) -> Hospede | None:
         """
         Retorna um Hospede por ID.
 
         :param idHospede: int
-        :return: dict | None
+        :return: Hospede | None
         """
         print("🟣 HospedeService.findById()")
 
-        hospede = Hospede()
-        hospede.idHospede = idHospede  # passa pela validação de domínio
-
-        return self.__HospedeDAO.findById(hospede.idHospede)
+        idHospede = int(idHospede)
+        return self.__cache.item("hospede", idHospede, lambda: self.__HospedeDAO.findById(idHospede))
 
     def updateHospede(self, idHospede: int, jsonHospede: dict) -> bool:
         print (jsonHospede)
@@ -84,19 +97,22 @@ class HospedeService:
         :param idHospede: int - Identificador do Hospede a ser atualizado
         :param jsonHospede: dict - Dados do Hospede {"nomeHospede", "email", "telefone", "requisicao", "cpf"}
         :return: bool - True se atualizado com sucesso
-        :raises ValueError: se idHospede ou nomeHospede não atenderem às regras de domínio
+        (corpo já validado pelo HospedeMiddleware.ESQUEMA)
         """
         print("🟣 HospedeService.updateHospede()")
 
-        hospede = Hospede()
-        hospede.idHospede = idHospede
-        hospede.nomeHospede = jsonHospede.get("nomeHospede")
-        hospede.email = jsonHospede.get("email")
-        hospede.telefone = jsonHospede.get("telefone")
-        hospede.requisicao = jsonHospede.get("requisicao")
-        hospede.cpf = jsonHospede.get("cpf")
+        hospede = Hospede(
+            idHospede=int(idHospede),
+            nome=jsonHospede["nomeHospede"],
+            cpf=jsonHospede["cpf"],
+            email=jsonHospede["email"],
+            telefone=jsonHospede["telefone"],
+            requisicao=jsonHospede.get("requisicao"),
+        )
 
-        return self.__HospedeDAO.update(hospede)
+        resultado = self.__HospedeDAO.update(hospede)
+        self.__cache.invalidar_item("hospede", hospede.idHospede)
+        return resultado
 
     def deleteHospede(self, idHospede: int) -> bool:
         """
@@ -107,7 +123,10 @@ class HospedeService:
         """
         print("🟣 HospedeService.deleteHospede()")
 
-        hospede = Hospede()
-        hospede.idHospede = idHospede  # validação de regra de domínio
+        hospede = Hospede(idHospede=int(idHospede))
 
-        return self.__HospedeDAO.delete(hospede)
\ No newline at end of file
+        resultado = self.__HospedeDAO.delete(hospede)
+        self.__cache.invalidar_item("hospede", hospede.idHospede)
+        # ON DELETE CASCADE remove as reservas do hospede no banco
+        self.__cache.invalidar_tudo("reserva")
+        return resultado
\ No newline at end of file
@@ -2,6 +2,7 @@
 from api.dao.hotelDAO import HotelDAO
 from api.modelo.hotel import Hotel
 from api.utils.errorResponse import ErrorResponse
+from api.utils.serviceCache import ServiceCache
 
 """
 Classe responsável pela camada de serviço para a entidade Hotel.
@@ -12,14 +13,16 @@ Observações sobre injeção de dependência:
   do DAO concreto, facilitando testes unitários e substituição por mocks.
 """
 class HotelService:
-    def __init__(self, Hotel_dao_dependency: HotelDAO):
+    def __init__(self, Hotel_dao_dependency: HotelDAO, cache: ServiceCache = None):
         """
         Construtor da classe HotelService
 
         :param Hotel_dao_dependency: HotelDAO - Instância de HotelDAO
+        :param cache: ServiceCache - cache de leituras compartilhado entre os serviços (opcional)
         """
         print("⬆️  HotelService.__init__()")
         self.__HotelDAO = Hotel_dao_dependency  # injeção de dependência
+        self.__cache = cache or ServiceCache.desativado()
 
     def createHotel(self, HotelBodyRequest: dict) -> int:
         """
@@ -34,10 +37,8 @@ class HotelService:
         """
         print("🟣 HotelService.createHotel()")
 
-        hotel = Hotel()
-        hotel.nome = HotelBodyRequest.get("nome")
-        hotel.capacidade = HotelBodyRequest.get("capacidade")
-
+        # corpo já validado e tipado pelo HotelMiddleware.ESQUEMA
+        hotel = Hotel(nome=HotelBodyRequest["nome"], capacidade=HotelBodyRequest["capacidade"])
 
         # valida regra de negócio: Hotel duplicado
         resultado = self.__HotelDAO.findByField("nome", hotel.nome)
@@ -48,29 +49,37 @@ class HotelService:
                 {"message": f"O Hotel {hotel.nome} já existe"}
             )
 
-        return self.__HotelDAO.create(hotel)
+        novo_id = self.__HotelDAO.create(hotel)
+        self.__cache.invalidar_lista("hotel")
+        return novo_id
 
-    def findAll(self) -> list[dict]:
+    def findAll(self) -> list[Hotel]:
         """
         Retorna todos os Hoteis
-        :return: list[dict]
+        :return: list[Hotel]
         """
         print("🟣 HotelService.findAll()")
-        return self.__HotelDAO.findAll()
+        return self.__cache.lista("hotel", "todos", self.__HotelDAO.findAll)
+
+    def versaoLista(self) -> str | None:
+        """Versão atual da listagem de Hoteis (ETag); None se não houver cache."""
+        return self.__cache.versao_lista("hotel")
 
-    def findById(self, idHotel: int) -> dict | None:
+    def versaoItem(self, idHotel: int) -> str | None:
+        """Versão atual de um Hotel (ETag); None se não houver cache."""
+        return self.__cache.versao_item("hotel", idHotel)
+
+    def findById(self, idHotel: int) -> Hotel | None:
         """
         Retorna um Hotel por ID.
 
         :param idHotel: int
-        :return: dict | None
+        :return: Hotel | None
         """
         print("🟣 HotelService.findById()")
 
-        hotel = Hotel()
-        hotel.idHotel = idHotel  # passa pela validação de domínio
-
-        return self.__HotelDAO.findById(hotel.idHotel)
+        idHotel = int(idHotel)
+        return self.__cache.item("hotel", idHotel, lambda: self.__HotelDAO.findById(idHotel))
 
     def updateHotel(self, idHotel: int, jsonHotel: dict) -> bool:
         print (jsonHotel)
@@ -82,16 +91,15 @@ class HotelService:
         :param idHotel: int - Identificador do Hotel a ser atualizado
         :param jsonHotel: dict - Dados do Hotel {"nomeHotel", "email", "telefone", "requisicao", "cpf"}
         :return: bool - True se atualizado com sucesso
-        :raises ValueError: se idHotel ou nomeHotel não atenderem às regras de domínio
+        (corpo já validado pelo HotelMiddleware.ESQUEMA)
         """
         print("🟣 HotelService.updateHotel()")
 
-        hotel = Hotel()
-        hotel.idHotel = idHotel
-        hotel.nome = jsonHotel.get("nome")
-        hotel.capacidade = jsonHotel.get("capacidade")
+        hotel = Hotel(idHotel=int(idHotel), nome=jsonHotel["nome"], capacidade=jsonHotel["capacidade"])
 
-        return self.__HotelDAO.update(hotel)
+        resultado = self.__HotelDAO.update(hotel)
+        self.__cache.invalidar_item("hotel", hotel.idHotel)
+        return resultado
 
     def deleteHotel(self, idHotel: int) -> bool:
         """
@@ -102,7 +110,10 @@ class HotelService:
         """
         print("🟣 HotelService.deleteHotel()")
 
-        hotel = Hotel()
-        hotel.idHotel = idHotel  # validação de regra de domínio
+        hotel = Hotel(idHotel=int(idHotel))
 
-        return self.__HotelDAO.delete(hotel)
\ No newline at end of file
+        resultado = self.__HotelDAO.delete(hotel)
+        self.__cache.invalidar_item("hotel", hotel.idHotel)
+        # ON DELETE CASCADE remove as reservas do hotel no banco
+        self.__cache.invalidar_tudo("reserva")
+        return resultado
\ No newline at end of file
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+import calendar
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import date
+
+from api.dao.reservaDAO import ReservaDAO
+from api.dao.reservaDiariaDAO import ReservaDiariaDAO
+from api.dao.hotelDAO import HotelDAO
+from api.modelo.reserva import Reserva
+from api.utils.colunar import ocupacao_diaria
+from api.utils.datas import data_iso, para_date
+from api.utils.errorResponse import ErrorResponse
+from api.utils.metrics import Metrics
+from api.utils.tracing import Tracer
+
+"""
+Relatórios gerenciais de reservas (ocupação, estadia média, reservas por
+hotel e mês), respondidos a partir do agregado diário reserva_diaria.
+
+Manutenção do agregado:
+- Incremental: o ReservaService avisa cada criação, alteração e exclusão e
+  os dias afetados recebem +1/-1 (upsert); uma falha aqui não derruba a
+  requisição, só é contada e corrigida na próxima reconstrução
+- Reconstrução: relê a tabela reserva (leitura colunar), agrega as noites
+  vetorizado e troca o agregado inteiro; roda no boot e periodicamente, e
+  corrige o que o incremental não vê (exclusão em cascata de hospede/hotel,
+  escritas de outros processos)
+
+Concorrência (no processo):
+- Alteração/exclusão da mesma reserva são serializadas por idReserva, para
+  duas escritas não subtraírem o mesmo período anterior
+- Escritas só esperam a reconstrução durante a leitura de reserva (no máximo
+  ESPERA_MAXIMA); as feitas depois dela vão para um diário aplicado logo após
+  a troca do agregado. Se a espera estourar, a reconstrução roda de novo
+
+Exemplo:
+>>> relatorios = RelatorioService(ReservaDiariaDAO(db), ReservaDAO(db), hotel_dao)
+>>> relatorios.iniciar_reconstrucao_periodica(intervalo=6 * 3600)
+>>> relatorios.mensal("2025-01", "2025-06")
+"""
+
+_EPOCA = date(1970, 1, 1).toordinal()
+
+
+class RelatorioService:
+    MAX_MESES = 60
+    MESES_PADRAO = 12
+    ESPERA_MAXIMA = 5.0   # segundos que escrita e reconstrução esperam uma pela outra
+    TRAVAS = 64           # travas por idReserva (idReserva % TRAVAS)
+
+    def __init__(self, reserva_diaria_dao: ReservaDiariaDAO, reserva_dao: ReservaDAO, hotel_dao: HotelDAO):
+        print("⬆️  RelatorioService.__init__()")
+        self.__ReservaDiariaDAO = reserva_diaria_dao
+        self.__ReservaDAO = reserva_dao
+        self.__HotelDAO = hotel_dao
+
+        self.__condicao = threading.Condition()
+        self.__escritas = 0        # escritas em reserva em andamento
+        self.__lendo = False       # reconstrução lendo a tabela reserva
+        self.__diario = None       # (idHotel, dia) -> deltas das escritas durante a reconstrução
+        self.__sujo = False        # alguma espera estourou: reconstruir de novo
+        self.__travas = [threading.Lock() for _ in range(RelatorioService.TRAVAS)]
+        self.__trava_reconstrucao = threading.Lock()
+
+        self.__parar = threading.Event()
+        self.__acordar = threading.Event()
+        self.__thread = None
+        self.__falhas = Metrics.counter("reserva_rollup_failures_total", "Atualizações de reserva_diaria que falharam após escritas em reserva")
+        self.__reconstrucoes = Metrics.counter("reserva_rollup_rebuilds_total", "Reconstruções completas de reserva_diaria")
+
+    # ---------------- Manutenção incremental ----------------
+
+    @contextmanager
+    def escrita(self, idReserva: int = None):
+        """
+        Envolve a escrita em reserva (incluindo a leitura do estado anterior) e o
+        aviso ao agregado. Com `idReserva`, escritas da mesma reserva rodam uma
+        de cada vez.
+        """
+        trava = self.__travas[int(idReserva) % RelatorioService.TRAVAS] if idReserva is not None else nullcontext()
+        with trava:
+            with self.__condicao:
+                if not self.__condicao.wait_for(lambda: not self.__lendo, timeout=RelatorioService.ESPERA_MAXIMA):
+                    # não dá para saber se a leitura em curso viu esta escrita
+                    self.__sujo = True
+                    print("   ⚠️  Escrita em reserva seguiu sem esperar a reconstrução de reserva_diaria")
+                self.__escritas += 1
+            try:
+                yield
+            finally:
+                with self.__condicao:
+                    self.__escritas -= 1
+                    if self.__escritas == 0:
+                        self.__condicao.notify_all()
+
+    def reserva_criada(self, reserva: Reserva):
+        self.__aplicar(((reserva, 1),))
+
+    def reserva_alterada(self, anterior: Reserva, nova: Reserva):
+        self.__aplicar(((anterior, -1), (nova, 1)))
+
+    def reserva_removida(self, reserva: Reserva):
+        self.__aplicar(((reserva, -1),))
+
+    def __aplicar(self, alteracoes: tuple):
+        try:
+            agregado = {}
+            for reserva, sinal in alteracoes:
+                inicio, fim = para_date(reserva.inicio), para_date(reserva.fim)
+                if inicio and fim:
+                    RelatorioService.__acumular(agregado, reserva.idHotel, inicio.toordinal(), fim.toordinal(), sinal)
+
+            with self.__condicao:
+                if self.__diario is not None:   # reconstrução em curso: aplicado depois da troca
+                    for chave, valores in agregado.items():
+                        anteriores = self.__diario.setdefault(chave, [0, 0, 0])
+                        for i, valor in enumerate(valores):
+                            anteriores[i] += valor
+                    return
+            self.__ReservaDiariaDAO.somar(RelatorioService.__linhas(agregado))
+        except Exception as e:
+            self.__falhas.inc()
+            print(f"   ⚠️  reserva_diaria não atualizada ({type(e).__name__}: {e}); corrigida na próxima reconstrução")
+
+    # ---------------- Reconstrução ----------------
+
+    @Tracer.rastrear("RelatorioService.reconstruir")
+    def reconstruir(self) -> int:
+        """Recalcula reserva_diaria a partir da tabela reserva; devolve o número de linhas gravadas."""
+        print("🟣 RelatorioService.reconstruir()")
+        with self.__trava_reconstrucao:
+            with self.__condicao:
+                self.__lendo = True    # novas escritas esperam só a leitura abaixo
+                self.__sujo = False
+                if not self.__condicao.wait_for(lambda: self.__escritas == 0, timeout=RelatorioService.ESPERA_MAXIMA):
+                    self.__sujo = True
+                # só agora: escritas que terminaram antes já estão na leitura, não podem ir ao diário
+                self.__diario = {}
+
+            try:
+                try:
+                    colunas = self.__ReservaDAO.findAllColunar()
+                finally:
+                    with self.__condicao:
+                        self.__lendo = False
+                        self.__condicao.notify_all()
+
+                linhas = [
+                    (idHotel, date.fromordinal(dia + _EPOCA), ocupadas, entradas, noites)
+                    for idHotel, dia, ocupadas, entradas, noites
+                    in ocupacao_diaria(colunas["idHotel"], colunas.dias("inicio"), colunas.dias("fim"), Reserva.MAX_NOITES)
+                ]
+                total = self.__ReservaDiariaDAO.substituirTudo(linhas)
+                self.__reconstrucoes.inc()
+                print(f"   ✅ reserva_diaria reconstruída: {len(colunas)} reservas -> {total} linhas")
+                return total
+            finally:
+                self.__aplicar_diario()
+                if self.__sujo:
+                    print("   ⚠️  Escritas concorrentes sem ordem garantida: reserva_diaria será reconstruída de novo")
+                    self.__acordar.set()
+
+    def __aplicar_diario(self):
+        # sob a condição: escritas que chegarem durante a aplicação esperam e depois vão direto à tabela
+        with self.__condicao:
+            diario, self.__diario = self.__diario, None
+            if not diario:
+                return
+            try:
+                self.__ReservaDiariaDAO.somar(RelatorioService.__linhas(diario))
+            except Exception as e:
+                self.__falhas.inc()
+                self.__sujo = True
+                print(f"   ⚠️  Diário de reserva_diaria não aplicado ({type(e).__name__}: {e})")
+
+    def iniciar_reconstrucao_periodica(self, intervalo: float):
+        """Reconstrói agora e a cada `intervalo` segundos, numa thread em segundo plano."""
+        if self.__thread is not None:
+            return
+        self.__parar.clear()
+        self.__thread = threading.Thread(target=self.__reconstruir_em_fundo, args=(intervalo,), name="reserva-rollup", daemon=True)
+        self.__thread.start()
+
+    def parar(self):
+        self.__parar.set()
+        self.__acordar.set()
+        self.__thread = None
+
+    def __reconstruir_em_fundo(self, intervalo: float):
+        while not self.__parar.is_set():
+            try:
+                self.reconstruir()
+            except Exception as e:
+                print(f"⚠️  RelatorioService: reconstrução de reserva_diaria falhou ({type(e).__name__}: {e})")
+            self.__acordar.wait(intervalo)   # acordada antes do intervalo quando a reconstrução ficou suja
+            self.__acordar.clear()
+
+    @staticmethod
+    def __acumular(agregado: dict, idHotel: int, inicio: int, fim: int, sinal: int):
+        # inicio/fim em ordinais de dia; a noite do check-out (fim) não é ocupada.
+        # Reservas legadas acima de Reserva.MAX_NOITES contam só as primeiras noites, como na reconstrução
+        if fim <= inicio:
+            return
+        fim = min(fim, inicio + Reserva.MAX_NOITES)
+        for dia in range(inicio, fim):
+            valores = agregado.get((idHotel, dia))
+            if valores is None:
+                valores = agregado[(idHotel, dia)] = [0, 0, 0]
+            valores[0] += sinal
+        valores = agregado[(idHotel, inicio)]
+        valores[1] += sinal
+        valores[2] += sinal * (fim - inicio)
+
+    @staticmethod
+    def __linhas(agregado: dict) -> list[tuple]:
+        # ordenadas pela chave primária: upserts concorrentes travam as linhas na mesma ordem;
+        # deltas zerados (alteração que não mudou o dia) não vão ao banco
+        return [
+            (idHotel, date.fromordinal(dia), ocupadas, entradas, noites)
+            for (idHotel, dia), (ocupadas, entradas, noites) in sorted(agregado.items())
+            if ocupadas or entradas or noites
+        ]
+
+    # ---------------- Relatórios ----------------
+
+    @Tracer.rastrear("RelatorioService.mensal")
+    def mensal(self, desde: str = None, ate: str = None, idHotel: int = None) -> list[dict]:
+        """
+        Por hotel e mês (desde/ate em "YYYY-MM", inclusive; padrão: últimos 12 meses):
+        - reservas: check-ins no mês
+        - estadiaMedia: noites por reserva, das reservas com check-in no mês
+        - noitesOcupadas: noites do mês com o hotel ocupado, somadas por reserva
+        - taxaOcupacao: noitesOcupadas / (capacidade * dias do mês)
+        """
+        print(f"🟣 RelatorioService.mensal({desde}, {ate}, {idHotel})")
+        meses = RelatorioService.__meses(desde, ate)
+
+        if idHotel is not None:
+            hotel = self.__HotelDAO.findById(idHotel)
+            if not hotel:
+                raise ErrorResponse(404, "Hotel não encontrado", {"message": f"idHotel {idHotel} não existe"})
+            hoteis = [hotel]
+        else:
+            hoteis = self.__HotelDAO.findAll()
+
+        ultimo_ano, ultimo_mes = meses[-1]
+        linhas = self.__ReservaDiariaDAO.findPeriodo(
+            date(*meses[0], 1), date(ultimo_ano, ultimo_mes, calendar.monthrange(ultimo_ano, ultimo_mes)[1]), idHotel
+        )
+
+        somas = {}
+        for idHotelLinha, dia, ocupadas, entradas, noites in linhas:
+            chave = (idHotelLinha, dia.year, dia.month)
+            anteriores = somas.get(chave, (0, 0, 0))
+            somas[chave] = (anteriores[0] + ocupadas, anteriores[1] + entradas, anteriores[2] + noites)
+
+        relatorio = []
+        for hotel in hoteis:
+            for ano, mes in meses:
+                ocupadas, entradas, noites = somas.get((hotel.idHotel, ano, mes), (0, 0, 0))
+                disponiveis = (hotel.capacidade or 0) * calendar.monthrange(ano, mes)[1]
+                relatorio.append({
+                    "idHotel": hotel.idHotel,
+                    "nome": hotel.nome,
+                    "mes": f"{ano:04d}-{mes:02d}",
+                    "reservas": entradas,
+                    "estadiaMedia": round(noites / entradas, 2) if entradas else 0,
+                    "noitesOcupadas": ocupadas,
+                    "taxaOcupacao": round(ocupadas / disponiveis, 4) if disponiveis else 0,
+                })
+
+        print(f"   📊 Retornando {len(relatorio)} linhas ({len(linhas)} dias agregados lidos)")
+        return relatorio
+
+    @staticmethod
+    def __meses(desde: str | None, ate: str | None) -> list[tuple]:
+        hoje = date.today()
+        fim = RelatorioService.__mes(ate, "ate") if ate else (hoje.year, hoje.month)
+        if desde:
+            inicio = RelatorioService.__mes(desde, "desde")
+        else:
+            indice = fim[0] * 12 + fim[1] - RelatorioService.MESES_PADRAO   # 12 meses terminando em 'fim'
+            inicio = (indice // 12, indice % 12 + 1)
+
+        quantidade = (fim[0] * 12 + fim[1]) - (inicio[0] * 12 + inicio[1]) + 1
+        if quantidade < 1:
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": "'desde' deve ser anterior ou igual a 'ate'."})
+        if quantidade > RelatorioService.MAX_MESES:
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": f"Período máximo de {RelatorioService.MAX_MESES} meses."})
+
+        primeiro = inicio[0] * 12 + inicio[1] - 1
+        return [((primeiro + i) // 12, (primeiro + i) % 12 + 1) for i in range(quantidade)]
+
+    @staticmethod
+    def __mes(texto: str, nome: str) -> tuple:
+        data = data_iso(f"{texto}-01") if isinstance(texto, str) else None
+        if data is None:
+            raise ErrorResponse(400, "Erro na validação de dados", {"message": f"'{nome}' inválido (esperado YYYY-MM)."})
+        return data.year, data.month
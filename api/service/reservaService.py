@@ -1,18 +1,31 @@
 # -*- coding: utf-8 -*-
+from contextlib import nullcontext
+
 from api.dao.reservaDAO import ReservaDAO
 from api.dao.hospedeDAO import HospedeDAO
 from api.dao.hotelDAO import HotelDAO
 from api.modelo.reserva import Reserva
 from api.utils.errorResponse import ErrorResponse
-from datetime import datetime, date
+from api.utils.tracing import Tracer
+from api.utils.serviceCache import ServiceCache
+from api.utils.datas import para_date
+from api.service.relatorioService import RelatorioService
 
 class ReservaService:
-	def __init__(self, reserva_dao: ReservaDAO, hospede_dao: HospedeDAO, hotel_dao: HotelDAO):
+	def __init__(self, reserva_dao: ReservaDAO, hospede_dao: HospedeDAO, hotel_dao: HotelDAO, cache: ServiceCache = None,
+				 relatorios: RelatorioService = None):
 		print("⬆️  ReservaService.__init__()")
 		self.__ReservaDAO = reserva_dao
 		self.__HospedeDAO = hospede_dao
 		self.__HotelDAO = hotel_dao
+		self.__cache = cache or ServiceCache.desativado()
+		self.__relatorios = relatorios   # agregado reserva_diaria (opcional)
+
+	def __escrita(self, idReserva: int = None):
+		# escrita + aviso ao agregado: serializada por reserva e coordenada com a reconstrução
+		return self.__relatorios.escrita(idReserva) if self.__relatorios else nullcontext()
 
+	@Tracer.rastrear("ReservaService.createReserva")
 	def createReserva(self, reservaBodyRequest: dict) -> int:
 		print("🟣 ReservaService.createReserva()")
 		print(f"   📦 Dados recebidos: {reservaBodyRequest}")
@@ -35,98 +48,35 @@ class ReservaService:
 		if not idHotel or not self.__HotelDAO.findById(idHotel):
 			raise ErrorResponse(400, "Hotel não encontrado", {"message": f"idHotel {idHotel} não existe"})
 
-		# Validação de datas
-		valid, errors = self._validar_datas(inicio, fim)
-		if not valid:
-			print(f"   ❌ Erros de validação de datas: {errors}")
-			raise ErrorResponse(400, "Erro de validação de datas", {"errors": errors})
+		# formato e ordem das datas já validados pelo ReservaMiddleware.ESQUEMA (inicio/fim chegam como date)
 
 		# Impedir sobreposição de reservas para o mesmo hotel
 		if self._existe_sobreposicao(idHotel, inicio, fim):
 			raise ErrorResponse(400, "Conflito de reserva", {"message": "Já existe uma reserva para este hotel neste período."})
 
-		reserva = Reserva()
-		reserva.idHospede = idHospede
-		reserva.idHotel = idHotel
-		reserva.inicio = inicio
-		reserva.fim = fim
+		reserva = Reserva(idHospede=idHospede, idHotel=idHotel, inicio=inicio, fim=fim)
 
-		novo_id = self.__ReservaDAO.create(reserva)
+		with self.__escrita():
+			novo_id = self.__ReservaDAO.create(reserva)
+			if self.__relatorios:
+				reserva.idReserva = novo_id
+				self.__relatorios.reserva_criada(reserva)
+		self.__cache.invalidar_lista("reserva")
 		print(f"   ✅ Reserva criada com ID: {novo_id}")
 		return novo_id
 
-	def _validar_datas(self, inicio, fim):
-		"""
-		✅ CORREÇÃO: Validação robusta de datas com múltiplos formatos
-		"""
-		errors = []
-		di = None
-		df = None
-		
-		# Tentar converter data de início
-		try:
-			if isinstance(inicio, date):
-				di = inicio
-			elif isinstance(inicio, datetime):
-				di = inicio.date()
-			elif isinstance(inicio, str):
-				# Tentar formato YYYY-MM-DD
-				di = datetime.strptime(str(inicio), "%Y-%m-%d").date()
-			else:
-				errors.append(f"Formato de data de início inválido: {type(inicio)}")
-		except Exception as e:
-			errors.append(f"Data de início inválida ou formato incorreto (esperado YYYY-MM-DD). Erro: {str(e)}")
-		
-		# Tentar converter data de fim
-		try:
-			if isinstance(fim, date):
-				df = fim
-			elif isinstance(fim, datetime):
-				df = fim.date()
-			elif isinstance(fim, str):
-				# Tentar formato YYYY-MM-DD
-				df = datetime.strptime(str(fim), "%Y-%m-%d").date()
-			else:
-				errors.append(f"Formato de data de fim inválido: {type(fim)}")
-		except Exception as e:
-			errors.append(f"Data de fim inválida ou formato incorreto (esperado YYYY-MM-DD). Erro: {str(e)}")
-		
-		# Validações lógicas
-		if di and df:
-			if df <= di:
-				errors.append("Data de fim deve ser posterior à data de início.")
-			if di < date.today():
-				errors.append("Data de início não pode ser anterior a hoje.")
-			
-			# ✅ ADICIONAL: Validar período mínimo (opcional)
-			if (df - di).days < 1:
-				errors.append("Período de reserva deve ser de pelo menos 1 dia.")
-		
-		return (len(errors) == 0), errors
-
 	def _normalizar_data(self, data_input):
 		"""
-		✅ CORREÇÃO: Conversão robusta de qualquer formato de data para date
+		Converte qualquer formato de data (date, datetime, ISO com ou sem horário) para date.
+		Strings passam pelo cache de api.utils.datas: datas repetidas nas linhas do banco
+		são convertidas uma vez só.
 		"""
-		try:
-			if data_input is None:
-				print(f"   ⚠️  Data é None")
-				return None
-			elif isinstance(data_input, str):
-				# Remover possível timestamp (ex: "2025-01-15T00:00:00" → "2025-01-15")
-				data_str = data_input.split('T')[0] if 'T' in data_input else data_input
-				return datetime.strptime(data_str, "%Y-%m-%d").date()
-			elif isinstance(data_input, datetime):
-				return data_input.date()
-			elif isinstance(data_input, date):
-				return data_input
-			else:
-				print(f"   ⚠️  Tipo de data não reconhecido: {type(data_input)} - valor: {data_input}")
-				return None
-		except Exception as e:
-			print(f"   ⚠️  Erro ao normalizar data '{data_input}': {e}")
-			return None
+		data = para_date(data_input)
+		if data is None:
+			print(f"   ⚠️  Data inválida ou não reconhecida: {data_input!r}")
+		return data
 
+	@Tracer.rastrear("ReservaService._existe_sobreposicao")
 	def _existe_sobreposicao(self, idHotel, inicio, fim, idReserva_ignorar=None):
 		"""
 		✅ MELHORADO: Verificação de sobreposição com logs detalhados
@@ -153,24 +103,24 @@ class ReservaService:
 		
 		for r in reservas:
 			# Ignorar a própria reserva no caso de update
-			if idReserva_ignorar and r.get("idReserva") == idReserva_ignorar:
-				print(f"   ⏭️  Ignorando reserva {r.get('idReserva')} (própria reserva)")
+			if idReserva_ignorar and r.idReserva == idReserva_ignorar:
+				print(f"   ⏭️  Ignorando reserva {r.idReserva} (própria reserva)")
 				continue
 			
 			# Normalizar datas do banco
-			ri = self._normalizar_data(r.get("inicio"))
-			rf = self._normalizar_data(r.get("fim"))
+			ri = self._normalizar_data(r.inicio)
+			rf = self._normalizar_data(r.fim)
 			
 			if not ri or not rf:
-				print(f"   ⚠️  Erro ao normalizar datas da reserva {r.get('idReserva')}")
+				print(f"   ⚠️  Erro ao normalizar datas da reserva {r.idReserva}")
 				continue
 			
-			print(f"   🔄 Comparando com reserva {r.get('idReserva')}: {ri} até {rf}")
+			print(f"   🔄 Comparando com reserva {r.idReserva}: {ri} até {rf}")
 			
 			# ✅ LÓGICA CORRETA: Verifica se há sobreposição
 			# (inicio < fim_existente) AND (fim > inicio_existente)
 			if (di < rf) and (df > ri):
-				print(f"   ⚠️  SOBREPOSIÇÃO DETECTADA com reserva {r.get('idReserva')}")
+				print(f"   ⚠️  SOBREPOSIÇÃO DETECTADA com reserva {r.idReserva}")
 				print(f"      Nova reserva: {di} → {df}")
 				print(f"      Reserva existente: {ri} → {rf}")
 				return True
@@ -178,15 +128,25 @@ class ReservaService:
 		print("   ✅ Nenhuma sobreposição encontrada")
 		return False
 
-	def findAll(self) -> list[dict]:
+	@Tracer.rastrear("ReservaService.findAll")
+	def findAll(self) -> list[Reserva]:
 		print("🟣 ReservaService.findAll()")
-		reservas = self.__ReservaDAO.findAll()
+		reservas = self.__cache.lista("reserva", "todos", self.__ReservaDAO.findAll)
 		print(f"   📊 Retornando {len(reservas)} reservas")
 		return reservas
 
-	def findById(self, idReserva: int) -> dict | None:
+	def versaoLista(self) -> str | None:
+		"""Versão atual da listagem de reservas (ETag); None se não houver cache."""
+		return self.__cache.versao_lista("reserva")
+
+	def versaoItem(self, idReserva: int) -> str | None:
+		"""Versão atual de uma reserva (ETag); None se não houver cache."""
+		return self.__cache.versao_item("reserva", idReserva)
+
+	@Tracer.rastrear("ReservaService.findById")
+	def findById(self, idReserva: int) -> Reserva | None:
 		print(f"🟣 ReservaService.findById({idReserva})")
-		reserva = self.__ReservaDAO.findById(idReserva)
+		reserva = self.__cache.item("reserva", idReserva, lambda: self.__ReservaDAO.findById(idReserva))
 		
 		if reserva:
 			print(f"   ✅ Reserva encontrada: {reserva}")
@@ -195,18 +155,20 @@ class ReservaService:
 		
 		return reserva
 
+	@Tracer.rastrear("ReservaService.updateReserva")
 	def updateReserva(self, idReserva: int, jsonReserva: dict) -> bool:
 		print("🟣 ReservaService.updateReserva()")
 		print(f"   📦 idReserva: {idReserva}")
 		print(f"   📦 jsonReserva: {jsonReserva}")
 		
 		try:
-			reserva = Reserva()
-			reserva.idReserva = idReserva
-			reserva.idHospede = jsonReserva.get("idHospede")
-			reserva.idHotel = jsonReserva.get("idHotel")
-			reserva.inicio = jsonReserva.get("inicio")
-			reserva.fim = jsonReserva.get("fim")
+			reserva = Reserva(
+				idReserva=int(idReserva),
+				idHospede=jsonReserva["idHospede"],
+				idHotel=jsonReserva["idHotel"],
+				inicio=jsonReserva["inicio"],
+				fim=jsonReserva["fim"],
+			)
 			
 			print(f"   ✅ Objeto Reserva criado com sucesso")
 
@@ -219,20 +181,19 @@ class ReservaService:
 			if not self.__HotelDAO.findById(reserva.idHotel):
 				raise ErrorResponse(400, "Hotel não encontrado", {"message": f"idHotel {reserva.idHotel} não existe"})
 			
-			# Validação de datas
-			print(f"   🔍 Validando datas: {reserva.inicio} até {reserva.fim}")
-			valid, errors = self._validar_datas(reserva.inicio, reserva.fim)
-			if not valid:
-				print(f"   ❌ Erros de validação: {errors}")
-				raise ErrorResponse(400, "Erro de validação de datas", {"errors": errors})
-			
 			# ✅ CORREÇÃO CRÍTICA: Verificar sobreposição ignorando a própria reserva
 			print(f"   🔍 Verificando sobreposição (ignorando reserva {idReserva})...")
 			if self._existe_sobreposicao(reserva.idHotel, reserva.inicio, reserva.fim, idReserva):
 				raise ErrorResponse(400, "Conflito de reserva", {"message": "Já existe uma reserva para este hotel neste período."})
 
 			print(f"   💾 Atualizando no banco de dados...")
-			resultado = self.__ReservaDAO.update(reserva)
+			with self.__escrita(idReserva):
+				# período anterior lido do banco (não do cache): é o que sai do agregado
+				anterior = self.__ReservaDAO.findById(idReserva) if self.__relatorios else None
+				resultado = self.__ReservaDAO.update(reserva)
+				if resultado and anterior:
+					self.__relatorios.reserva_alterada(anterior, reserva)
+			self.__cache.invalidar_item("reserva", idReserva)
 			print(f"   ✅ Atualização concluída: {resultado}")
 			return resultado
 			
@@ -245,18 +206,22 @@ class ReservaService:
 			traceback.print_exc()
 			raise
 
+	@Tracer.rastrear("ReservaService.deleteReserva")
 	def deleteReserva(self, idReserva: int) -> bool:
 		print(f"🟣 ReservaService.deleteReserva({idReserva})")
 		
-		# ✅ ADICIONAL: Verificar se reserva existe antes de deletar
-		reserva_existe = self.__ReservaDAO.findById(idReserva)
-		if not reserva_existe:
-			print(f"   ❌ Reserva {idReserva} não encontrada para deletar")
-			return False
-		
-		reserva = Reserva()
-		reserva.idReserva = idReserva
-		resultado = self.__ReservaDAO.delete(reserva)
+		with self.__escrita(idReserva):
+			# ✅ ADICIONAL: Verificar se reserva existe antes de deletar (dentro da trava: é o período que sai do agregado)
+			reserva_existe = self.__ReservaDAO.findById(idReserva)
+			if not reserva_existe:
+				print(f"   ❌ Reserva {idReserva} não encontrada para deletar")
+				return False
+
+			reserva = Reserva(idReserva=int(idReserva))
+			resultado = self.__ReservaDAO.delete(reserva)
+			if resultado and self.__relatorios:
+				self.__relatorios.reserva_removida(reserva_existe)
+		self.__cache.invalidar_item("reserva", idReserva)
 		
 		if resultado:
 			print(f"   ✅ Reserva {idReserva} deletada com sucesso")
@@ -0,0 +1,157 @@
+import hashlib
+import mimetypes
+import os
+import re
+
+from flask import Response, request, send_from_directory
+
+
+def minificar_linhas(texto: str) -> str:
+    """
+    Minificação conservadora: remove indentação, espaços no fim e linhas vazias.
+    Mantém as quebras de linha (seguro para a inserção automática de ';' do JS).
+    """
+    linhas = (linha.strip() for linha in texto.splitlines())
+    return "\n".join(linha for linha in linhas if linha) + "\n"
+
+
+def minificar_js(texto: str) -> str:
+    """Como minificar_linhas, removendo também linhas só de comentário (// e /* ... */)."""
+    saida = []
+    em_bloco = False
+    for linha in texto.splitlines():
+        limpa = linha.strip()
+        if em_bloco:
+            em_bloco = "*/" not in limpa
+            continue
+        if limpa.startswith("/*"):
+            em_bloco = "*/" not in limpa
+            continue
+        if limpa.startswith("//"):
+            continue
+        saida.append(linha)
+    return minificar_linhas("\n".join(saida))
+
+
+class _Asset:
+    __slots__ = ("conteudo", "content_type", "etag", "imutavel", "codificados")
+
+    def __init__(self, conteudo: bytes, content_type: str, imutavel: bool):
+        self.conteudo = conteudo
+        self.content_type = content_type
+        self.etag = hashlib.sha256(conteudo).hexdigest()[:16]
+        self.imutavel = imutavel
+        self.codificados = {}   # "gzip"/"br" -> bytes
+
+
+class AssetPipeline:
+    """
+    Pipeline dos arquivos de static/, executado uma vez no boot.
+
+    - .js/.css são minificados e publicados com o hash do conteúdo no nome
+      (ApiService.js -> ApiService.3f2a9c1b7d.js), servidos com
+      Cache-Control "public, max-age=31536000, immutable"
+    - Páginas .html têm as referências aos assets reescritas para os nomes com
+      hash e são minificadas; como a URL delas não muda, saem com "no-cache" +
+      ETag (revalidação barata, 304)
+    - Tudo fica em memória, já comprimido em gzip/brotli quando vale a pena;
+      servir não lê nem faz stat de arquivo
+    - Nomes sem hash continuam respondendo (sem cache longo), para links antigos
+
+    Alterações em static/ exigem reiniciar o servidor.
+    """
+
+    CACHE_IMUTAVEL = "public, max-age=31536000, immutable"
+    EXTENSOES_HASH = (".js", ".css")
+    EXTENSOES_PAGINA = (".html",)
+
+    def __init__(self, pasta: str, compressao=None):
+        """
+        :param pasta: pasta static/ do app
+        :param compressao: CompressaoMiddleware (negociação e compressão); opcional
+        """
+        self.__pasta = pasta
+        self.__compressao = compressao
+        self.__assets = {}   # caminho publicado -> _Asset
+        self.__nomes = {}    # nome original -> nome com hash
+
+    def nome_publicado(self, nome: str) -> str:
+        return self.__nomes.get(nome, nome)
+
+    def construir(self):
+        if not self.__pasta or not os.path.isdir(self.__pasta):
+            return
+
+        arquivos = []
+        for raiz, _, nomes in os.walk(self.__pasta):
+            for nome in nomes:
+                caminho = os.path.join(raiz, nome)
+                arquivos.append(os.path.relpath(caminho, self.__pasta).replace(os.sep, "/"))
+
+        # 1) assets com hash primeiro, para as páginas poderem referenciá-los
+        for nome in arquivos:
+            if nome.endswith(AssetPipeline.EXTENSOES_HASH):
+                texto = self.__ler(nome)
+                conteudo = (minificar_js(texto) if nome.endswith(".js") else minificar_linhas(texto)).encode("utf-8")
+                base, extensao = os.path.splitext(nome)
+                publicado = f"{base}.{hashlib.sha256(conteudo).hexdigest()[:10]}{extensao}"
+                self.__nomes[nome] = publicado
+                self.__adicionar(publicado, conteudo, imutavel=True)
+                self.__adicionar(nome, conteudo, imutavel=False)
+
+        # 2) páginas com as referências reescritas
+        for nome in arquivos:
+            if nome.endswith(AssetPipeline.EXTENSOES_PAGINA):
+                texto = self.__reescrever_referencias(self.__ler(nome))
+                self.__adicionar(nome, minificar_linhas(texto).encode("utf-8"), imutavel=False)
+
+        print(f"✅ AssetPipeline: {len(self.__assets)} arquivos em memória ({len(self.__nomes)} com hash)")
+
+    def registrar(self, app):
+        """Constrói os assets e passa a rota estática do Flask para o pipeline."""
+        self.construir()
+        app.view_functions["static"] = lambda filename: self.servir(filename)
+
+    def servir(self, nome: str) -> Response:
+        asset = self.__assets.get(nome)
+        if asset is None:
+            # arquivos fora do pipeline (ex.: imagens) seguem pelo Flask
+            return send_from_directory(self.__pasta, nome)
+
+        codificacao = self.__compressao.escolher_codificacao() if self.__compressao else None
+        corpo = asset.codificados.get(codificacao) if codificacao else None
+
+        response = Response(corpo if corpo is not None else asset.conteudo, content_type=asset.content_type)
+        if corpo is not None:
+            response.headers["Content-Encoding"] = codificacao
+            response.set_etag(f"{asset.etag}-{codificacao}")
+        else:
+            response.set_etag(asset.etag)
+        if asset.codificados:
+            response.vary.add("Accept-Encoding")
+
+        if asset.imutavel:
+            response.headers["Cache-Control"] = AssetPipeline.CACHE_IMUTAVEL
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
+
+    def __ler(self, nome: str) -> str:
+        with open(os.path.join(self.__pasta, nome), encoding="utf-8") as f:
+            return f.read()
+
+    def __adicionar(self, nome: str, conteudo: bytes, imutavel: bool):
+        content_type = mimetypes.guess_type(nome)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type == "application/javascript":
+            content_type += "; charset=utf-8"
+        asset = _Asset(conteudo, content_type, imutavel)
+        if self.__compressao is not None:
+            asset.codificados = self.__compressao.precomprimir(conteudo)
+        self.__assets[nome] = asset
+
+    def __reescrever_referencias(self, texto: str) -> str:
+        # troca ./ApiService.js, "ApiService.js" etc. pelo nome com hash
+        for original, publicado in self.__nomes.items():
+            padrao = re.compile(r"""(["'(=]\s*(?:\./|/)?)""" + re.escape(original) + r"""(?=["')\s>])""")
+            texto = padrao.sub(lambda m: m.group(1) + publicado, texto)
+        return texto
@@ -0,0 +1,77 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Cache em memória com limite de itens (LRU) e expiração por item (TTL).
+
+    - Thread-safe (um lock por instância)
+    - Cada item pode ter sua própria expiração absoluta (ex.: 'exp' de um JWT)
+    - Mantém contadores de acertos, faltas e remoções por limite
+
+    Exemplo:
+    >>> cache = LRUCache(maxsize=1000, ttl=60)
+    >>> cache.set("hotel:1", {"idHotel": 1})
+    >>> cache.get("hotel:1")
+    {'idHotel': 1}
+    """
+
+    _AUSENTE = object()
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.__maxsize = maxsize
+        self.__ttl = ttl
+        self.__itens = OrderedDict()   # chave -> (valor, expira_em | None)
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, chave, padrao=None):
+        agora = time.monotonic()
+        with self.__lock:
+            item = self.__itens.get(chave, LRUCache._AUSENTE)
+            if item is LRUCache._AUSENTE:
+                self.misses += 1
+                return padrao
+
+            valor, expira_em = item
+            if expira_em is not None and expira_em <= agora:
+                del self.__itens[chave]
+                self.misses += 1
+                return padrao
+
+            self.__itens.move_to_end(chave)
+            self.hits += 1
+            return valor
+
+    def set(self, chave, valor, ttl: float | None = None, expira_em: float | None = None):
+        """
+        Grava um item.
+
+        :param ttl: segundos de vida (sobrepõe o TTL padrão da instância)
+        :param expira_em: instante absoluto em time.monotonic() (sobrepõe ttl)
+        """
+        if expira_em is None:
+            duracao = ttl if ttl is not None else self.__ttl
+            expira_em = time.monotonic() + duracao if duracao is not None else None
+
+        with self.__lock:
+            self.__itens[chave] = (valor, expira_em)
+            self.__itens.move_to_end(chave)
+            while len(self.__itens) > self.__maxsize:
+                self.__itens.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, chave) -> bool:
+        with self.__lock:
+            return self.__itens.pop(chave, LRUCache._AUSENTE) is not LRUCache._AUSENTE
+
+    def clear(self):
+        with self.__lock:
+            self.__itens.clear()
+
+    def __len__(self) -> int:
+        return len(self.__itens)
@@ -0,0 +1,163 @@
+from array import array
+from datetime import date
+
+from api.utils.datas import para_date
+
+try:
+    import numpy as np
+except ImportError:   # sem numpy: array('q') da stdlib
+    np = None
+
+
+"""
+Leitura colunar de resultados, para consultas analíticas (relatórios).
+
+Em vez de uma lista de objetos/dicts por linha, cada coluna vira um array
+contíguo de inteiros de 64 bits:
+
+- INTEIRO → numpy int64 (ou array('q') sem numpy)
+- DATA    → numpy datetime64[D] (ou array('q') com dias desde 1970-01-01);
+            NULL vira NaT / NULO
+
+Agregações (ocupacao_diaria) rodam vetorizadas com numpy e caem em um laço
+simples sobre os arrays quando ele não está instalado.
+
+Exemplo:
+>>> cursor.execute("SELECT idHotel, inicio FROM reserva;")
+>>> colunas = ler_colunas(cursor, (("idHotel", INTEIRO), ("inicio", DATA)))
+>>> colunas["idHotel"], colunas.dias("inicio")
+"""
+
+
+INTEIRO = "inteiro"
+DATA = "data"
+NULO = -2 ** 63   # mesmo valor que numpy usa para NaT em datetime64
+_EPOCA = date(1970, 1, 1).toordinal()
+
+
+class Colunas:
+    """Resultado colunar: um array por coluna, todos com o mesmo tamanho."""
+
+    __slots__ = ("__arrays", "__tamanho")
+
+    def __init__(self, arrays: dict, tamanho: int):
+        self.__arrays = arrays
+        self.__tamanho = tamanho
+
+    @property
+    def numpy(self) -> bool:
+        return np is not None
+
+    @property
+    def nomes(self) -> tuple:
+        return tuple(self.__arrays)
+
+    def __len__(self) -> int:
+        return self.__tamanho
+
+    def __getitem__(self, nome: str):
+        return self.__arrays[nome]
+
+    def dias(self, nome: str):
+        """Coluna de datas como inteiros (dias desde 1970-01-01; NULL = NULO)."""
+        coluna = self.__arrays[nome]
+        return coluna.view(np.int64) if np is not None else coluna
+
+
+def _dia(valor) -> int:
+    if valor is None:
+        return NULO
+    if isinstance(valor, date):   # date e datetime
+        return valor.toordinal() - _EPOCA
+    convertido = para_date(valor)
+    return convertido.toordinal() - _EPOCA if convertido else NULO
+
+
+def ler_colunas(cursor, tipos: tuple, lote: int = 10_000) -> Colunas:
+    """
+    Lê o resultado do cursor (já executado) em lotes de `lote` linhas, direto
+    para arrays por coluna; nenhum dict ou objeto por linha é mantido.
+
+    :param tipos: ((nome, INTEIRO|DATA), ...) na ordem das colunas do SELECT
+    """
+    arrays = [array("q") for _ in tipos]
+    conversores = [_dia if tipo == DATA else (lambda v: NULO if v is None else v) for _, tipo in tipos]
+    tamanho = 0
+
+    while True:
+        linhas = cursor.fetchmany(lote)
+        if not linhas:
+            break
+        tamanho += len(linhas)
+        for indice, (destino, converter) in enumerate(zip(arrays, conversores)):
+            destino.extend(converter(linha[indice]) for linha in linhas)
+
+    resultado = {}
+    for (nome, tipo), coluna in zip(tipos, arrays):
+        if np is not None:
+            coluna = np.frombuffer(coluna, dtype=np.int64)
+            if tipo == DATA:
+                coluna = coluna.view("datetime64[D]")
+        resultado[nome] = coluna
+    return Colunas(resultado, tamanho)
+
+
+def ocupacao_diaria(grupos, inicio, fim, max_noites: int = None) -> list[tuple]:
+    """
+    Expande intervalos [inicio, fim) (dias desde 1970-01-01) em agregados por
+    (grupo, dia), ordenados: [(grupo, dia, ocupadas, entradas, noites_entradas)].
+
+    - ocupadas: intervalos que cobrem o dia (o dia de `fim` não conta)
+    - entradas / noites_entradas: intervalos que começam no dia e a soma das suas noites
+    - Intervalos com NULO ou vazios são ignorados
+    - Com `max_noites`, intervalos mais longos contam só as primeiras
+      `max_noites` noites (limita a expansão de dados legados)
+    """
+    if np is not None:
+        grupos = np.asarray(grupos, dtype=np.int64)
+        inicio = np.asarray(inicio, dtype=np.int64)
+        fim = np.asarray(fim, dtype=np.int64)
+        validos = (inicio != NULO) & (fim != NULO) & (fim > inicio)
+        grupos, inicio, fim = grupos[validos], inicio[validos], fim[validos]
+        if grupos.size == 0:
+            return []
+        if max_noites is not None:
+            fim = np.minimum(fim, inicio + max_noites)
+
+        base = int(inicio.min())
+        largura = int(fim.max()) - base + 1
+        noites = fim - inicio
+
+        # uma chave grupo * largura + dia por noite ocupada, sem laço em Python
+        deslocamento = np.arange(int(noites.sum())) - np.repeat(np.cumsum(noites) - noites, noites)
+        chaves_noite = np.repeat(grupos * largura + (inicio - base), noites) + deslocamento
+        chaves, ocupadas = np.unique(chaves_noite, return_counts=True)
+
+        chaves_entrada, posicao = np.unique(grupos * largura + (inicio - base), return_inverse=True)
+        # o dia de entrada é sempre ocupado: toda chave de entrada está em `chaves`
+        indice = np.searchsorted(chaves, chaves_entrada)
+        entradas = np.zeros_like(ocupadas)
+        entradas[indice] = np.bincount(posicao)
+        noites_entradas = np.zeros_like(ocupadas)
+        noites_entradas[indice] = np.bincount(posicao, weights=noites).astype(np.int64)
+
+        return list(zip(
+            (chaves // largura).tolist(), (chaves % largura + base).tolist(),
+            ocupadas.tolist(), entradas.tolist(), noites_entradas.tolist(),
+        ))
+
+    agregado = {}
+    for grupo, di, df in zip(grupos, inicio, fim):
+        if di == NULO or df == NULO or df <= di:
+            continue
+        if max_noites is not None:
+            df = min(df, di + max_noites)
+        for dia in range(di, df):
+            valores = agregado.get((grupo, dia))
+            if valores is None:
+                valores = agregado[(grupo, dia)] = [0, 0, 0]
+            valores[0] += 1
+        valores = agregado[(grupo, di)]
+        valores[1] += 1
+        valores[2] += df - di
+    return [(grupo, dia, *valores) for (grupo, dia), valores in sorted(agregado.items())]
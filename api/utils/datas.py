@@ -0,0 +1,65 @@
+from datetime import date, datetime
+from functools import lru_cache
+
+
+"""
+Conversão de datas compartilhada por middleware, modelo e service.
+
+- data_iso(): só "YYYY-MM-DD" (formato da API), usada na validação do corpo
+- para_date(): aceita também date/datetime, "YYYY-MM-DDTHH:MM:SS",
+  "YYYY-MM-DD HH:MM:SS" (linhas do banco) e "DD/MM/YYYY"
+
+As duas usam date.fromisoformat (bem mais rápido que strptime) e guardam o
+resultado por string num cache limitado: as mesmas datas se repetem em toda
+verificação de sobreposição (cada reserva existente do hotel), então cada
+string é convertida uma vez por processo.
+
+Exemplo:
+>>> data_iso("2025-01-15")            # date(2025, 1, 15)
+>>> para_date("2025-01-15T00:00:00")  # date(2025, 1, 15)
+>>> para_date("15/01/2025")           # date(2025, 1, 15)
+>>> data_iso("15/01/2025")            # None
+"""
+
+
+TAMANHO_CACHE = 4096
+
+
+def data_iso(texto: str) -> date | None:
+    """Converte "YYYY-MM-DD" em date; None se o formato ou a data forem inválidos."""
+    # checado antes do cache: lru_cache lançaria TypeError para listas/dicts vindos do JSON
+    if not isinstance(texto, str):
+        return None
+    return _data_iso(texto)
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _data_iso(texto: str) -> date | None:
+    # fromisoformat sozinho aceitaria também "20250115" e "2025-W03-3"
+    if len(texto) != 10 or texto[4] != "-" or texto[7] != "-":
+        return None
+    try:
+        return date.fromisoformat(texto)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _texto_para_date(texto: str) -> date | None:
+    texto = texto.strip()
+    if len(texto) > 10 and texto[10] in "T ":
+        texto = texto[:10]   # descarta o horário
+    if len(texto) == 10 and texto[2] == "/" and texto[5] == "/":
+        texto = f"{texto[6:]}-{texto[3:5]}-{texto[:2]}"   # DD/MM/YYYY
+    return _data_iso(texto)
+
+
+def para_date(valor) -> date | None:
+    """Converte date, datetime ou string (ISO, com ou sem horário, ou DD/MM/YYYY) em date; None se inválido."""
+    if isinstance(valor, datetime):   # antes de date: datetime é subclasse de date
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    if isinstance(valor, str):
+        return _texto_para_date(valor)
+    return None
@@ -0,0 +1,186 @@
+import re
+from datetime import date
+
+from flask import g
+
+from api.utils.datas import data_iso
+from api.utils.errorResponse import ErrorResponse
+
+
+"""
+Validação declarativa do corpo das requisições.
+
+Cada entidade descreve seus campos uma vez (Esquema) e o esquema é compilado
+no import, na subida do servidor, numa única função de validação: a lista de
+campos vira uma tupla de conversores e nada é montado por requisição.
+
+O middleware valida o corpo uma vez e guarda o resultado tipado (ints, date,
+strings já sem espaços) em flask.g; controllers e services recebem esse dict
+em vez de reler e reconverter request.json.
+
+Exemplo:
+>>> ESQUEMA = Esquema("Hotel", {
+...     "nome": Campo.texto(minimo=3),
+...     "capacidade": Campo.inteiro(positivo=True),
+... })
+>>> g.corpo = ESQUEMA.validar(request.get_json())
+>>> corpo_validado()   # {"nome": "Hotel Azul", "capacidade": 40}
+"""
+
+
+class Campo:
+    """Fábricas de conversores: recebem o valor cru e devolvem o valor tipado ou lançam ValueError."""
+
+    __slots__ = ("conversor", "obrigatorio", "padrao")
+
+    def __init__(self, conversor, obrigatorio: bool = True, padrao=None):
+        self.conversor = conversor
+        self.obrigatorio = obrigatorio
+        self.padrao = padrao
+
+    def opcional(self, padrao=None) -> "Campo":
+        return Campo(self.conversor, obrigatorio=False, padrao=padrao)
+
+    @staticmethod
+    def inteiro(positivo: bool = False) -> "Campo":
+        def converter(nome, valor):
+            try:
+                numero = int(valor)
+            except (ValueError, TypeError):
+                raise ValueError(f"{nome} deve ser um inteiro.")
+            if positivo and numero <= 0:
+                raise ValueError(f"{nome} deve ser um inteiro positivo.")
+            return numero
+        return Campo(converter)
+
+    @staticmethod
+    def texto(minimo: int = 0) -> "Campo":
+        def converter(nome, valor):
+            if not isinstance(valor, str):
+                raise ValueError(f"{nome} deve ser uma string.")
+            texto = valor.strip()
+            if len(texto) < minimo:
+                raise ValueError(f"{nome} deve ter pelo menos {minimo} caracteres.")
+            return texto
+        return Campo(converter)
+
+    @staticmethod
+    def data(rotulo: str) -> "Campo":
+        def converter(nome, valor):
+            if not isinstance(valor, (str, date)):   # listas/dicts nem chegam ao cache (não são hasheáveis)
+                raise ValueError(f"{rotulo} inválida ou formato incorreto (esperado YYYY-MM-DD).")
+            data = valor if isinstance(valor, date) else data_iso(valor)
+            if data is None:
+                raise ValueError(f"{rotulo} inválida ou formato incorreto (esperado YYYY-MM-DD).")
+            return data
+        return Campo(converter)
+
+    @staticmethod
+    def email() -> "Campo":
+        padrao = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+
+        def converter(nome, valor):
+            if not isinstance(valor, str):
+                raise ValueError(f"{nome} deve ser uma string.")
+            email = valor.strip()
+            if not padrao.match(email):
+                raise ValueError(f"{nome} em formato inválido.")
+            return email
+        return Campo(converter)
+
+    @staticmethod
+    def telefone() -> "Campo":
+        nao_digitos = re.compile(r"[^0-9]")
+
+        def converter(nome, valor):
+            if not isinstance(valor, str):
+                raise ValueError(f"{nome} deve ser uma string.")
+            numero = nao_digitos.sub("", valor)
+            # 10 ou 11 dígitos, DDD 11-99 e celular (11 dígitos) começando com 9
+            if len(numero) not in (10, 11) or int(numero[:2]) < 11 \
+                    or (len(numero) == 11 and numero[2] != "9"):
+                raise ValueError(f"{nome} em formato inválido.")
+            return valor
+        return Campo(converter)
+
+    @staticmethod
+    def cpf() -> "Campo":
+        nao_digitos = re.compile(r"[^0-9]")
+
+        def converter(nome, valor):
+            if not isinstance(valor, str):
+                raise ValueError(f"{nome} deve ser uma string.")
+            cpf = nao_digitos.sub("", valor)
+            valido = len(cpf) == 11 and cpf != cpf[0] * 11
+            for i in (9, 10):
+                if not valido:
+                    break
+                soma = sum(int(cpf[j]) * (i + 1 - j) for j in range(i))
+                valido = (soma * 10 % 11) % 10 == int(cpf[i])
+            if not valido:
+                raise ValueError("CPF em formato inválido.")
+            return valor
+        return Campo(converter)
+
+    @staticmethod
+    def livre() -> "Campo":
+        return Campo(lambda nome, valor: valor)
+
+
+class Esquema:
+    """
+    Corpo {"<raiz>": {...campos}} validado por uma função compilada na criação.
+
+    - Todos os erros de campo são reunidos numa única resposta 400
+    - `regras` recebem o dict tipado e devolvem uma mensagem de erro (ou None);
+      só rodam quando todos os campos são válidos
+    - Campos não declarados são descartados
+    """
+
+    def __init__(self, raiz: str, campos: dict, regras: tuple = (), titulo: str = None):
+        self.__raiz = raiz
+        self.validar = self.__compilar(raiz, titulo or f"Erro na validação de dados da {raiz}", tuple(
+            (nome, campo.conversor, campo.obrigatorio, campo.padrao) for nome, campo in campos.items()
+        ), tuple(regras))
+
+    @property
+    def raiz(self) -> str:
+        return self.__raiz
+
+    @staticmethod
+    def __compilar(raiz: str, titulo: str, campos: tuple, regras: tuple):
+        def validar(body) -> dict:
+            if not isinstance(body, dict) or not isinstance(body.get(raiz), dict):
+                raise ErrorResponse(400, "Erro na validação de dados", {"message": f"O campo '{raiz}' é obrigatório!"})
+
+            entrada = body[raiz]
+            dados = {}
+            erros = []
+            for nome, converter, obrigatorio, padrao in campos:
+                valor = entrada.get(nome)
+                if valor is None:
+                    if obrigatorio:
+                        erros.append(f"O campo '{nome}' é obrigatório.")
+                    dados[nome] = padrao
+                    continue
+                try:
+                    dados[nome] = converter(nome, valor)
+                except ValueError as e:
+                    erros.append(str(e))
+
+            if not erros:
+                for regra in regras:
+                    mensagem = regra(dados)
+                    if mensagem:
+                        erros.append(mensagem)
+
+            if erros:
+                raise ErrorResponse(400, titulo, {"errors": erros})
+            return dados
+
+        return validar
+
+
+def corpo_validado() -> dict:
+    """Corpo já validado e tipado pelo validate_body do middleware da rota."""
+    return g.corpo
@@ -0,0 +1,47 @@
+from flask import Response, request
+
+
+"""
+Helpers de GET condicional (ETag / If-None-Match) para os controllers.
+
+O ETag vem da versão mantida pelo ServiceCache (contador por tabela/registro),
+então a comparação acontece antes de qualquer consulta ao banco ou
+serialização do corpo.
+
+Respostas comprimidas levam o ETag com sufixo da codificação ("...-gzip",
+"...-br"); If-None-Match aceita as duas formas.
+
+Exemplo:
+>>> etag = service.versaoLista()
+>>> resposta = nao_modificado(etag)
+>>> if resposta: return resposta
+>>> return com_etag(jsonify(dados), etag), 200
+"""
+
+
+SUFIXOS_CODIFICACAO = ("gzip", "br")
+
+
+def etag_codificado(etag: str, codificacao: str) -> str:
+    """ETag da representação comprimida (cada codificação é uma representação distinta)."""
+    return f"{etag}-{codificacao}"
+
+
+def nao_modificado(etag: str | None) -> Response | None:
+    """Retorna a resposta 304 se o cliente já tem a versão `etag`, senão None."""
+    if etag is None:
+        return None
+
+    enviados = request.if_none_match
+    if not enviados.contains_weak(etag) and \
+            not any(enviados.contains_weak(etag_codificado(etag, c)) for c in SUFIXOS_CODIFICACAO):
+        return None
+    return com_etag(Response(status=304), etag)
+
+
+def com_etag(resposta: Response, etag: str | None) -> Response:
+    """Adiciona ETag forte e obriga o cliente a revalidar a cada uso."""
+    if etag is not None:
+        resposta.set_etag(etag)
+        resposta.headers["Cache-Control"] = "private, no-cache"
+    return resposta
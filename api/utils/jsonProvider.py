@@ -0,0 +1,73 @@
+import dataclasses
+import decimal
+from datetime import date, datetime
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:   # sem orjson: usa o json da stdlib
+    orjson = None
+
+
+def padrao_json(o):
+    """
+    Conversões para tipos que o encoder não conhece.
+
+    Datas saem em ISO 8601 ("2025-01-15T00:00:00") nos dois caminhos (orjson
+    e stdlib); é o formato que o frontend espera (split('T')), em vez do
+    formato HTTP-date padrão do Flask.
+    """
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Objeto do tipo {type(o).__name__} não é serializável em JSON")
+
+
+class JsonProviderRapido(DefaultJSONProvider):
+    """
+    JSON provider do Flask que usa orjson quando instalado.
+
+    - jsonify() e request.get_json() passam por aqui
+    - orjson serializa datetime/date nativamente e escreve bytes direto no
+      corpo da resposta (sem str intermediária)
+    - Sem orjson, ou quando chamado com opções do json da stdlib (indent,
+      cls...), cai no DefaultJSONProvider com o mesmo formato de datas
+
+    Uso:
+    >>> app.json = JsonProviderRapido(app)
+    """
+
+    default = staticmethod(padrao_json)
+    sort_keys = False   # a ordem das chaves não faz parte do contrato da API
+
+    def __opcoes_orjson(self) -> int:
+        opcoes = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            opcoes |= orjson.OPT_SORT_KEYS
+        return opcoes
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=padrao_json, option=self.__opcoes_orjson()).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        opcoes = self.__opcoes_orjson() | orjson.OPT_APPEND_NEWLINE
+        if self.compact is False or (self.compact is None and self._app.debug):
+            opcoes |= orjson.OPT_INDENT_2
+        return self._app.response_class(orjson.dumps(obj, default=padrao_json, option=opcoes), mimetype=self.mimetype)
@@ -0,0 +1,188 @@
+import threading
+
+
+class _Metrica:
+    """
+    Base das métricas do registro.
+
+    Cada métrica guarda seus valores por combinação de labels e possui
+    um lock próprio, para que várias threads atualizem métricas diferentes
+    sem disputar o mesmo lock.
+    """
+
+    tipo = "untyped"
+
+    def __init__(self, nome: str, descricao: str, labels: tuple = ()):
+        self.nome = nome
+        self.descricao = descricao
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._valores = {}
+
+    def _chave(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(label, "")) for label in self.labels)
+
+    def _formatar_labels(self, chave: tuple, extra: dict | None = None) -> str:
+        pares = list(zip(self.labels, chave))
+        if extra:
+            pares.extend(extra.items())
+        if not pares:
+            return ""
+        corpo = ",".join(f'{nome}="{_escapar(valor)}"' for nome, valor in pares)
+        return "{" + corpo + "}"
+
+
+class Counter(_Metrica):
+    """Contador monotônico (ex.: total de requisições)."""
+
+    tipo = "counter"
+
+    def inc(self, valor: float = 1, **labels):
+        chave = self._chave(labels)
+        with self._lock:
+            self._valores[chave] = self._valores.get(chave, 0) + valor
+
+    def exportar(self) -> list[str]:
+        with self._lock:
+            itens = list(self._valores.items())
+        return [f"{self.nome}{self._formatar_labels(chave)} {_numero(valor)}" for chave, valor in itens]
+
+
+class Gauge(_Metrica):
+    """Valor instantâneo que pode subir ou descer (ex.: conexões em uso)."""
+
+    tipo = "gauge"
+
+    def set(self, valor: float, **labels):
+        chave = self._chave(labels)
+        with self._lock:
+            self._valores[chave] = valor
+
+    def inc(self, valor: float = 1, **labels):
+        chave = self._chave(labels)
+        with self._lock:
+            self._valores[chave] = self._valores.get(chave, 0) + valor
+
+    def dec(self, valor: float = 1, **labels):
+        self.inc(-valor, **labels)
+
+    def exportar(self) -> list[str]:
+        with self._lock:
+            itens = list(self._valores.items())
+        return [f"{self.nome}{self._formatar_labels(chave)} {_numero(valor)}" for chave, valor in itens]
+
+
+class Histogram(_Metrica):
+    """
+    Histograma de latência com buckets fixos (em segundos).
+
+    Os contadores de cada bucket são guardados de forma não cumulativa e
+    acumulados apenas na exportação, deixando o observe() barato.
+    """
+
+    tipo = "histogram"
+
+    BUCKETS_PADRAO = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, nome: str, descricao: str, labels: tuple = (), buckets: tuple = BUCKETS_PADRAO):
+        super().__init__(nome, descricao, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, valor: float, **labels):
+        chave = self._chave(labels)
+        indice = len(self.buckets)
+        for i, limite in enumerate(self.buckets):
+            if valor <= limite:
+                indice = i
+                break
+
+        with self._lock:
+            serie = self._valores.get(chave)
+            if serie is None:
+                # [contagens por bucket (+Inf no final), soma, total]
+                serie = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._valores[chave] = serie
+            serie[0][indice] += 1
+            serie[1] += valor
+            serie[2] += 1
+
+    def exportar(self) -> list[str]:
+        with self._lock:
+            itens = [(chave, (list(serie[0]), serie[1], serie[2])) for chave, serie in self._valores.items()]
+
+        linhas = []
+        for chave, (contagens, soma, total) in itens:
+            acumulado = 0
+            for limite, contagem in zip(self.buckets, contagens):
+                acumulado += contagem
+                linhas.append(f"{self.nome}_bucket{self._formatar_labels(chave, {'le': _numero(limite)})} {acumulado}")
+            linhas.append(f"{self.nome}_bucket{self._formatar_labels(chave, {'le': '+Inf'})} {total}")
+            linhas.append(f"{self.nome}_sum{self._formatar_labels(chave)} {_numero(soma)}")
+            linhas.append(f"{self.nome}_count{self._formatar_labels(chave)} {total}")
+        return linhas
+
+
+class Metrics:
+    """
+    Registro de métricas em memória do processo.
+
+    Responsável por:
+    - Criar (uma única vez) contadores, gauges e histogramas nomeados
+    - Exportar todas as métricas no formato texto do Prometheus (GET /metrics)
+    """
+
+    _lock = threading.Lock()
+    _metricas = {}
+
+    @staticmethod
+    def counter(nome: str, descricao: str, labels: tuple = ()) -> Counter:
+        return Metrics._registrar(Counter, nome, descricao, labels)
+
+    @staticmethod
+    def gauge(nome: str, descricao: str, labels: tuple = ()) -> Gauge:
+        return Metrics._registrar(Gauge, nome, descricao, labels)
+
+    @staticmethod
+    def histogram(nome: str, descricao: str, labels: tuple = (), buckets: tuple = Histogram.BUCKETS_PADRAO) -> Histogram:
+        with Metrics._lock:
+            metrica = Metrics._metricas.get(nome)
+            if metrica is None:
+                metrica = Histogram(nome, descricao, labels, buckets)
+                Metrics._metricas[nome] = metrica
+            return metrica
+
+    @staticmethod
+    def _registrar(classe, nome: str, descricao: str, labels: tuple):
+        with Metrics._lock:
+            metrica = Metrics._metricas.get(nome)
+            if metrica is None:
+                metrica = classe(nome, descricao, labels)
+                Metrics._metricas[nome] = metrica
+            elif not isinstance(metrica, classe):
+                raise ValueError(f"Métrica '{nome}' já registrada como {metrica.tipo}")
+            return metrica
+
+    @staticmethod
+    def exportar() -> str:
+        """
+        Gera o corpo da resposta no formato texto do Prometheus (versão 0.0.4).
+        """
+        with Metrics._lock:
+            metricas = list(Metrics._metricas.values())
+
+        linhas = []
+        for metrica in metricas:
+            linhas.append(f"# HELP {metrica.nome} {metrica.descricao}")
+            linhas.append(f"# TYPE {metrica.nome} {metrica.tipo}")
+            linhas.extend(metrica.exportar())
+        return "\n".join(linhas) + "\n"
+
+
+def _escapar(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _numero(valor) -> str:
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor)) if abs(valor) < 1e15 else repr(valor)
+    return repr(valor) if isinstance(valor, float) else str(valor)
@@ -0,0 +1,118 @@
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class SamplingProfiler:
+    """
+    Profiler por amostragem baseado em thread.
+
+    Uma thread auxiliar lê periodicamente as pilhas de todas as outras threads
+    (sys._current_frames) e conta quantas vezes cada pilha aparece. Como nada é
+    instrumentado, o custo fica restrito à thread de amostragem e pode ser
+    ligado em produção por alguns segundos.
+
+    Saídas suportadas:
+    - collapsed: formato "func_a;func_b;func_c 42" (flamegraph.pl, speedscope)
+    - speedscope: JSON do tipo "sampled" aceito por https://www.speedscope.app
+    """
+
+    INTERVALO_PADRAO = 0.005   # 5 ms entre amostras
+    MAX_SEGUNDOS = 60
+
+    _lock = threading.Lock()
+
+    def __init__(self, intervalo: float = INTERVALO_PADRAO):
+        self.__intervalo = intervalo
+        self.__amostras = Counter()
+        self.__total = 0
+
+    @property
+    def total_amostras(self) -> int:
+        return self.__total
+
+    def executar(self, segundos: float) -> bool:
+        """
+        Amostra as pilhas por `segundos` segundos (bloqueando a thread chamadora).
+
+        :return: False se outra sessão de profiling já estiver em andamento
+        """
+        if not SamplingProfiler._lock.acquire(blocking=False):
+            return False
+
+        try:
+            segundos = max(0.1, min(float(segundos), SamplingProfiler.MAX_SEGUNDOS))
+            amostrador = threading.Thread(target=self.__amostrar, args=(segundos, threading.get_ident()), daemon=True)
+            amostrador.start()
+            amostrador.join()
+            return True
+        finally:
+            SamplingProfiler._lock.release()
+
+    def __amostrar(self, segundos: float, thread_chamadora: int):
+        propria = threading.get_ident()
+        nomes = {t.ident: t.name for t in threading.enumerate()}
+        fim = time.perf_counter() + segundos
+
+        while time.perf_counter() < fim:
+            for ident, frame in sys._current_frames().items():
+                # ignora o próprio amostrador e a requisição que pediu o profiling
+                if ident in (propria, thread_chamadora):
+                    continue
+                pilha = self.__pilha(frame)
+                if pilha:
+                    self.__amostras[(nomes.get(ident, str(ident)),) + pilha] += 1
+                    self.__total += 1
+            time.sleep(self.__intervalo)
+
+    @staticmethod
+    def __pilha(frame) -> tuple:
+        quadros = []
+        while frame is not None:
+            codigo = frame.f_code
+            quadros.append(f"{codigo.co_name} ({codigo.co_filename}:{codigo.co_firstlineno})")
+            frame = frame.f_back
+        quadros.reverse()
+        return tuple(quadros)
+
+    def collapsed(self) -> str:
+        """Retorna as pilhas no formato collapsed ("a;b;c contagem" por linha)."""
+        linhas = [
+            ";".join(quadro.replace(";", ":") for quadro in pilha) + f" {contagem}"
+            for pilha, contagem in self.__amostras.most_common()
+        ]
+        return "\n".join(linhas) + "\n"
+
+    def speedscope(self, nome: str = "worker") -> dict:
+        """Retorna o perfil no formato JSON do speedscope (tipo 'sampled')."""
+        frames = []
+        indice_frames = {}
+        samples = []
+        weights = []
+
+        for pilha, contagem in self.__amostras.items():
+            indices = []
+            for quadro in pilha:
+                if quadro not in indice_frames:
+                    indice_frames[quadro] = len(frames)
+                    frames.append({"name": quadro})
+                indices.append(indice_frames[quadro])
+            samples.append(indices)
+            weights.append(contagem)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": nome,
+                "unit": "none",
+                "startValue": 0,
+                "endValue": self.__total,
+                "samples": samples,
+                "weights": weights
+            }],
+            "name": nome,
+            "exporter": "SamplingProfiler"
+        }
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+import math
+import threading
+import time
+
+from api.utils.metrics import Metrics
+
+
+class BackendMemoria:
+    """
+    Token buckets em memória (um processo).
+
+    Cada chave guarda (tokens, instante da última recarga, instante em que
+    estará cheio); buckets já cheios são descartados periodicamente, pois
+    equivalem a um bucket novo.
+    """
+
+    LIMPEZA_A_CADA = 4096   # consumos entre limpezas
+
+    def __init__(self):
+        self.__buckets = {}   # chave -> [tokens, ultimo, cheio_em]
+        self.__lock = threading.Lock()
+        self.__desde_limpeza = 0
+
+    def consumir(self, chave: str, capacidade: float, por_segundo: float, custo: float = 1) -> float:
+        """
+        Tenta retirar `custo` tokens do bucket.
+
+        :return: 0 se permitido; senão, segundos até haver tokens suficientes
+        """
+        agora = time.monotonic()
+        with self.__lock:
+            bucket = self.__buckets.get(chave)
+            if bucket is None:
+                bucket = self.__buckets[chave] = [capacidade, agora, agora]
+
+            tokens = min(capacidade, bucket[0] + (agora - bucket[1]) * por_segundo)
+            bucket[1] = agora
+
+            espera = 0
+            if tokens >= custo:
+                tokens -= custo
+            else:
+                espera = (custo - tokens) / por_segundo
+            bucket[0] = tokens
+            bucket[2] = agora + (capacidade - tokens) / por_segundo
+
+            self.__desde_limpeza += 1
+            if self.__desde_limpeza >= BackendMemoria.LIMPEZA_A_CADA:
+                self.__limpar(agora)
+            return espera
+
+    def __limpar(self, agora: float):
+        self.__buckets = {chave: bucket for chave, bucket in self.__buckets.items() if bucket[2] > agora}
+        self.__desde_limpeza = 0
+
+
+class BackendRedis:
+    """
+    Token buckets compartilhados entre processos/servidores via Redis.
+
+    O cálculo roda num script Lua (atômico) usando o relógio do próprio Redis.
+    Requer o pacote 'redis'; em desenvolvimento o BackendMemoria tem a mesma
+    interface e pode substituí-lo.
+    """
+
+    SCRIPT = """
+local tempo = redis.call('TIME')
+local agora = tonumber(tempo[1]) + tonumber(tempo[2]) / 1000000
+local capacidade = tonumber(ARGV[1])
+local por_segundo = tonumber(ARGV[2])
+local custo = tonumber(ARGV[3])
+
+local bucket = redis.call('HMGET', KEYS[1], 't', 'u')
+local tokens = tonumber(bucket[1]) or capacidade
+local ultimo = tonumber(bucket[2]) or agora
+tokens = math.min(capacidade, tokens + math.max(0, agora - ultimo) * por_segundo)
+
+local espera = 0
+if tokens >= custo then
+  tokens = tokens - custo
+else
+  espera = (custo - tokens) / por_segundo
+end
+
+redis.call('HSET', KEYS[1], 't', tokens, 'u', agora)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacidade / por_segundo * 1000))
+return tostring(espera)
+"""
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefixo: str = "casa_branca:rl:"):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("BackendRedis requer o pacote 'redis' (pip install redis)")
+
+        self.__prefixo = prefixo
+        self.__cliente = redis.Redis.from_url(url, socket_timeout=0.5)
+        self.__script = self.__cliente.register_script(BackendRedis.SCRIPT)
+
+    def consumir(self, chave: str, capacidade: float, por_segundo: float, custo: float = 1) -> float:
+        espera = self.__script(keys=[self.__prefixo + chave], args=[capacidade, por_segundo, custo])
+        return float(espera)
+
+
+class RateLimiter:
+    """
+    Limitador de requisições por token bucket, com regras nomeadas.
+
+    Exemplo:
+    >>> limiter = RateLimiter(BackendMemoria())
+    >>> limiter.regra("login_ip", capacidade=20, por_minuto=20)
+    >>> limiter.verificar("login_ip", "10.0.0.1")
+    0
+
+    verificar() retorna 0 quando a requisição pode seguir, ou os segundos
+    (arredondados para cima) a informar em Retry-After.
+    Se o backend falhar (ex.: Redis fora do ar) a requisição é liberada: o
+    limitador não pode derrubar o login.
+    """
+
+    def __init__(self, backend=None):
+        self.__backend = backend if backend is not None else BackendMemoria()
+        self.__regras = {}   # nome -> (capacidade, por_segundo)
+        self.__rejeitadas = Metrics.counter("rate_limit_rejected_total", "Requisições recusadas pelo rate limiter", ("regra",))
+        self.__falhas = Metrics.counter("rate_limit_backend_errors_total", "Falhas do backend do rate limiter", ("regra",))
+
+    def regra(self, nome: str, capacidade: int, por_minuto: float):
+        """Registra uma regra: rajada de até `capacidade`, recarga de `por_minuto` tokens por minuto."""
+        if capacidade <= 0 or por_minuto <= 0:
+            raise ValueError("capacidade e por_minuto devem ser positivos")
+        self.__regras[nome] = (capacidade, por_minuto / 60.0)
+        return self
+
+    def verificar(self, nome: str, chave: str, custo: float = 1) -> int:
+        capacidade, por_segundo = self.__regras[nome]
+        try:
+            espera = self.__backend.consumir(f"{nome}:{chave}", capacidade, por_segundo, custo)
+        except Exception as e:
+            print(f"⚠️  RateLimiter: backend indisponível ({e}); liberando requisição")
+            self.__falhas.inc(regra=nome)
+            return 0
+
+        if espera <= 0:
+            return 0
+        self.__rejeitadas.inc(regra=nome)
+        return max(1, math.ceil(espera))
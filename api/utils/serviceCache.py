@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+import pickle
+import secrets
+import threading
+
+from api.utils.cache import LRUCache
+from api.utils.metrics import Metrics
+from api.utils.singleFlight import SingleFlight
+
+
+class BackendLocal:
+    """
+    Backend em memória do ServiceCache (um processo).
+
+    Valores ficam num LRUCache (limite de itens + TTL); os contadores de versão
+    ficam num dicionário à parte, pois nunca podem ser descartados pelo LRU
+    (uma versão "zerada" faria chaves antigas voltarem a valer).
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        # versões recomeçam do zero a cada boot: a instância entra nos ETags
+        self.instancia = secrets.token_hex(4)
+        self.__valores = LRUCache(maxsize=maxsize)
+        self.__versoes = {}
+        self.__lock = threading.Lock()
+        self.__remocoes = Metrics.counter("service_cache_evictions_total", "Itens descartados pelo limite do cache de serviços")
+
+    def get(self, chave: str):
+        return self.__valores.get(chave)
+
+    def set(self, chave: str, valor, ttl: float):
+        antes = self.__valores.evictions
+        self.__valores.set(chave, valor, ttl=ttl)
+        descartados = self.__valores.evictions - antes
+        if descartados > 0:
+            self.__remocoes.inc(descartados)
+
+    def versoes(self, *chaves: str) -> list[int]:
+        return [self.__versoes.get(chave, 0) for chave in chaves]
+
+    def incrementar(self, chave: str):
+        with self.__lock:
+            self.__versoes[chave] = self.__versoes.get(chave, 0) + 1
+
+    def clear(self):
+        self.__valores.clear()
+
+
+class BackendRedis:
+    """
+    Backend compartilhado do ServiceCache (vários processos/servidores).
+
+    Valores serializados com pickle (preserva datetime/date dos DAOs) e com
+    expiração nativa do Redis; versões são contadores INCR sem expiração.
+    Descartes por memória ficam a cargo da política maxmemory do Redis.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefixo: str = "casa_branca:svc:"):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("BackendRedis requer o pacote 'redis' (pip install redis)")
+
+        self.__prefixo = prefixo
+        self.__cliente = redis.Redis.from_url(url, socket_timeout=0.5)
+        # identificador do "conjunto" de versões; muda se o Redis perder os dados
+        self.__cliente.set(prefixo + "instancia", secrets.token_hex(4), nx=True)
+        self.instancia = self.__cliente.get(prefixo + "instancia").decode()
+
+    def get(self, chave: str):
+        dados = self.__cliente.get(self.__prefixo + chave)
+        return pickle.loads(dados) if dados is not None else None
+
+    def set(self, chave: str, valor, ttl: float):
+        self.__cliente.set(self.__prefixo + chave, pickle.dumps(valor), px=int(ttl * 1000))
+
+    def versoes(self, *chaves: str) -> list[int]:
+        valores = self.__cliente.mget([self.__prefixo + chave for chave in chaves])
+        return [int(valor) if valor is not None else 0 for valor in valores]
+
+    def incrementar(self, chave: str):
+        self.__cliente.incr(self.__prefixo + chave)
+
+    def clear(self):
+        for chave in self.__cliente.scan_iter(match=self.__prefixo + "*"):
+            self.__cliente.delete(chave)
+
+
+class ServiceCache:
+    """
+    Cache de leituras da camada de serviço, com invalidação por escrita.
+
+    As chaves carregam contadores de versão guardados no backend:
+    - lista(entidade, consulta): versão das listas da entidade
+    - item(entidade, id): versão geral dos itens da entidade + versão do item
+
+    Escritas só incrementam versões (invalidar_lista / invalidar_item /
+    invalidar_tudo); as entradas antigas deixam de ser encontradas e saem por
+    TTL ou LRU. Como a versão é lida antes de ir ao banco, uma leitura que
+    corre junto com uma escrita grava o valor antigo sob a versão antiga e
+    não "ressuscita" dados desatualizados.
+
+    Faltas simultâneas na mesma chave são coalescidas (SingleFlight): só uma
+    thread vai ao banco e as demais recebem o mesmo resultado. Como a chave
+    inclui a versão, quem chega depois de uma escrita não pega carona numa
+    consulta iniciada antes dela.
+
+    Os valores devolvidos são compartilhados entre requisições: trate-os
+    como somente leitura.
+
+    Exemplo:
+    >>> cache = ServiceCache(BackendLocal(), ttl=30)
+    >>> cache.lista("hotel", "todos", hotel_dao.findAll)
+    >>> cache.invalidar_item("hotel", 3)   # após update/delete do hotel 3
+    """
+
+    def __init__(self, backend=None, ttl: float = 30, ativo: bool = True):
+        self.__backend = backend if backend is not None else BackendLocal()
+        self.__ttl = ttl
+        self.__ativo = ativo
+        self.__voo = SingleFlight("service_cache")
+        self.__consultas = Metrics.counter("service_cache_requests_total", "Consultas ao cache de serviços", ("entidade", "resultado"))
+
+    @staticmethod
+    def desativado() -> "ServiceCache":
+        """Cache que sempre vai ao banco (padrão dos serviços sem cache injetado)."""
+        return ServiceCache(ativo=False)
+
+    def lista(self, entidade: str, consulta: str, carregar):
+        return self.__obter(entidade, lambda: self.__chave_lista(entidade, consulta), carregar)
+
+    def item(self, entidade: str, id_item, carregar):
+        return self.__obter(entidade, lambda: self.__chave_item(entidade, id_item), carregar)
+
+    def invalidar_lista(self, entidade: str):
+        """Após criar um registro: listas mudam, itens existentes não."""
+        self.__incrementar(f"versao:{entidade}:lista")
+
+    def invalidar_item(self, entidade: str, id_item):
+        """Após atualizar/remover um registro: o próprio item e as listas."""
+        self.__incrementar(f"versao:{entidade}:{id_item}", f"versao:{entidade}:lista")
+
+    def invalidar_tudo(self, entidade: str):
+        """Para efeitos em massa (ex.: ON DELETE CASCADE em outra tabela)."""
+        self.__incrementar(f"versao:{entidade}:itens", f"versao:{entidade}:lista")
+
+    def versao_lista(self, entidade: str) -> str | None:
+        """Versão atual das listas da entidade (base de ETags); None sem cache ativo."""
+        return self.__versao(entidade, f"versao:{entidade}:lista")
+
+    def versao_item(self, entidade: str, id_item) -> str | None:
+        """Versão atual de um item da entidade (base de ETags); None sem cache ativo."""
+        return self.__versao(f"{entidade}-{id_item}", f"versao:{entidade}:itens", f"versao:{entidade}:{id_item}")
+
+    def __versao(self, nome: str, *chaves: str) -> str | None:
+        if not self.__ativo:
+            return None
+        try:
+            versoes = self.__backend.versoes(*chaves)
+        except Exception as e:
+            print(f"⚠️  ServiceCache: backend indisponível ({e})")
+            return None
+        return f"{self.__backend.instancia}-{nome}-" + ".".join(str(v) for v in versoes)
+
+    def __chave_lista(self, entidade: str, consulta: str) -> str:
+        versao, = self.__backend.versoes(f"versao:{entidade}:lista")
+        return f"{entidade}:l{versao}:{consulta}"
+
+    def __chave_item(self, entidade: str, id_item) -> str:
+        geral, versao = self.__backend.versoes(f"versao:{entidade}:itens", f"versao:{entidade}:{id_item}")
+        return f"{entidade}:i{geral}:{id_item}:v{versao}"
+
+    def __incrementar(self, *chaves: str):
+        if not self.__ativo:
+            return
+        try:
+            for chave in chaves:
+                self.__backend.incrementar(chave)
+        except Exception as e:
+            print(f"❌ ServiceCache: falha ao invalidar {chaves} ({e})")
+
+    def __obter(self, entidade: str, montar_chave, carregar):
+        if not self.__ativo:
+            return carregar()
+
+        try:
+            chave = montar_chave()
+            valor = self.__backend.get(chave)
+        except Exception as e:
+            # backend fora do ar: a leitura segue direto para o banco
+            print(f"⚠️  ServiceCache: backend indisponível ({e})")
+            return carregar()
+
+        if valor is not None:
+            self.__consultas.inc(entidade=entidade, resultado="hit")
+            return valor
+
+        self.__consultas.inc(entidade=entidade, resultado="miss")
+        return self.__voo.executar(chave, lambda: self.__carregar(chave, carregar))
+
+    def __carregar(self, chave: str, carregar):
+        valor = carregar()
+        # None (registro inexistente) não é guardado: o id pode ser criado logo depois
+        if valor is not None:
+            try:
+                self.__backend.set(chave, valor, self.__ttl)
+            except Exception as e:
+                print(f"⚠️  ServiceCache: falha ao gravar {chave} ({e})")
+        return valor
@@ -0,0 +1,55 @@
+import threading
+
+from api.utils.metrics import Metrics
+
+
+class _Chamada:
+    def __init__(self):
+        self.concluida = threading.Event()
+        self.resultado = None
+        self.erro = None
+
+
+class SingleFlight:
+    """
+    Coalescência de chamadas idênticas em andamento ("single-flight").
+
+    A primeira thread que pede uma chave executa a função; as que chegam com
+    a mesma chave enquanto ela roda esperam e recebem o mesmo resultado (ou a
+    mesma exceção). Assim N leituras simultâneas iguais viram uma só consulta.
+
+    Exemplo:
+    >>> voo = SingleFlight()
+    >>> voo.executar("hotel:todos", hotel_dao.findAll)
+    """
+
+    def __init__(self, nome: str = "padrao"):
+        self.__nome = nome
+        self.__em_andamento = {}   # chave -> _Chamada
+        self.__lock = threading.Lock()
+        self.__compartilhadas = Metrics.counter("singleflight_shared_total", "Chamadas atendidas pelo resultado de outra em andamento", ("grupo",))
+
+    def executar(self, chave, funcao):
+        with self.__lock:
+            chamada = self.__em_andamento.get(chave)
+            lider = chamada is None
+            if lider:
+                chamada = self.__em_andamento[chave] = _Chamada()
+
+        if not lider:
+            self.__compartilhadas.inc(grupo=self.__nome)
+            chamada.concluida.wait()
+            if chamada.erro is not None:
+                raise chamada.erro
+            return chamada.resultado
+
+        try:
+            chamada.resultado = funcao()
+            return chamada.resultado
+        except BaseException as e:
+            chamada.erro = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__em_andamento[chave]
+            chamada.concluida.set()
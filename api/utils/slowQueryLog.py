@@ -0,0 +1,142 @@
+import os
+import threading
+from datetime import datetime
+
+from api.utils.metrics import Metrics
+
+
+class SlowQueryLog:
+    """
+    Classe SlowQueryLog
+    Responsável por registrar comandos SQL lentos em um log dedicado.
+
+    - Cada comando acima do limiar é registrado com SQL, parâmetros (redigidos),
+      duração e número de linhas.
+    - Na primeira vez que um comando lento aparece, o plano de execução (EXPLAIN)
+      é capturado em segundo plano e anexado ao log.
+    """
+
+    LOG_FILE = "api/system/slow_query.log"
+    LIMIAR_SEGUNDOS = 0.2
+    MAX_COMANDOS_EXPLICADOS = 1000
+
+    _lock = threading.Lock()
+    _explicados = set()
+    _contador = Metrics.counter(
+        "db_slow_queries_total",
+        "Total de comandos SQL acima do limiar do slow-query log",
+        ("operacao", "tabela")
+    )
+
+    @staticmethod
+    def configurar(limiar_segundos: float = None, log_file: str = None):
+        """Ajusta o limiar (em segundos) e o arquivo de destino."""
+        if limiar_segundos is not None:
+            SlowQueryLog.LIMIAR_SEGUNDOS = limiar_segundos
+        if log_file is not None:
+            SlowQueryLog.LOG_FILE = log_file
+
+    @staticmethod
+    def verificar(sql: str, params, operacao: str, tabela: str, duracao: float, linhas: int, database=None):
+        """
+        Registra o comando se a duração ultrapassar o limiar.
+
+        :param database: DatabaseConfig usado para capturar o EXPLAIN (opcional)
+        """
+        if duracao < SlowQueryLog.LIMIAR_SEGUNDOS:
+            return
+
+        SlowQueryLog._contador.inc(operacao=operacao, tabela=tabela)
+        comando = " ".join(sql.split())
+
+        SlowQueryLog._write_log(
+            f"SQL: {comando}\n"
+            f"Parâmetros: {SlowQueryLog.redigir(params)}\n"
+            f"Duração: {duracao * 1000:.1f} ms | Linhas: {linhas}"
+        )
+
+        with SlowQueryLog._lock:
+            primeira_vez = (
+                comando not in SlowQueryLog._explicados
+                and len(SlowQueryLog._explicados) < SlowQueryLog.MAX_COMANDOS_EXPLICADOS
+            )
+            if primeira_vez:
+                SlowQueryLog._explicados.add(comando)
+
+        if primeira_vez and database is not None and operacao in ("SELECT", "UPDATE", "DELETE", "INSERT"):
+            # EXPLAIN roda fora da thread da requisição para não somar latência
+            threading.Thread(
+                target=SlowQueryLog._capturar_explain,
+                args=(database, sql, params, comando),
+                daemon=True
+            ).start()
+
+    @staticmethod
+    def redigir(params) -> str:
+        """
+        Substitui os valores dos parâmetros por seu tipo (e tamanho, para strings),
+        evitando gravar emails, CPFs ou senhas no log.
+
+        Exemplo:
+        >>> SlowQueryLog.redigir(("joao@x.com", 10))
+        '(<str:10>, <int>)'
+        """
+        if params is None:
+            return "()"
+        if isinstance(params, dict):
+            itens = [f"{chave}=<{SlowQueryLog._descrever(valor)}>" for chave, valor in params.items()]
+        else:
+            itens = [f"<{SlowQueryLog._descrever(valor)}>" for valor in params]
+        return "(" + ", ".join(itens) + ")"
+
+    @staticmethod
+    def _descrever(valor) -> str:
+        if valor is None:
+            return "null"
+        if isinstance(valor, (str, bytes)):
+            return f"{type(valor).__name__}:{len(valor)}"
+        return type(valor).__name__
+
+    @staticmethod
+    def _capturar_explain(database, sql: str, params, comando: str):
+        try:
+            conn = database.get_raw_connection()
+        except Exception as e:
+            SlowQueryLog._write_log(f"EXPLAIN não capturado (sem conexão livre): {comando}\n{e}")
+            return
+
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("EXPLAIN " + sql, params)
+                colunas = [c[0] for c in cursor.description or []]
+                linhas = cursor.fetchall()
+            finally:
+                cursor.close()
+        except Exception as e:
+            SlowQueryLog._write_log(f"EXPLAIN falhou para: {comando}\n{e}")
+            return
+        finally:
+            conn.close()
+
+        plano = [" | ".join(colunas)]
+        plano.extend(" | ".join(str(v) for v in linha) for linha in linhas)
+        SlowQueryLog._write_log(f"EXPLAIN {comando}\n" + "\n".join(plano), "EXPLAIN")
+
+    @staticmethod
+    def _write_log(message: str, log_type: str = "SLOW"):
+        """
+        Escreve a entrada no arquivo, criando diretório se necessário.
+        """
+        directory_path = os.path.dirname(SlowQueryLog.LOG_FILE)
+        os.makedirs(directory_path, exist_ok=True)
+
+        date_time = datetime.utcnow().isoformat()
+        entry = f"[{date_time}] [{log_type}]\n{message}\n{'-'*80}\n"
+
+        try:
+            with SlowQueryLog._lock:
+                with open(SlowQueryLog.LOG_FILE, "a", encoding="utf-8") as f:
+                    f.write(entry)
+        except Exception as e:
+            print("🔴 Falha ao gravar slow-query log:", e)
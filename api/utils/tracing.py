@@ -0,0 +1,312 @@
+import contextvars
+import json
+import os
+import queue
+import random
+import secrets
+import threading
+import time
+import urllib.request
+from functools import wraps
+
+
+class Span:
+    """
+    Trecho de execução cronometrado dentro de um trace.
+
+    Os spans formam uma árvore (parent_id) e são coletados no trace ao qual
+    pertencem; o trace inteiro é exportado quando o span raiz termina.
+    """
+
+    KIND_INTERNAL = 1
+    KIND_SERVER = 2
+    KIND_CLIENT = 3
+
+    def __init__(self, trace, nome: str, parent_id: str | None, kind: int, atributos: dict):
+        self.trace = trace
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.nome = nome
+        self.kind = kind
+        self.atributos = atributos
+        self.inicio_ns = time.time_ns()
+        self.fim_ns = None
+        self.erro = None
+
+    def set_atributo(self, chave: str, valor):
+        self.atributos[chave] = valor
+
+    def finalizar(self, fim_ns: int = None):
+        self.fim_ns = fim_ns or time.time_ns()
+        self.trace.adicionar(self)
+
+    def otlp(self) -> dict:
+        span = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.nome,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.inicio_ns),
+            "endTimeUnixNano": str(self.fim_ns),
+            "attributes": [_atributo_otlp(k, v) for k, v in self.atributos.items()],
+            "status": {"code": 2, "message": self.erro} if self.erro else {"code": 1}
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _Trace:
+    """Agrupa os spans finalizados de uma mesma requisição."""
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def adicionar(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+
+class ExportadorArquivo:
+    """
+    Grava cada trace como uma linha OTLP/JSON (ExportTraceServiceRequest) em arquivo.
+
+    Ao passar de `tamanho_maximo` bytes o arquivo é rotacionado (traces.jsonl.1,
+    .2, ...), mantendo no máximo `backups` arquivos antigos.
+    """
+
+    def __init__(self, caminho: str = "api/system/traces.jsonl", tamanho_maximo: int = 50 * 1024 * 1024, backups: int = 3):
+        self.caminho = caminho
+        self.tamanho_maximo = tamanho_maximo
+        self.backups = backups
+
+    def exportar(self, payload: dict):
+        linha = json.dumps(payload, ensure_ascii=False) + "\n"
+        os.makedirs(os.path.dirname(self.caminho), exist_ok=True)
+        if self.tamanho_maximo and os.path.exists(self.caminho) \
+                and os.path.getsize(self.caminho) + len(linha) > self.tamanho_maximo:
+            self.__rotacionar()
+        with open(self.caminho, "a", encoding="utf-8") as f:
+            f.write(linha)
+
+    def __rotacionar(self):
+        # só a thread de exportação escreve aqui: não precisa de lock
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.caminho}.{i}"):
+                os.replace(f"{self.caminho}.{i}", f"{self.caminho}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.caminho, f"{self.caminho}.1")
+        else:
+            os.remove(self.caminho)
+
+
+class ExportadorHttp:
+    """Envia cada trace para um coletor OTLP/HTTP (ex.: http://127.0.0.1:4318/v1/traces)."""
+
+    def __init__(self, url: str = "http://127.0.0.1:4318/v1/traces", timeout: float = 2.0):
+        self.url = url
+        self.timeout = timeout
+
+    def exportar(self, payload: dict):
+        corpo = json.dumps(payload).encode("utf-8")
+        requisicao = urllib.request.Request(self.url, data=corpo, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(requisicao, timeout=self.timeout):
+            pass
+
+
+class Tracer:
+    """
+    Tracing leve baseado em contextvars.
+
+    - Tracer.iniciar_trace() abre o span raiz de uma requisição
+    - Tracer.span() / @Tracer.rastrear() criam spans filhos do span atual
+    - Tracer.registrar_span() registra um span já cronometrado (ex.: comandos SQL)
+    - Ao finalizar o span raiz, o trace é enviado a uma fila e exportado em OTLP/JSON
+      por uma thread de fundo, fora do caminho da requisição
+    - São exportados os traces com erro, os com duração >= LIMIAR_EXPORTACAO e,
+      dos demais, uma amostra de TAXA_AMOSTRAGEM (0.0 a 1.0)
+
+    Fora de um trace ativo todas as operações são no-op.
+    """
+
+    SERVICE_NAME = "casa_branca_api"
+    LIMIAR_EXPORTACAO = 0.0    # exporta apenas traces com duração >= limiar (segundos)
+    TAXA_AMOSTRAGEM = 0.0      # fração dos traces abaixo do limiar exportada mesmo assim
+    TAMANHO_FILA = 1000
+
+    _span_atual = contextvars.ContextVar("span_atual", default=None)
+    _exportador = None
+    _fila = None
+    _thread = None
+
+    @staticmethod
+    def configurar(exportador=None, limiar_exportacao: float = None, service_name: str = None,
+                   taxa_amostragem: float = None):
+        """Define o exportador (arquivo ou HTTP) e inicia a thread de exportação."""
+        if limiar_exportacao is not None:
+            Tracer.LIMIAR_EXPORTACAO = limiar_exportacao
+        if taxa_amostragem is not None:
+            if not 0.0 <= taxa_amostragem <= 1.0:
+                raise ValueError("taxa_amostragem deve estar entre 0.0 e 1.0")
+            Tracer.TAXA_AMOSTRAGEM = taxa_amostragem
+        if service_name is not None:
+            Tracer.SERVICE_NAME = service_name
+
+        Tracer._exportador = exportador or ExportadorArquivo()
+        if Tracer._thread is None:
+            Tracer._fila = queue.Queue(maxsize=Tracer.TAMANHO_FILA)
+            Tracer._thread = threading.Thread(target=Tracer._exportar_em_fundo, name="tracing-exporter", daemon=True)
+            Tracer._thread.start()
+
+    @staticmethod
+    def span_atual() -> Span | None:
+        return Tracer._span_atual.get()
+
+    @staticmethod
+    def trace_id_atual() -> str | None:
+        span = Tracer._span_atual.get()
+        return span.trace.trace_id if span else None
+
+    @staticmethod
+    def iniciar_trace(nome: str, traceparent: str = None, **atributos):
+        """
+        Abre o span raiz (kind SERVER). Aceita o cabeçalho W3C 'traceparent'
+        para continuar um trace iniciado pelo cliente.
+
+        :return: (span, token) - o token deve ser passado para finalizar_trace()
+        """
+        trace_id, parent_id = _ler_traceparent(traceparent)
+        span = Span(_Trace(trace_id or secrets.token_hex(16)), nome, parent_id, Span.KIND_SERVER, atributos)
+        token = Tracer._span_atual.set(span)
+        return span, token
+
+    @staticmethod
+    def finalizar_trace(span: Span, token, erro: str = None):
+        """Fecha o span raiz, restaura o contexto e agenda a exportação do trace."""
+        if erro:
+            span.erro = erro
+        span.finalizar()
+        Tracer._span_atual.reset(token)
+
+        if Tracer._fila is None:
+            return
+        if not span.erro and (span.fim_ns - span.inicio_ns) / 1e9 < Tracer.LIMIAR_EXPORTACAO \
+                and random.random() >= Tracer.TAXA_AMOSTRAGEM:
+            return
+        try:
+            Tracer._fila.put_nowait(span.trace)
+        except queue.Full:
+            print("⚠️  Tracer: fila de exportação cheia, trace descartado")
+
+    @staticmethod
+    def span(nome: str, kind: int = Span.KIND_INTERNAL, **atributos):
+        """Context manager que cria um span filho do span atual."""
+        return _SpanContexto(nome, kind, atributos)
+
+    @staticmethod
+    def rastrear(nome: str = None):
+        """
+        Decorator que envolve a função em um span.
+
+        Exemplo:
+        >>> @Tracer.rastrear("ReservaService.createReserva")
+        ... def createReserva(self, body): ...
+        """
+        def decorator(f):
+            nome_span = nome or f.__qualname__
+
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                if Tracer._span_atual.get() is None:
+                    return f(*args, **kwargs)
+                with _SpanContexto(nome_span, Span.KIND_INTERNAL, {}):
+                    return f(*args, **kwargs)
+            return decorated_function
+        return decorator
+
+    @staticmethod
+    def registrar_span(nome: str, duracao: float, kind: int = Span.KIND_CLIENT, **atributos):
+        """Registra como filho do span atual um trecho que terminou agora e durou `duracao` segundos."""
+        pai = Tracer._span_atual.get()
+        if pai is None:
+            return
+        span = Span(pai.trace, nome, pai.span_id, kind, atributos)
+        fim_ns = time.time_ns()
+        span.inicio_ns = fim_ns - int(duracao * 1e9)
+        span.finalizar(fim_ns)
+
+    @staticmethod
+    def _exportar_em_fundo():
+        while True:
+            trace = Tracer._fila.get()
+            try:
+                Tracer._exportador.exportar(Tracer._otlp(trace))
+            except Exception as e:
+                print(f"🔴 Falha ao exportar trace {trace.trace_id}: {e}")
+
+    @staticmethod
+    def _otlp(trace: _Trace) -> dict:
+        with trace._lock:
+            spans = [span.otlp() for span in trace.spans]
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_atributo_otlp("service.name", Tracer.SERVICE_NAME)]},
+                "scopeSpans": [{
+                    "scope": {"name": "api.utils.tracing"},
+                    "spans": spans
+                }]
+            }]
+        }
+
+
+class _SpanContexto:
+    def __init__(self, nome: str, kind: int, atributos: dict):
+        self.__nome = nome
+        self.__kind = kind
+        self.__atributos = atributos
+        self.__span = None
+        self.__token = None
+
+    def __enter__(self):
+        pai = Tracer._span_atual.get()
+        if pai is None:
+            return None
+        self.__span = Span(pai.trace, self.__nome, pai.span_id, self.__kind, self.__atributos)
+        self.__token = Tracer._span_atual.set(self.__span)
+        return self.__span
+
+    def __exit__(self, tipo, erro, tb):
+        if self.__span is None:
+            return False
+        if erro is not None:
+            self.__span.erro = f"{tipo.__name__}: {erro}"
+        self.__span.finalizar()
+        Tracer._span_atual.reset(self.__token)
+        return False
+
+
+def _ler_traceparent(traceparent: str | None) -> tuple[str | None, str | None]:
+    # formato: 00-<trace_id 32 hex>-<parent_id 16 hex>-<flags>
+    if not traceparent:
+        return None, None
+    partes = traceparent.strip().split("-")
+    if len(partes) != 4 or len(partes[1]) != 32 or len(partes[2]) != 16:
+        return None, None
+    try:
+        int(partes[1], 16)
+        int(partes[2], 16)
+    except ValueError:
+        return None, None
+    return partes[1], partes[2]
+
+
+def _atributo_otlp(chave: str, valor) -> dict:
+    if isinstance(valor, bool):
+        return {"key": chave, "value": {"boolValue": valor}}
+    if isinstance(valor, int):
+        return {"key": chave, "value": {"intValue": str(valor)}}
+    if isinstance(valor, float):
+        return {"key": chave, "value": {"doubleValue": valor}}
+    return {"key": chave, "value": {"stringValue": str(valor)}}
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark da serialização JSON das respostas de listagem.
+
+Compara, nos mesmos formatos de resposta dos controllers (index de hotéis,
+hóspedes e reservas), o tempo de app.json.response(...) com:
+
+- flask_padrao  → DefaultJSONProvider do Flask (datas em HTTP-date)
+- stdlib_iso    → JsonProviderRapido sem orjson (json da stdlib, datas ISO)
+- orjson        → JsonProviderRapido com orjson (se instalado)
+
+Uso (a partir da raiz do repositório):
+    python -m benchmarks.jsonSerializacao --tamanhos 100,10000,100000 --saida json.json
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from api.utils import jsonProvider
+from api.utils.jsonProvider import JsonProviderRapido
+from benchmarks.requestPath import commit_atual, percentil
+
+
+def respostas(tamanho: int, semente: int = 42) -> dict:
+    """Monta os corpos de index() de cada controller com `tamanho` linhas."""
+    aleatorio = random.Random(semente)
+    base = datetime(2025, 1, 1)
+
+    hoteis = [
+        {"idHotel": i, "nome": f"Hotel {i:07d}", "capacidade": aleatorio.randint(10, 500)}
+        for i in range(1, tamanho + 1)
+    ]
+    hospedes = [
+        {
+            "idHospede": i,
+            "nome": f"Hospede {i:07d}",
+            "cpf": f"{aleatorio.randint(0, 99999999999):011d}",
+            "email": f"hospede{i}@exemplo.com",
+            "telefone": f"(11) 9{aleatorio.randint(0, 99999999):08d}",
+            "requisicao": None if i % 3 else "Quarto no andar térreo",
+        }
+        for i in range(1, tamanho + 1)
+    ]
+    reservas = []
+    for i in range(1, tamanho + 1):
+        inicio = base + timedelta(days=aleatorio.randint(0, 730))
+        reservas.append({
+            "idReserva": i,
+            "idHospede": aleatorio.randint(1, max(1, tamanho // 10)),
+            "idHotel": aleatorio.randint(1, max(1, tamanho // 100)),
+            "inicio": inicio,
+            "fim": inicio + timedelta(days=aleatorio.randint(1, 14)),
+        })
+
+    def envelope(chave, dados):
+        return {"success": True, "message": "Busca realizada com sucesso", "data": {chave: dados}}
+
+    return {
+        "listar_hoteis": envelope("Hoteis", hoteis),
+        "listar_hospedes": envelope("Hospedes", hospedes),
+        "listar_reservas": envelope("reservas", reservas),
+    }
+
+
+def medir(provider_classe, sem_orjson: bool, corpo: dict, iteracoes: int) -> dict:
+    app = Flask("benchmark_json")
+    app.json = provider_classe(app)
+
+    orjson_original = jsonProvider.orjson
+    if sem_orjson:
+        jsonProvider.orjson = None
+    try:
+        with app.app_context():
+            app.json.response(corpo).get_data()   # aquecimento
+            latencias = []
+            for _ in range(iteracoes):
+                inicio = time.perf_counter()
+                tamanho_bytes = len(app.json.response(corpo).get_data())
+                latencias.append(time.perf_counter() - inicio)
+    finally:
+        jsonProvider.orjson = orjson_original
+
+    return {
+        "iteracoes": iteracoes,
+        "bytes": tamanho_bytes,
+        "media_ms": round(statistics.fmean(latencias) * 1000, 3),
+        "p50_ms": round(percentil(latencias, 50) * 1000, 3),
+        "p99_ms": round(percentil(latencias, 99) * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark da serialização JSON das listagens")
+    parser.add_argument("--tamanhos", default="100,10000,100000", help="linhas por listagem, separadas por vírgula")
+    parser.add_argument("--iteracoes", type=int, default=20, help="serializações por medição")
+    parser.add_argument("--saida", default=None, help="arquivo JSON de saída (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    providers = [
+        ("flask_padrao", DefaultJSONProvider, False),
+        ("stdlib_iso", JsonProviderRapido, True),
+    ]
+    if jsonProvider.orjson is not None:
+        providers.append(("orjson", JsonProviderRapido, False))
+    else:
+        print("⚠️  orjson não instalado: medindo apenas os caminhos da stdlib", file=sys.stderr)
+
+    resultados = []
+    for tamanho in [int(t) for t in args.tamanhos.split(",") if t.strip()]:
+        print(f"⏱️  Serializando listagens com {tamanho} linhas...", file=sys.stderr)
+        for cenario, corpo in respostas(tamanho).items():
+            for nome, classe, sem_orjson in providers:
+                resultado = medir(classe, sem_orjson, corpo, args.iteracoes)
+                resultado.update({"cenario": cenario, "provider": nome, "tamanho": tamanho})
+                resultados.append(resultado)
+                print(
+                    f"   {cenario:<16} {nome:<13} p50={resultado['p50_ms']:>9.2f}ms  "
+                    f"p99={resultado['p99_ms']:>9.2f}ms  {resultado['bytes']} bytes",
+                    file=sys.stderr
+                )
+
+    relatorio = {
+        "commit": commit_atual(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "resultados": resultados
+    }
+
+    texto = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
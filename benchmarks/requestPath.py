@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark do caminho completo da requisição (middlewares → control → service → DAO).
+
+Sobe o Server pelo test client do Flask contra um stand-in SQLite (padrão) ou
+um MySQL/MariaDB local, popula dados sintéticos em cada tamanho e mede vazão
+e latência (p50/p99) dos cenários:
+
+- login                → POST /api/v1/auth/login (bcrypt)
+- listar_hoteis        → GET  /api/v1/hoteis
+- listar_hospedes      → GET  /api/v1/hospedes
+- listar_reservas      → GET  /api/v1/reservas
+- criar_reserva        → POST /api/v1/reservas (inclui a checagem de sobreposição)
+- disponibilidade      → POST /api/v1/reservas em período já ocupado (a checagem
+                         de sobreposição rejeita com 400 antes do INSERT)
+
+Uso (a partir da raiz do repositório):
+    python -m benchmarks.requestPath --tamanhos 1000,100000,1000000 --saida bench.json
+    python -m benchmarks.requestPath --backend mysql --mysql-senha "..." --tamanhos 1000
+
+A saída JSON (um objeto por cenário/tamanho) pode ser comparada entre commits.
+Logs de erro, slow-query log e traces vão para um diretório temporário, não
+para api/system/.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from benchmarks import seed
+from benchmarks.sqliteDatabase import SqliteDatabaseConfig
+
+
+def percentil(valores: list[float], p: float) -> float:
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+
+def redirecionar_logs(diretorio: str):
+    """Aponta Logger, SlowQueryLog e Tracer para `diretorio` (chamar depois de Server.init())."""
+    from api.utils.logger import Logger
+    from api.utils.slowQueryLog import SlowQueryLog
+    from api.utils.tracing import Tracer, ExportadorArquivo
+
+    Logger.LOG_FILE = os.path.join(diretorio, "log.log")
+    SlowQueryLog.configurar(log_file=os.path.join(diretorio, "slow_query.log"))
+    Tracer.configurar(ExportadorArquivo(os.path.join(diretorio, "traces.jsonl")))
+
+
+def preparar_sqlite(diretorio: str, tamanho: int):
+    caminho = os.path.join(diretorio, f"bench_{tamanho}.db")
+    if os.path.exists(caminho):
+        os.remove(caminho)
+    db = SqliteDatabaseConfig(caminho)
+    db.criar_schema()
+
+    import sqlite3
+    conexao = sqlite3.connect(caminho)
+    try:
+        conexao.execute("PRAGMA synchronous = OFF")
+        info = seed.popular(conexao, tamanho, placeholder="?")
+    finally:
+        conexao.close()
+    return db, info
+
+
+def preparar_mysql(args, tamanho: int):
+    import mysql.connector
+    from api.database.database import DatabaseConfig
+
+    conexao = mysql.connector.connect(
+        host=args.mysql_host, port=args.mysql_porta, user=args.mysql_usuario,
+        password=args.mysql_senha, database=args.mysql_banco
+    )
+    try:
+        cursor = conexao.cursor()
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for tabela in ("reserva", "hospede", "hotel", "usuarios"):
+            cursor.execute(f"TRUNCATE TABLE {tabela}")
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        cursor.close()
+        info = seed.popular(conexao, tamanho, placeholder="%s")
+    finally:
+        conexao.close()
+
+    db = DatabaseConfig(
+        pool_name="benchpool", pool_size=args.concorrencia + 2, host=args.mysql_host,
+        user=args.mysql_usuario, password=args.mysql_senha, database=args.mysql_banco, port=args.mysql_porta
+    )
+    return db, info
+
+
+class Cenario:
+    """Um cenário gera, a cada iteração, (método, url, corpo json) e o status esperado."""
+
+    def __init__(self, nome: str, gerar, status_esperado: int, iteracoes: int):
+        self.nome = nome
+        self.gerar = gerar
+        self.status_esperado = status_esperado
+        self.iteracoes = iteracoes
+
+
+def montar_cenarios(info: dict, iteracoes: int, iteracoes_listagem: int) -> list[Cenario]:
+    credenciais = {"usuario": {"email": seed.EMAIL_ADMIN, "senha": seed.SENHA_ADMIN}}
+
+    # períodos livres: bem depois das reservas sintéticas (que vão até hoje + 1 ano)
+    base_livre = date.today() + timedelta(days=800)
+    contador = {"i": 0}
+    trava = threading.Lock()
+
+    def nova_reserva():
+        with trava:
+            i = contador["i"]
+            contador["i"] += 1
+        inicio = base_livre + timedelta(days=3 * i)
+        return ("POST", "/api/v1/reservas/", {"Reserva": {
+            "idHospede": 1 + i % info["hospedes"],
+            "idHotel": 1 + i % info["hoteis"],
+            "inicio": inicio.isoformat(),
+            "fim": (inicio + timedelta(days=2)).isoformat()
+        }})
+
+    futuras = info["reservas_futuras"] or [(1, base_livre, base_livre + timedelta(days=2))]
+
+    def reserva_ocupada():
+        with trava:
+            i = contador["i"]
+            contador["i"] += 1
+        id_hotel, inicio, fim = futuras[i % len(futuras)]
+        return ("POST", "/api/v1/reservas/", {"Reserva": {
+            "idHospede": 1, "idHotel": id_hotel,
+            "inicio": inicio.isoformat(), "fim": fim.isoformat()
+        }})
+
+    return [
+        Cenario("login", lambda: ("POST", "/api/v1/auth/login", credenciais), 200, iteracoes),
+        Cenario("listar_hoteis", lambda: ("GET", "/api/v1/hoteis/", None), 200, iteracoes_listagem),
+        Cenario("listar_hospedes", lambda: ("GET", "/api/v1/hospedes/", None), 200, iteracoes_listagem),
+        Cenario("listar_reservas", lambda: ("GET", "/api/v1/reservas/", None), 200, iteracoes_listagem),
+        Cenario("criar_reserva", nova_reserva, 200, iteracoes),
+        Cenario("disponibilidade", reserva_ocupada, 400, iteracoes),
+    ]
+
+
+def executar_cenario(app, token: str, cenario: Cenario, concorrencia: int, limite_segundos: float) -> dict:
+    headers = {"Authorization": f"Bearer {token}"}
+    latencias = []
+    erros = 0
+    trava = threading.Lock()
+    prazo = time.perf_counter() + limite_segundos
+
+    def trabalhador(quantidade: int):
+        nonlocal erros
+        cliente = app.test_client()
+        for _ in range(quantidade):
+            if time.perf_counter() > prazo:
+                return
+            metodo, url, corpo = cenario.gerar()
+            inicio = time.perf_counter()
+            resposta = cliente.open(url, method=metodo, json=corpo, headers=headers)
+            resposta.get_data()
+            duracao = time.perf_counter() - inicio
+            with trava:
+                latencias.append(duracao)
+                if resposta.status_code != cenario.status_esperado:
+                    erros += 1
+
+    por_trabalhador = max(1, cenario.iteracoes // concorrencia)
+    inicio_total = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        list(executor.map(trabalhador, [por_trabalhador] * concorrencia))
+    duracao_total = time.perf_counter() - inicio_total
+
+    return {
+        "cenario": cenario.nome,
+        "requisicoes": len(latencias),
+        "erros": erros,
+        "vazao_rps": round(len(latencias) / duracao_total, 2) if duracao_total else 0.0,
+        "media_ms": round(statistics.fmean(latencias) * 1000, 3) if latencias else 0.0,
+        "p50_ms": round(percentil(latencias, 50) * 1000, 3),
+        "p99_ms": round(percentil(latencias, 99) * 1000, 3),
+    }
+
+
+def obter_token(app) -> str:
+    resposta = app.test_client().post("/api/v1/auth/login", json={
+        "usuario": {"email": seed.EMAIL_ADMIN, "senha": seed.SENHA_ADMIN}
+    })
+    if resposta.status_code != 200:
+        raise RuntimeError(f"Login do benchmark falhou: {resposta.status_code} {resposta.get_data(as_text=True)}")
+    return resposta.get_json()["data"]["token"]
+
+
+def commit_atual() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do caminho completo da requisição")
+    parser.add_argument("--tamanhos", default="1000,100000,1000000", help="linhas de reserva, separadas por vírgula")
+    parser.add_argument("--iteracoes", type=int, default=200, help="requisições por cenário")
+    parser.add_argument("--iteracoes-listagem", type=int, default=20, help="requisições por cenário de listagem")
+    parser.add_argument("--concorrencia", type=int, default=1, help="threads disparando requisições")
+    parser.add_argument("--limite-segundos", type=float, default=60.0, help="tempo máximo por cenário")
+    parser.add_argument("--saida", default=None, help="arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument("--manter-prints", action="store_true", help="não silencia os prints da aplicação")
+    parser.add_argument("--backend", choices=("sqlite", "mysql"), default="sqlite")
+    parser.add_argument("--mysql-host", default="127.0.0.1")
+    parser.add_argument("--mysql-porta", type=int, default=3306)
+    parser.add_argument("--mysql-usuario", default="root")
+    parser.add_argument("--mysql-senha", default="")
+    parser.add_argument("--mysql-banco", default="casa_branca_bench")
+    args = parser.parse_args(argv)
+
+    from server import Server
+    from api.utils.rateLimiter import RateLimiter
+
+    tamanhos = [int(t) for t in args.tamanhos.split(",") if t.strip()]
+    resultados = []
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        for tamanho in tamanhos:
+            print(f"⏱️  Preparando {args.backend} com {tamanho} reservas...", file=sys.stderr)
+            if args.backend == "sqlite":
+                db, info = preparar_sqlite(diretorio, tamanho)
+            else:
+                db, info = preparar_mysql(args, tamanho)
+
+            saida_app = contextlib.nullcontext() if args.manter_prints else contextlib.redirect_stdout(io.StringIO())
+            with saida_app:
+                # limites folgados: o cenário de login mede bcrypt + banco, não o 429
+                rate_limiter = RateLimiter() \
+                    .regra("login_ip", capacidade=10**9, por_minuto=10**9) \
+                    .regra("login_email", capacidade=10**9, por_minuto=10**9)
+                server = Server(database=db, rate_limiter=rate_limiter)
+                server.init()
+                redirecionar_logs(diretorio)
+                app = server.app
+                token = obter_token(app)
+
+                for cenario in montar_cenarios(info, args.iteracoes, args.iteracoes_listagem):
+                    if not args.manter_prints:
+                        sys.stdout.seek(0)
+                        sys.stdout.truncate()
+                    resultado = executar_cenario(app, token, cenario, args.concorrencia, args.limite_segundos)
+                    resultado["tamanho"] = tamanho
+                    resultados.append(resultado)
+                    print(
+                        f"   {cenario.nome:<18} n={resultado['requisicoes']:<5} "
+                        f"{resultado['vazao_rps']:>9.1f} req/s  p50={resultado['p50_ms']:.2f}ms  "
+                        f"p99={resultado['p99_ms']:.2f}ms  erros={resultado['erros']}",
+                        file=sys.stderr
+                    )
+
+    relatorio = {
+        "commit": commit_atual(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "backend": args.backend,
+        "concorrencia": args.concorrencia,
+        "resultados": resultados
+    }
+
+    texto = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
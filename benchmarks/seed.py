@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import random
+from datetime import date, timedelta
+
+"""
+Geração de dados sintéticos (hotel, hospede, reserva, usuarios) para os benchmarks.
+
+Proporções por tamanho N (linhas de reserva):
+- hoteis:   max(10, N // 100)
+- hospedes: max(10, N // 10)
+- reservas: N, espalhadas entre 1 ano atrás e 1 ano à frente
+"""
+
+EMAIL_ADMIN = "admin@casabranca.com"
+SENHA_ADMIN = "admin123"
+LOTE = 50_000
+
+
+def popular(conexao, reservas: int, placeholder: str = "?", semente: int = 42) -> dict:
+    """
+    Popula o banco (conexão DB-API: sqlite3 ou mysql.connector) e devolve
+    informações para os cenários.
+
+    :param placeholder: "?" para SQLite, "%s" para MySQL/MariaDB
+    :return: dict com totais e uma amostra de reservas futuras (idHotel, inicio, fim)
+    """
+    rnd = random.Random(semente)
+    total_hoteis = max(10, reservas // 100)
+    total_hospedes = max(10, reservas // 10)
+    hoje = date.today()
+
+    p = placeholder
+    cursor = conexao.cursor()
+    try:
+        cursor.executemany(
+            f"INSERT INTO hotel (nome, capacidade) VALUES ({p}, {p})",
+            [(f"Hotel {i:07d}", rnd.randint(10, 300)) for i in range(1, total_hoteis + 1)]
+        )
+        cursor.executemany(
+            f"INSERT INTO hospede (nome, cpf, email, telefone, requisicao) VALUES ({p}, {p}, {p}, {p}, {p})",
+            [
+                (f"Hospede {i:08d}", f"{i:011d}", f"hospede{i}@exemplo.com", "(11) 91234-5678", None)
+                for i in range(1, total_hospedes + 1)
+            ]
+        )
+
+        sql_reserva = f"INSERT INTO reserva (idHospede, idHotel, inicio, fim) VALUES ({p}, {p}, {p}, {p})"
+        futuras = []
+        lote = []
+        for _ in range(reservas):
+            id_hotel = rnd.randint(1, total_hoteis)
+            inicio = hoje + timedelta(days=rnd.randint(-365, 365))
+            fim = inicio + timedelta(days=rnd.randint(1, 14))
+            lote.append((rnd.randint(1, total_hospedes), id_hotel, inicio.isoformat(), fim.isoformat()))
+            if inicio > hoje and len(futuras) < 1000:
+                futuras.append((id_hotel, inicio, fim))
+            if len(lote) >= LOTE:
+                cursor.executemany(sql_reserva, lote)
+                lote = []
+        if lote:
+            cursor.executemany(sql_reserva, lote)
+
+        cursor.execute(
+            f"INSERT INTO usuarios (nome, email, senha, role, ativo) VALUES ({p}, {p}, {p}, {p}, {p})",
+            ("Admin", EMAIL_ADMIN, _hash_admin(), "admin", 1)
+        )
+        conexao.commit()
+    finally:
+        cursor.close()
+
+    return {
+        "hoteis": total_hoteis,
+        "hospedes": total_hospedes,
+        "reservas": reservas,
+        "reservas_futuras": futuras
+    }
+
+
+def _hash_admin() -> str:
+    # mesmo custo (12) do hash do admin em api/database/database.sql
+    try:
+        import bcrypt
+    except ImportError:
+        return SENHA_ADMIN
+    return bcrypt.hashpw(SENHA_ADMIN.encode("utf-8"), bcrypt.gensalt(12)).decode("utf-8")
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+import re
+import sqlite3
+from datetime import date, datetime
+
+from api.database.database import DatabaseConfig
+
+"""
+Stand-in SQLite para o DatabaseConfig, usado apenas pelos benchmarks.
+
+Objetivo:
+- Permitir rodar o caminho completo da requisição (middlewares, controls,
+  services, DAOs) sem um MySQL local.
+- Os DAOs continuam recebendo conexões via get_connection() (já instrumentadas),
+  com cursores que aceitam o dialeto usado por eles: placeholders %s e
+  cursor(dictionary=True).
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hotel (
+  idHotel INTEGER PRIMARY KEY AUTOINCREMENT,
+  nome VARCHAR(100) NOT NULL,
+  capacidade INT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hospede (
+  idHospede INTEGER PRIMARY KEY AUTOINCREMENT,
+  nome VARCHAR(100) NOT NULL,
+  cpf VARCHAR(14) NOT NULL,
+  email VARCHAR(100) NOT NULL,
+  telefone VARCHAR(20) NULL DEFAULT NULL,
+  requisicao VARCHAR(1000) NULL DEFAULT NULL
+);
+CREATE TABLE IF NOT EXISTS reserva (
+  idReserva INTEGER PRIMARY KEY AUTOINCREMENT,
+  idHospede INT NOT NULL REFERENCES hospede (idHospede) ON DELETE CASCADE,
+  idHotel INT NOT NULL REFERENCES hotel (idHotel) ON DELETE CASCADE,
+  inicio DATETIME NULL DEFAULT NULL,
+  fim DATETIME NULL DEFAULT NULL
+);
+CREATE INDEX IF NOT EXISTS reserva_idHospede ON reserva (idHospede);
+CREATE INDEX IF NOT EXISTS reserva_idHotel ON reserva (idHotel);
+CREATE TABLE IF NOT EXISTS usuarios (
+  idUsuario INTEGER PRIMARY KEY AUTOINCREMENT,
+  nome VARCHAR(100) NOT NULL,
+  email VARCHAR(100) NOT NULL UNIQUE COLLATE NOCASE,
+  senha VARCHAR(255) NOT NULL,
+  role VARCHAR(20) DEFAULT 'funcionario',
+  ativo TINYINT(1) DEFAULT 1,
+  dataCriacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  dataAtualizacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS token_revogado (
+  jti CHAR(32) NOT NULL PRIMARY KEY,
+  expira_em DATETIME NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reserva_diaria (
+  idHotel INT NOT NULL REFERENCES hotel (idHotel) ON DELETE CASCADE,
+  dia DATE NOT NULL,
+  ocupadas INT NOT NULL DEFAULT 0,
+  entradas INT NOT NULL DEFAULT 0,
+  noites_entradas INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (idHotel, dia)
+);
+CREATE INDEX IF NOT EXISTS reserva_diaria_dia ON reserva_diaria (dia);
+"""
+
+_PLACEHOLDER = re.compile(r"%s")
+# upsert do MySQL -> SQLite: ON DUPLICATE KEY UPDATE c = c + VALUES(c)
+_DUPLICATE_KEY = re.compile(r"ON DUPLICATE KEY UPDATE", re.IGNORECASE)
+_INSERT_IGNORE = re.compile(r"^\s*INSERT IGNORE\b", re.IGNORECASE)
+_VALUES_COLUNA = re.compile(r"VALUES\((\w+)\)")
+
+
+def _converter_datetime(valor: bytes):
+    texto = valor.decode("utf-8")
+    if len(texto) == 10:
+        return datetime.strptime(texto, "%Y-%m-%d")
+    return datetime.fromisoformat(texto)
+
+
+def _traduzir(sql: str) -> str:
+    sql = _INSERT_IGNORE.sub("INSERT OR IGNORE", _PLACEHOLDER.sub("?", sql))
+    partes = _DUPLICATE_KEY.split(sql, maxsplit=1)
+    if len(partes) == 2:
+        insert, atualizacao = partes
+        sql = insert + "ON CONFLICT DO UPDATE SET" + _VALUES_COLUNA.sub(r"excluded.\1", atualizacao)
+    return sql
+
+
+# DATETIME volta como datetime e DATE como date, como no mysql-connector
+sqlite3.register_converter("DATETIME", _converter_datetime)
+sqlite3.register_converter("DATE", lambda valor: date.fromisoformat(valor.decode("utf-8")))
+sqlite3.register_adapter(date, lambda d: d.isoformat())
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(sep=" "))
+
+
+class _CursorSqlite:
+    """Cursor com a mesma interface usada pelos DAOs sobre o mysql-connector."""
+
+    def __init__(self, conexao: sqlite3.Connection, dictionary: bool = False):
+        self.__cursor = conexao.cursor()
+        self.__dictionary = dictionary
+
+    @property
+    def with_rows(self) -> bool:
+        return self.__cursor.description is not None
+
+    @property
+    def description(self):
+        return self.__cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self.__cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self.__cursor.lastrowid
+
+    def execute(self, sql: str, params=None):
+        self.__cursor.execute(_traduzir(sql), tuple(params or ()))
+
+    def executemany(self, sql: str, seq_params):
+        self.__cursor.executemany(_traduzir(sql), seq_params)
+
+    def fetchall(self):
+        return [self.__linha(linha) for linha in self.__cursor.fetchall()]
+
+    def fetchone(self):
+        linha = self.__cursor.fetchone()
+        return self.__linha(linha) if linha is not None else None
+
+    def fetchmany(self, size: int = 1):
+        return [self.__linha(linha) for linha in self.__cursor.fetchmany(size)]
+
+    def close(self):
+        self.__cursor.close()
+
+    def __linha(self, linha):
+        if not self.__dictionary:
+            return linha
+        colunas = [c[0] for c in self.__cursor.description]
+        return dict(zip(colunas, linha))
+
+
+class _ConexaoSqlite:
+    def __init__(self, caminho: str):
+        self.__conexao = sqlite3.connect(
+            caminho,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+            timeout=30
+        )
+        self.__conexao.execute("PRAGMA foreign_keys = ON")
+
+    def cursor(self, dictionary: bool = False, **kwargs):
+        return _CursorSqlite(self.__conexao, dictionary)
+
+    def commit(self):
+        self.__conexao.commit()
+
+    def rollback(self):
+        self.__conexao.rollback()
+
+    def close(self):
+        self.__conexao.close()
+
+
+class _PoolSqlite:
+    def __init__(self, caminho: str):
+        self.__caminho = caminho
+
+    def get_connection(self):
+        return _ConexaoSqlite(self.__caminho)
+
+
+class SqliteDatabaseConfig(DatabaseConfig):
+    """
+    DatabaseConfig apontando para um arquivo SQLite.
+
+    Exemplo:
+    >>> db = SqliteDatabaseConfig("/tmp/bench.db")
+    >>> db.criar_schema()
+    >>> server = Server(database=db)
+    """
+
+    def __init__(self, caminho: str):
+        super().__init__(pool_name="sqlite", database=caminho)
+        self.caminho = caminho
+        self.__pool = _PoolSqlite(caminho)
+
+    def connect(self):
+        return self.__pool
+
+    def criar_schema(self):
+        conexao = sqlite3.connect(self.caminho)
+        try:
+            conexao.executescript(SCHEMA)
+            conexao.execute("PRAGMA journal_mode = WAL")
+            conexao.commit()
+        finally:
+            conexao.close()
@@ -1,4 +1,4 @@
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, g, jsonify, request
 from flask_cors import CORS
 
 from werkzeug.exceptions import HTTPException, NotFound
@@ -6,6 +6,9 @@ from werkzeug.exceptions import HTTPException, NotFound
 from api.database.database import DatabaseConfig
 from api.utils.errorResponse import ErrorResponse
 from api.utils.logger import Logger
+from api.utils.metrics import Metrics
+from api.utils.slowQueryLog import SlowQueryLog
+from api.utils.tracing import Tracer, ExportadorArquivo
 
 # Middlewares
 from api.Middleware.jwt_middleware import JwtMiddleware
@@ -17,25 +20,45 @@ from api.Middleware.reservaMiddleware import ReservaMiddleware
 from api.controle.hospedeControl import HospedeControl
 from api.controle.hotelControl import HotelControl
 from api.controle.reservaControl import ReservaControl
+from api.controle.relatorioControl import RelatorioControl
 
 # Services
 from api.service.hospedeService import HospedeService
 from api.service.hotelService import HotelService
 from api.service.reservaService import ReservaService
+from api.service.relatorioService import RelatorioService
 
 # DAOs
 from api.dao.hospedeDAO import HospedeDAO
 from api.dao.hotelDAO import HotelDAO
+from api.dao.hotelCatalogo import HotelCatalogo
 from api.dao.reservaDAO import ReservaDAO
+from api.dao.reservaDiariaDAO import ReservaDiariaDAO
 from api.dao.usuariosDAO import UsuarioDAO
 
+# Auth
+from api.http.verificadorSenha import VerificadorSenha
+from api.http.listaRevogacao import ListaRevogacao
+from api.dao.tokenRevogadoDAO import TokenRevogadoDAO
+from api.http.meu_token_jwt import MeuTokenJWT
+from api.http.chaveiroJwt import ChaveiroJwt
+from api.utils.rateLimiter import RateLimiter, BackendMemoria
+from api.utils.serviceCache import ServiceCache, BackendLocal
+from api.utils.jsonProvider import JsonProviderRapido
+from api.Middleware.compressaoMiddleware import CompressaoMiddleware
+from api.utils.assetPipeline import AssetPipeline
+from api.http.politicaSenha import PoliticaSenha
+
 
 # Routers
 from api.router.hospedeRoteador import HospedeRoteador
 from api.router.hotelRoteador import HotelRoteador
 from api.router.reservaRoteador import ReservaRoteador
+from api.router.relatorioRoteador import RelatorioRoteador
 from api.router.authRoteador import AuthRoteador
+from api.router.adminRoteador import AdminRoteador
 
+import time
 import traceback
 
 
@@ -46,13 +69,19 @@ class Server:
     Responsável por inicializar middlewares, roteadores e gerenciar a aplicação.
     """
 
-    def __init__(self, porta: int = 8000):
+    def __init__(self, porta: int = 8000, database: DatabaseConfig = None, rate_limiter: RateLimiter = None):
         # 🔹 Porta em que o servidor irá rodar
         self.__porta = porta
 
+        # 🔹 Rate limiter do login (injetável; padrão: buckets em memória)
+        self.__rate_limiter = rate_limiter
+
         # 🔹 Instância Flask, configurando pasta de arquivos estáticos
         self.__app = Flask(__name__, static_folder="static", static_url_path="")
 
+        # 🔹 jsonify()/get_json() via orjson quando instalado (datas em ISO 8601)
+        self.__app.json = JsonProviderRapido(self.__app)
+
         # 🔹 Configuração de CORS (Cross-Origin Resource Sharing)
         #    Permite que clientes de outros domínios/portas acessem sua API
         #    Exemplo: permitir todos os domínios (somente para desenvolvimento)
@@ -80,11 +109,20 @@ class Server:
             expose_headers=["Content-Range", "X-Content-Range"],
             max_age=3600)
 
+        # 🔹 Lista de tokens revogados (logout / rotação de refresh token)
+        self.__lista_revogacao = ListaRevogacao()
+
+        # 🔹 Cache de leituras dos serviços (único, para a invalidação cruzada
+        #    hotel/hospede -> reserva funcionar); com vários processos use BackendRedis
+        self.__service_cache = ServiceCache(BackendLocal(maxsize=2048), ttl=30)
+
         # 🔹 Middlewares
-        self.__jwt_middleware = JwtMiddleware()
+        self.__jwt_middleware = JwtMiddleware(lista_revogacao=self.__lista_revogacao)
         self.__hospede_middleware = HospedeMiddleware()
         self.__hotel_middleware = HotelMiddleware()
         self.__reserva_middleware = ReservaMiddleware()
+        self.__compressao = CompressaoMiddleware(tamanho_minimo=1024)
+        self.__assets = AssetPipeline(self.__app.static_folder, self.__compressao)
 
         # 🔹 DAOs, Services e Controls serão inicializados após conexão com DB
         self.__hospede_dao = None
@@ -96,11 +134,17 @@ class Server:
         self.__hospede_control = None
         self.__hotel_control = None
         self.__reserva_control = None
+        self.__relatorio_service = None
         self.__usuario_dao = None
         
 
-        # 🔹 Conexão global com o banco
-        self.__db_connection = None
+        # 🔹 Conexão global com o banco (pode ser injetada, ex.: stand-in SQLite dos benchmarks)
+        self.__db_connection = database
+
+    @property
+    def app(self) -> Flask:
+        """Instância Flask (usada pelo test client nos benchmarks)"""
+        return self.__app
 
     def init(self):
         """
@@ -112,22 +156,42 @@ class Server:
         # Middleware para parsing JSON já é nativo do Flask
         # Middleware para arquivos estáticos já configurado na criação do Flask
 
+        # 🔹 Compressão gzip/brotli (registrada primeiro: seu after_request roda por último)
+        self.__compressao.registrar(self.__app)
+
+        # 🔹 static/ minificado, com hash no nome dos assets e servido da memória
+        self.__assets.registrar(self.__app)
+
         # 🔹 Middleware de log antes das rotas
         self.__before_routing()
 
+        # 🔹 Métricas por rota (latência, status) e endpoint /metrics
+        self.__setup_metrics()
+
+        # 🔹 Tracing por requisição (spans exportados em OTLP/JSON)
+        self.__setup_tracing()
+
         # 🔹 Conexão global com MySQL (injeção de dependência)
-        self.__db_connection = DatabaseConfig(
-            pool_name="mypool",
-            pool_size=10,
-            host="127.0.0.1",
-            user="root",
-            password="Henry45*1",
-            database="casa_branca",
-            port=3306
-        )
+        if self.__db_connection is None:
+            self.__db_connection = DatabaseConfig(
+                pool_name="mypool",
+                pool_size=10,
+                host="127.0.0.1",
+                user="root",
+                password="Henry45*1",
+                database="casa_branca",
+                port=3306
+            )
 
         self.__db_connection.connect()
 
+        # 🔹 Revogações persistidas na tabela token_revogado
+        self.__lista_revogacao.usar_persistencia(TokenRevogadoDAO(self.__db_connection))
+        self.__lista_revogacao.iniciar_limpeza_periodica(intervalo=3600)
+
+        # 🔹 Comandos SQL acima de 200 ms vão para api/system/slow_query.log (com EXPLAIN)
+        SlowQueryLog.configurar(limiar_segundos=0.2)
+
         # 🔹 Configuração do módulo Hospede
         self.__setup_hospede()
 
@@ -137,9 +201,15 @@ class Server:
         # 🔹 Configuração do módulo Reserva
         self.__setup_reserva()
 
+        # 🔹 Relatórios gerenciais (agregado reserva_diaria)
+        self.__setup_relatorios()
+
         # 🔹 Configuração do módulo Aut
         self.__setup_auth()
 
+        # 🔹 Rotas administrativas (profiler)
+        self.__setup_admin()
+
         # 🔹 Middleware global de tratamento de erros
         self.__error_middleware()
 
@@ -151,7 +221,7 @@ class Server:
         self.__hospede_dao = HospedeDAO(self.__db_connection)
 
         # Service recebe DAO (injeção de dependência)
-        self.__hospede_service = HospedeService(self.__hospede_dao)
+        self.__hospede_service = HospedeService(self.__hospede_dao, self.__service_cache)
 
         # Controller recebe Service (injeção de dependência)
         self.__hospede_control = HospedeControl(self.__hospede_service)
@@ -170,11 +240,13 @@ class Server:
         """Configura o módulo Hotel (DAO, Service, Control, Router)"""
         print("⬆️  Setup Hotel")
 
-        # DAO recebe conexão global com o banco (injeção de dependência)
-        self.__hotel_dao = HotelDAO(self.__db_connection)
+        # DAO recebe conexão global com o banco (injeção de dependência);
+        # o catálogo em memória fica na frente dele e é carregado já no boot
+        self.__hotel_dao = HotelCatalogo(HotelDAO(self.__db_connection), self.__service_cache)
+        self.__hotel_dao.carregar()
 
         # Service recebe DAO via injeção de dependência
-        self.__hotel_service = HotelService(self.__hotel_dao)
+        self.__hotel_service = HotelService(self.__hotel_dao, self.__service_cache)
 
         # Controller recebe Service
         self.__hotel_control = HotelControl(self.__hotel_service)
@@ -200,10 +272,15 @@ class Server:
         if self.__hospede_dao is None:
             self.__hospede_dao = HospedeDAO(self.__db_connection)
         if self.__hotel_dao is None:
-            self.__hotel_dao = HotelDAO(self.__db_connection)
+            self.__hotel_dao = HotelCatalogo(HotelDAO(self.__db_connection), self.__service_cache)
+
+        # Agregado diário dos relatórios, atualizado a cada escrita em reserva
+        self.__relatorio_service = RelatorioService(ReservaDiariaDAO(self.__db_connection), self.__reserva_dao,
+                                                    self.__hotel_dao)
 
         # Service
-        self.__reserva_service = ReservaService(self.__reserva_dao, self.__hospede_dao, self.__hotel_dao)
+        self.__reserva_service = ReservaService(self.__reserva_dao, self.__hospede_dao, self.__hotel_dao,
+                                               self.__service_cache, self.__relatorio_service)
 
         # Controller
         self.__reserva_control = ReservaControl(self.__reserva_service)
@@ -216,35 +293,57 @@ class Server:
         )
         self.__app.register_blueprint(reserva_router.create_routes(), url_prefix="/api/v1/reservas")
 
+    def __setup_relatorios(self):
+        """Configura os relatórios (Control, Router) e a reconstrução periódica do agregado"""
+        print("⬆️  Setup Relatorios")
+
+        # reconstrói já no boot e a cada 6h (corrige exclusões em cascata e escritas de outros processos)
+        self.__relatorio_service.iniciar_reconstrucao_periodica(intervalo=6 * 3600)
+
+        relatorio_control = RelatorioControl(self.__relatorio_service)
+        relatorio_router = RelatorioRoteador(self.__jwt_middleware, relatorio_control)
+        self.__app.register_blueprint(relatorio_router.create_routes(), url_prefix="/api/v1/relatorios")
+
     def __setup_auth(self):
         """Configura autenticação"""
         print("⬆️  Setup Auth")
-        auth_router = AuthRoteador(self.__db_connection)  # Passa conexão
+        # bcrypt isolado em pool limitado: rajadas de login não ocupam as threads da API
+        verificador_senha = VerificadorSenha(max_workers=2, max_fila=16, timeout=5.0)
+
+        # custo do bcrypt calibrado para ~250 ms por verificação nesta máquina
+        politica_senha = PoliticaSenha.calibrar(alvo_ms=250, custo_minimo=10, custo_maximo=14)
+
+        # tokens assinados com RS256 + 'kid'; chaves rotacionadas a cada 24h e
+        # compartilhadas entre processos via api/system/chaves (fora do git).
+        # Requer pyjwt[crypto]; tokens HS256 antigos (sem 'kid') são recusados —
+        # numa migração, passe aceitar_legado_ate=<epoch da troca + 7 dias>
+        chaveiro = ChaveiroJwt(algoritmo="RS256", intervalo_rotacao=24 * 3600, diretorio="api/system/chaves")
+        MeuTokenJWT.configurar_chaveiro(chaveiro)
+
+        # buckets em memória; com vários processos/servidores use BackendRedis
+        rate_limiter = self.__rate_limiter or AuthRoteador.rate_limiter_padrao(BackendMemoria())
+
+        auth_router = AuthRoteador(self.__db_connection, verificador_senha, politica_senha, self.__jwt_middleware,
+                                   rate_limiter)  # Passa conexão
         self.__app.register_blueprint(auth_router.create_routes(), url_prefix="/api/v1/auth")
 
+        # chaves públicas para verificadores externos (sem chamar a API)
+        @self.__app.route('/.well-known/jwks.json', methods=['GET'])
+        def jwks():
+            response = jsonify(chaveiro.jwks())
+            response.headers["Cache-Control"] = "public, max-age=300"
+            return response
+
+    def __setup_admin(self):
+        """Configura rotas administrativas de diagnóstico"""
+        print("⬆️  Setup Admin")
+        admin_router = AdminRoteador(self.__jwt_middleware)
+        self.__app.register_blueprint(admin_router.create_routes(), url_prefix="/api/v1/admin")
+
     def __before_routing(self):
         """Middleware que loga separador antes de cada requisição"""
     
-        # 🔥 NOVAS ROTAS PARA SERVIR OS ARQUIVOS HTML
-        @self.__app.route('/Hospedes.html')
-        def serve_hospedes():
-            print("📄 Servindo Hospedes.html")
-            return send_from_directory(self.__app.static_folder, 'Hospedes.html')
-        
-        @self.__app.route('/Hoteis.html')
-        def serve_hoteis():
-            print("📄 Servindo Hoteis.html")
-            return send_from_directory(self.__app.static_folder, 'Hoteis.html')
-        
-        @self.__app.route('/Reservas.html')
-        def serve_reservas():
-            print("📄 Servindo Reservas.html")
-            return send_from_directory(self.__app.static_folder, 'Reservas.html')
-        
-        @self.__app.route('/dashboard.html')
-        def serve_dashboard():
-            print("📄 Servindo dashboard.html")
-            return send_from_directory(self.__app.static_folder, 'dashboard.html')
+        # páginas .html e ApiService.js saem pela rota estática (AssetPipeline)
 
         @self.__app.before_request
         def log_separator():
@@ -254,7 +353,78 @@ class Server:
         @self.__app.route('/', methods=['GET'])
         def serve_root():
             # envia o arquivo static/login.html
-            return send_from_directory(self.__app.static_folder, 'login.html')
+            return self.__assets.servir('login.html')
+
+    def __setup_metrics(self):
+        """Registra contagem, status e latência de cada rota e expõe GET /metrics"""
+        print("⬆️  Setup Metrics")
+
+        requisicoes_total = Metrics.counter(
+            "http_requests_total",
+            "Total de requisições HTTP por rota, método e status",
+            ("blueprint", "rota", "metodo", "status")
+        )
+        requisicoes_duracao = Metrics.histogram(
+            "http_request_duration_seconds",
+            "Latência das requisições HTTP por rota e método",
+            ("blueprint", "rota", "metodo")
+        )
+
+        @self.__app.before_request
+        def iniciar_cronometro():
+            g.inicio_requisicao = time.perf_counter()
+
+        @self.__app.after_request
+        def registrar_metricas(response):
+            inicio = g.pop("inicio_requisicao", None)
+            if inicio is None:
+                return response
+
+            # usa o padrão da rota (ex.: /api/v1/hoteis/<int:idHotel>) para não explodir a cardinalidade
+            rota = request.url_rule.rule if request.url_rule else "<nao_encontrada>"
+            blueprint = request.blueprint or ""
+            requisicoes_duracao.observe(time.perf_counter() - inicio, blueprint=blueprint, rota=rota, metodo=request.method)
+            requisicoes_total.inc(blueprint=blueprint, rota=rota, metodo=request.method, status=response.status_code)
+            return response
+
+        @self.__app.route('/metrics', methods=['GET'])
+        def metrics():
+            return Response(Metrics.exportar(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+    def __setup_tracing(self):
+        """Abre um trace por requisição e exporta os lentos/com erro (e 1% dos demais) em api/system/traces.jsonl"""
+        print("⬆️  Setup Tracing")
+
+        # Para enviar a um coletor: Tracer.configurar(ExportadorHttp("http://127.0.0.1:4318/v1/traces"))
+        # arquivo rotacionado em 50 MB (3 antigos); requisições abaixo de 500 ms entram por amostragem
+        Tracer.configurar(ExportadorArquivo("api/system/traces.jsonl", tamanho_maximo=50 * 1024 * 1024, backups=3),
+                          limiar_exportacao=0.5, taxa_amostragem=0.01)
+
+        @self.__app.before_request
+        def iniciar_trace():
+            if request.path == "/metrics":
+                return   # scrapes do Prometheus não viram trace
+            rota = request.url_rule.rule if request.url_rule else request.path
+            g.trace_span, g.trace_token = Tracer.iniciar_trace(
+                f"{request.method} {rota}",
+                traceparent=request.headers.get("traceparent"),
+                **{"http.method": request.method, "http.route": rota, "http.target": request.full_path}
+            )
+
+        @self.__app.after_request
+        def identificar_trace(response):
+            span = g.get("trace_span")
+            if span is not None:
+                span.set_atributo("http.status_code", response.status_code)
+                response.headers["X-Trace-Id"] = span.trace.trace_id
+            return response
+
+        @self.__app.teardown_request
+        def finalizar_trace(error=None):
+            span = g.pop("trace_span", None)
+            token = g.pop("trace_token", None)
+            if span is not None:
+                Tracer.finalizar_trace(span, token, erro=str(error) if error else None)
 
     def __error_middleware(self):
         """Middleware global de tratamento de erros"""
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from api.dao.usuariosDAO import UsuarioDAO
+from api.modelo.usuarios import Usuario
+from benchmarks import seed
+from benchmarks.sqliteDatabase import SqliteDatabaseConfig
+
+
+class TestUsuarioDAOCache(unittest.TestCase):
+    """Cache de findByEmail sobre o stand-in SQLite dos benchmarks."""
+
+    def setUp(self):
+        self.__diretorio = tempfile.TemporaryDirectory()
+        caminho = os.path.join(self.__diretorio.name, "usuarios.db")
+        database = SqliteDatabaseConfig(caminho)
+        database.criar_schema()
+        conexao = sqlite3.connect(caminho)
+        try:
+            seed.popular(conexao, 10, placeholder="?")
+        finally:
+            conexao.close()
+        self.dao = UsuarioDAO(database)
+
+    def tearDown(self):
+        self.__diretorio.cleanup()
+
+    def test_email_com_espacos_nao_envenena_o_cache(self):
+        # login com espaços/maiúsculas e, em seguida, o login válido
+        variante = self.dao.findByEmail("  " + seed.EMAIL_ADMIN.upper() + " ")
+        valido = self.dao.findByEmail(seed.EMAIL_ADMIN)
+
+        self.assertIsNotNone(variante)
+        self.assertIsNotNone(valido)
+        self.assertEqual(valido.idUsuario, variante.idUsuario)
+
+    def test_email_inexistente_fica_em_cache_negativo(self):
+        self.assertIsNone(self.dao.findByEmail("ninguem@casabranca.com"))
+        self.assertIsNone(self.dao.findByEmail(" NINGUEM@casabranca.com"))
+        self.assertIsNotNone(self.dao.findByEmail(seed.EMAIL_ADMIN))
+
+
+    def test_find_by_id_ignora_usuario_inativo(self):
+        admin = self.dao.findByEmail(seed.EMAIL_ADMIN)
+        idInativo = self.dao.create(Usuario(nome="Inativo", email="inativo@casabranca.com", senha="x", ativo=False))
+
+        self.assertEqual(self.dao.findById(admin.idUsuario).role, "admin")
+        self.assertIsNone(self.dao.findById(idInativo))
+        self.assertIsNone(self.dao.findById(999_999))
+
+
+if __name__ == "__main__":
+    unittest.main()